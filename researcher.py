@@ -1,46 +1,105 @@
 import os
 import re
+import sys
 import json
-import requests
+import time
+import shutil
+import sqlite3
+import hashlib
+import asyncio
+import weakref
+import inspect
+import importlib
+import contextvars
+import math
+import heapq
+import random
+import uuid
+import zlib
+import multiprocessing
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 try:
     from typing import Annotated
     from typing_extensions import TypedDict
 except ImportError:
     from typing_extensions import Annotated, TypedDict
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse
 
 from dotenv import load_dotenv
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import END, StateGraph
 
-try:
+if TYPE_CHECKING:  # pragma: no cover - 타입 힌트 전용
     from tavily import TavilyClient
-    import openai
-    from textblob import TextBlob
-    import nltk
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    import numpy as np
-except ImportError as exc:
-    raise ImportError(
-        "Required packages missing. Please install: tavily-python, openai, textblob, nltk, scikit-learn, numpy"
-    ) from exc
 
 load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env", override=False)
 
-# NLTK 데이터 다운로드 (초기 설정)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# 무거운 NLP/ML 의존성은 실제로 필요한 노드가 처음 실행될 때 로드한다 (콜드 스타트 비용 절감)
+_MISSING_DEPENDENCY_MESSAGE = (
+    "Required packages missing. Please install: tavily-python, openai, textblob, nltk, scikit-learn, numpy"
+)
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# 번들된 NLTK 코퍼스 경로 (오프라인 노드는 이 경로에 punkt/stopwords 를 포함해 배포)
+NLTK_DATA_DIR = Path(os.getenv("RESEARCHER_NLTK_DATA", Path(__file__).resolve().parent / "nltk_data"))
+_NLTK_RESOURCES = {
+    "tokenizers/punkt": "punkt",
+    "corpora/stopwords": "stopwords",
+}
+
+@lru_cache
+def _load_dependency(module_name: str):
+    """선택 의존성 지연 import"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        raise ImportError(_MISSING_DEPENDENCY_MESSAGE) from exc
+
+@lru_cache
+def _ensure_nltk_data(data_dir: Optional[str] = None) -> None:
+    """NLTK 코퍼스 확인 - 번들 경로 우선, 없으면 (허용된 경우에만) 다운로드"""
+    nltk = _load_dependency("nltk")
+    bundled_dir = str(data_dir or NLTK_DATA_DIR)
+    if bundled_dir not in nltk.data.path:
+        nltk.data.path.insert(0, bundled_dir)
+
+    allow_download = os.getenv("RESEARCHER_NLTK_DOWNLOAD", "1") != "0"
+    for resource, package in _NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            if allow_download:
+                nltk.download(package, quiet=True)
+
+@lru_cache
+def _lazy_textblob():
+    """TextBlob 클래스 반환 (최초 호출 시 NLTK 코퍼스 준비)"""
+    textblob = _load_dependency("textblob")
+    _ensure_nltk_data()
+    return textblob.TextBlob
+
+@lru_cache
+def _lazy_sklearn():
+    """scikit-learn CountVectorizer 클래스 반환"""
+    _load_dependency("sklearn")
+    return _load_dependency("sklearn.feature_extraction.text").CountVectorizer
+
+def prewarm(nltk_data_dir: Optional[str] = None) -> None:
+    """워커 시작 시 호출하는 사전 로딩 진입점 (번들 코퍼스 + 무거운 의존성)"""
+    if nltk_data_dir:
+        _ensure_nltk_data(str(nltk_data_dir))
+    _lazy_textblob()
+    _lazy_sklearn()
+    for module_name in ("numpy", "tavily", "openai"):
+        _load_dependency(module_name)
+    get_idf_model()
 
 # 타입 정의
 class MainKeyword(TypedDict):
@@ -62,6 +121,15 @@ class SubKeywordEvaluation(TypedDict):
     final_score: float
     selection_reason: str
 
+class ScoringTierMetrics(TypedDict):
+    """계층형 콘텐츠 점수 계산의 단계별 처리 건수"""
+    candidates: int  # 중복 제거 후 입력된 결과 수
+    rejected_by_filter: int  # 1단계: URL/스팸/길이 규칙에서 탈락
+    pruned_by_bound: int  # 2단계: 점수 상한이 상위 k 에 못 미쳐 점수 계산 생략
+    full_scored: int  # 3단계: TextBlob 가독성까지 계산
+    degraded_scored: int  # CPU 예산 소진으로 저비용 특성만 계산
+    cpu_seconds: float
+
 class ContentMetadata(TypedDict):
     content_id: str
     platform: str
@@ -79,28 +147,147 @@ class ContentMetadata(TypedDict):
     timestamp: datetime
     geographic_data: Optional[Dict[str, Any]]
 
+# 검색 결과 레코드
+_SEARCH_RESULT_FIELDS = frozenset(("url", "title", "content", "score", "platform", "quality_score"))
+
+@dataclass
+class SearchResult:
+    """그래프를 따라 이동하는 검색 결과 한 건 (Tavily dict 대신 슬롯 기반 레코드)
+
+    플랫폼 라벨은 intern 해 결과 간에 공유하고, 참조/내보내기용 dict 는 필요할 때만 만든다.
+    기존 코드와의 호환을 위해 `get` / `[]` / `in` 등 dict 형태 접근을 지원한다.
+    """
+    __slots__ = ("url", "title", "content", "score", "platform", "quality_score", "extra")
+    url: str
+    title: str
+    content: str
+    score: Optional[float]
+    platform: Optional[str]
+    quality_score: Optional[float]
+    extra: Optional[Dict[str, Any]]  # Tavily 가 추가로 준 필드 (published_date 등), 없으면 None
+    
+    @classmethod
+    def from_tavily(cls, raw: Dict[str, Any], platform: Optional[str] = None) -> "SearchResult":
+        extra = {key: value for key, value in raw.items() if key not in _SEARCH_RESULT_FIELDS and value is not None}
+        label = platform or raw.get("platform")
+        return cls(
+            url=raw.get("url") or "",
+            title=raw.get("title") or "",
+            content=raw.get("content") or "",
+            score=raw.get("score"),
+            platform=sys.intern(label) if label else None,
+            quality_score=raw.get("quality_score"),
+            extra=extra or None,
+        )
+    
+    @property
+    def text(self) -> str:
+        """분석 대상 본문 (content 가 비어 있으면 snippet)"""
+        return self.content or (self.extra or {}).get("snippet", "")
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _SEARCH_RESULT_FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return (self.extra or {}).get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _UNSET)
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SEARCH_RESULT_FIELDS:
+            setattr(self, key, sys.intern(value) if key == "platform" and value else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _UNSET) is not _UNSET
+    
+    def with_platform(self, platform: str) -> "SearchResult":
+        """플랫폼 라벨이 없을 때만 복사본을 만들어 라벨 지정"""
+        if self.platform:
+            return self
+        return SearchResult(
+            self.url, self.title, self.content, self.score, sys.intern(platform), self.quality_score, self.extra
+        )
+    
+    def reference(self, platform_label: str) -> Dict[str, str]:
+        """요약 노드의 references 항목"""
+        return {
+            "platform": platform_label,
+            "title": self.title or self.url,
+            "url": self.url,
+            "snippet": self.text.strip(),
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 내보내기용 dict (기존 Tavily 결과 dict 와 같은 모양)"""
+        exported: Dict[str, Any] = {"url": self.url, "title": self.title, "content": self.content, "score": self.score}
+        if self.extra:
+            exported.update(self.extra)
+        if self.platform is not None:
+            exported["platform"] = self.platform
+        if self.quality_score is not None:
+            exported["quality_score"] = self.quality_score
+        return exported
+
+def to_search_results(raw_results: Iterable[Dict[str, Any]], platform: Optional[str] = None) -> List[SearchResult]:
+    return [
+        raw if isinstance(raw, SearchResult) else SearchResult.from_tavily(raw, platform)
+        for raw in raw_results
+    ]
+
+def export_value(value: Any) -> Any:
+    """그래프 경계(이벤트/배치 결과)에서 SearchResult 레코드를 JSON 직렬화 가능한 dict 로 변환"""
+    if isinstance(value, SearchResult):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: export_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [export_value(item) for item in value]
+    return value
+
 # 유틸리티 함수들 (먼저 정의)
+_T = TypeVar("_T")
+
 def _merge_search_results(
-    existing: Optional[Dict[str, List[Dict[str, Any]]]],
-    new: Optional[Dict[str, List[Dict[str, Any]]]],
-) -> Dict[str, List[Dict[str, Any]]]:
-    merged: Dict[str, List[Dict[str, Any]]] = {
-        platform: list(items) for platform, items in (existing or {}).items()
-    }
+    existing: Optional[Dict[str, List[Any]]],
+    new: Optional[Dict[str, List[Any]]],
+) -> Dict[str, List[Any]]:
+    # 변경되지 않은 플랫폼 목록은 그대로 공유하고, 새 결과가 붙는 플랫폼만 새 목록을 만든다
+    # (이전 상태의 목록을 제자리에서 변경하지 않음). 플랫폼당 업데이트가 실행마다 한두 번뿐이라
+    # 복사 비용은 작고 (researcher_bench state_reducers), 노드/체크포인트가 일반 list 를 그대로 받는다
+    merged: Dict[str, List[Any]] = dict(existing or {})
     if not new:
         return merged
 
     for platform, items in new.items():
-        merged.setdefault(platform, [])
-        if items:
-            merged[platform].extend(items)
+        current = merged.get(platform)
+        if not items:
+            merged.setdefault(platform, [])
+        elif current:
+            merged[platform] = [*current, *items]
+        else:
+            merged[platform] = items if isinstance(items, list) else list(items)
     return merged
 
-def _append_items(existing: Optional[List[Any]], new: Optional[List[Any]]) -> List[Any]:
-    combined: List[Any] = list(existing or [])
+def _merge_dicts(existing: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = dict(existing or {})
     if new:
-        combined.extend(new)
-    return combined
+        merged.update(new)
+    return merged
+
+def _append_items(existing: Optional[List[Any]], new: Optional[List[Any]]) -> List[Any]:
+    if not new:
+        return existing if existing is not None else []
+    if not existing:
+        return list(new)
+    return [*existing, *new]
 
 # 기존 ResearchState (호환성 유지)
 class ResearchState(TypedDict, total=False):
@@ -108,10 +295,11 @@ class ResearchState(TypedDict, total=False):
     topic: str
     keywords: List[str]
     search_queries: Dict[str, str]
-    search_results: Annotated[Dict[str, List[Dict[str, Any]]], _merge_search_results]
+    search_results: Annotated[Dict[str, List[SearchResult]], _merge_search_results]
     summary: str
     references: List[Dict[str, str]]
     errors: Annotated[List[str], _append_items]
+    node_timings: Annotated[Dict[str, Dict[str, Any]], _merge_dicts]  # 노드별 실행 시간/외부 호출 통계
 
 # 고도화된 ResearchState
 class EnhancedResearchState(TypedDict, total=False):
@@ -119,20 +307,28 @@ class EnhancedResearchState(TypedDict, total=False):
     topic: str
     keywords: List[str]
     search_queries: Dict[str, str]
-    search_results: Annotated[Dict[str, List[Dict[str, Any]]], _merge_search_results]
+    search_results: Annotated[Dict[str, List[SearchResult]], _merge_search_results]
     summary: str
     references: List[Dict[str, str]]
     errors: Annotated[List[str], _append_items]
+    node_timings: Annotated[Dict[str, Dict[str, Any]], _merge_dicts]  # 노드별 실행 시간/외부 호출 통계
     
     # 새로운 키워드 인텔리전스 필드
     main_keyword: MainKeyword
     keyword_breakdown: List[Dict[str, Any]]
     selected_sub_keywords: List[SubKeywordEvaluation]
     keyword_strategy: Dict[str, Any]
+    search_query_plan: Dict[str, List[str]]  # 플랫폼별 팬아웃 검색 쿼리 (primary + secondary)
+    
+    # 지연 예산 필드
+    deadline_seconds: float  # 요청 전체 지연 예산 (초)
+    deadline_at: float  # 첫 노드에서 계산한 절대 마감 시각 (epoch 초)
+    skipped_stages: Annotated[List[str], _append_items]  # 예산 부족으로 생략/대체된 단계
     
     # 고도화된 검색 결과 필드
-    filtered_results: Dict[str, List[Dict[str, Any]]]
+    filtered_results: Dict[str, List[SearchResult]]
     content_quality_scores: Dict[str, float]
+    scoring_metrics: Annotated[Dict[str, ScoringTierMetrics], _merge_dicts]  # 플랫폼별 계층형 점수 계산 통계
     engagement_metrics: Dict[str, Any]
     trend_analysis: Dict[str, Any]
     
@@ -162,44 +358,1217 @@ def _run_tavily_query(
     *,
     max_results: int = 5,
     include_domains: Optional[List[str]] = None,
+    search_depth: str = "advanced",
+    client: Optional["TavilyClient"] = None,
+    cache: Optional["TTLCache"] = None,
+    deadline_at: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
-    """Tavily 검색 실행"""
-    client = _get_tavily_client()
-    response = client.search(
-        query=query,
-        max_results=max_results,
-        search_depth="advanced",
-        include_answer=False,
-        include_raw_content=False,
-        include_domains=include_domains,
-    )
-    return response.get("results", [])
+    """Tavily 검색 실행 (cache 가 주어지면 결과 캐시를 거침, deadline_at 이후에는 호출하지 않음)"""
+    def search() -> List[Dict[str, Any]]:
+        tavily_client = client or _get_tavily_client()
+        response = call_with_resilience("tavily", lambda timeout: tavily_client.search(
+            query=query,
+            max_results=max_results,
+            search_depth=search_depth,
+            include_answer=False,
+            include_raw_content=False,
+            include_domains=include_domains,
+            timeout=timeout,
+        ), deadline_at=deadline_at)
+        results = response.get("results", [])
+        _record("tavily_calls")
+        _record("tavily_results", len(results))
+        return results
+
+    if cache is None:
+        return search()
+    key = _search_cache_key(query, include_domains, max_results, search_depth)
+    return cache.get_or_compute(key, search)
+
+async def _arun_tavily_query(
+    query: str,
+    *,
+    max_results: int = 5,
+    include_domains: Optional[List[str]] = None,
+    search_depth: str = "advanced",
+    client=None,
+    cache: Optional["TTLCache"] = None,
+    deadline_at: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Tavily 검색 실행 (비동기, 동기 버전과 같은 캐시 키 사용)"""
+    async def search() -> List[Dict[str, Any]]:
+        tavily_client = client or _get_async_tavily_client()
+        response = await acall_with_resilience("tavily", lambda timeout: tavily_client.search(
+            query=query,
+            max_results=max_results,
+            search_depth=search_depth,
+            include_answer=False,
+            include_raw_content=False,
+            include_domains=include_domains,
+            timeout=timeout,
+        ), deadline_at=deadline_at)
+        results = response.get("results", [])
+        _record("tavily_calls")
+        _record("tavily_results", len(results))
+        return results
+
+    if cache is None:
+        return await search()
+    key = _search_cache_key(query, include_domains, max_results, search_depth)
+    return await cache.aget_or_compute(key, search)
 
 @lru_cache
-def _get_tavily_client() -> TavilyClient:
+def _get_tavily_client() -> "TavilyClient":
     api_key = os.getenv("TAVILY_API_KEY")
     if not api_key:
         raise RuntimeError("TAVILY_API_KEY environment variable is not set.")
-    return TavilyClient(api_key=api_key)
+    return _load_dependency("tavily").TavilyClient(api_key=api_key)
 
 @lru_cache
 def _get_openai_client():
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
-    return openai.OpenAI(api_key=api_key)
+    # 재시도/타임아웃은 복원력 계층에서 처리 (SDK 재시도와 중복되지 않도록)
+    return _load_dependency("openai").OpenAI(api_key=api_key, max_retries=0)
+
+# 비동기 클라이언트는 내부 HTTP 커넥션 풀이 이벤트 루프에 묶이므로 루프별로 하나씩 공유
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+def _loop_local_client(name: str, factory: Callable[[], Any]) -> Any:
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        if name not in clients:
+            clients[name] = factory()
+        return clients[name]
+
+def _get_async_tavily_client():
+    api_key = os.getenv("TAVILY_API_KEY")
+    if not api_key:
+        raise RuntimeError("TAVILY_API_KEY environment variable is not set.")
+    return _loop_local_client("tavily", lambda: _load_dependency("tavily").AsyncTavilyClient(api_key=api_key))
+
+def _get_async_openai_client():
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
+    return _loop_local_client("openai", lambda: _load_dependency("openai").AsyncOpenAI(api_key=api_key, max_retries=0))
+
+# 동기 클라이언트만 주입된 경우 비동기 경로에서도 같은 클라이언트를 쓰도록 호출을 스레드에서 실행
+class _ThreadedOpenAIClient:
+    """동기 OpenAI 클라이언트의 chat.completions.create 를 코루틴으로 노출하는 어댑터"""
+    def __init__(self, client):
+        self._client = client
+
+    @property
+    def chat(self) -> "_ThreadedOpenAIClient":
+        return self
+
+    @property
+    def completions(self) -> "_ThreadedOpenAIClient":
+        return self
+
+    async def create(self, **kwargs):
+        return await asyncio.to_thread(self._client.chat.completions.create, **kwargs)
+
+class _ThreadedTavilyClient:
+    """동기 Tavily 클라이언트의 search 를 코루틴으로 노출하는 어댑터"""
+    def __init__(self, client):
+        self._client = client
+
+    async def search(self, **kwargs):
+        return await asyncio.to_thread(self._client.search, **kwargs)
+
+# 외부 API 복원력 (호출별 타임아웃 / 지터 지수 백오프 재시도 / 헤징 / 서킷 브레이커)
+class UpstreamUnavailable(RuntimeError):
+    """서킷이 열려 있거나 재시도/마감 시간을 모두 소진한 외부 API 호출 (기존 폴백 경로로 처리)"""
+
+class ResiliencePolicy:
+    """외부 API 호출 정책
+
+    - timeout: 시도 1회의 제한 시간 (초)
+    - retries: 실패/타임아웃 후 재시도 횟수
+    - backoff_base / backoff_max: full-jitter 지수 백오프 (uniform(0, min(max, base * 2^n)))
+    - hedge_after: 첫 요청이 이 시간 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 끝난 쪽 사용 (None 이면 미사용)
+    """
+    def __init__(
+        self,
+        *,
+        timeout: float,
+        retries: int = 2,
+        backoff_base: float = 0.2,
+        backoff_max: float = 2.0,
+        hedge_after: Optional[float] = None,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_after = hedge_after
+    
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold 에 도달하면 reset_timeout 동안 호출을 즉시 거부 (이후 시험 호출 1건 허용)"""
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half_open" if time.monotonic() - self._opened_at >= self.reset_timeout else "open"
+    
+    def allow(self) -> bool:
+        """호출 허용 여부 확인 (거부 시 UpstreamUnavailable), 반열림 상태의 시험 호출이면 True"""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if time.monotonic() - self._opened_at >= self.reset_timeout and not self._probing:
+                self._probing = True
+                return True
+        raise UpstreamUnavailable(f"{self.name} circuit open: upstream degraded, failing fast")
+    
+    def release_probe(self) -> None:
+        """성공/실패를 기록하지 못하고 끝난 시험 호출 반납 (서킷은 열린 상태 유지)"""
+        with self._lock:
+            self._probing = False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+def _env_policy(upstream: str, timeout: str, hedge_after: str = "") -> ResiliencePolicy:
+    prefix = f"RESEARCHER_{upstream.upper()}"
+    hedge = os.getenv(f"{prefix}_HEDGE_AFTER", hedge_after)
+    return ResiliencePolicy(
+        timeout=float(os.getenv(f"{prefix}_TIMEOUT", timeout)),
+        retries=int(os.getenv(f"{prefix}_RETRIES", "2")),
+        hedge_after=float(hedge) if hedge else None,
+    )
+
+# 업스트림별 정책/브레이커 (Tavily 는 검색 비용이 낮아 꼬리 지연 구간에서 헤징)
+RESILIENCE_POLICIES: Dict[str, ResiliencePolicy] = {
+    "tavily": _env_policy("tavily", timeout="10", hedge_after="3"),
+    "openai": _env_policy("openai", timeout="30"),
+}
+CIRCUIT_BREAKERS: Dict[str, CircuitBreaker] = {
+    upstream: CircuitBreaker(
+        upstream,
+        failure_threshold=int(os.getenv("RESEARCHER_CIRCUIT_FAILURES", "5")),
+        reset_timeout=float(os.getenv("RESEARCHER_CIRCUIT_RESET", "30")),
+    )
+    for upstream in RESILIENCE_POLICIES
+}
+
+# 4xx 요청 오류는 재시도해도 결과가 같으므로 바로 실패 (429 제외)
+_NON_RETRYABLE_STATUS = frozenset((400, 401, 403, 404, 422))
+
+def _is_retryable(exc: BaseException) -> bool:
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    return status not in _NON_RETRYABLE_STATUS
+
+@lru_cache
+def _get_upstream_executor() -> ThreadPoolExecutor:
+    """제한 시간/헤징을 위해 동기 API 호출을 실행하는 스레드 풀"""
+    return ThreadPoolExecutor(
+        max_workers=int(os.getenv("RESEARCHER_UPSTREAM_WORKERS", "32")), thread_name_prefix="researcher-upstream"
+    )
+
+def _attempt_timeout(policy: ResiliencePolicy, deadline_at: Optional[float]) -> float:
+    timeout = policy.timeout
+    if deadline_at is not None:
+        timeout = min(timeout, deadline_at - time.time())
+    if timeout <= 0:
+        raise UpstreamUnavailable("deadline exceeded before upstream call")
+    return timeout
+
+def call_with_resilience(upstream: str, fn: Callable[[float], _T], *, deadline_at: Optional[float] = None) -> _T:
+    """동기 외부 API 호출에 타임아웃/재시도/헤징/서킷 브레이커 적용 (deadline_at: epoch 초 기준 전체 마감)
+
+    fn 은 시도별 제한 시간(초)을 받아 SDK 호출의 timeout 으로 넘긴다. 포기한 시도나 헤징에서 진 요청도
+    그 시간이 지나면 끝나므로 작업 스레드 풀을 계속 점유하지 않는다.
+    """
+    policy = RESILIENCE_POLICIES[upstream]
+    breaker = CIRCUIT_BREAKERS[upstream]
+    probing = breaker.allow()
+    executor = _get_upstream_executor()
+    last_error: Optional[BaseException] = None
+    
+    try:
+        for attempt in range(policy.retries + 1):
+            timeout = _attempt_timeout(policy, deadline_at)
+            started = time.monotonic()
+            # 작업 스레드에서도 노드 계측 카운터가 보이도록 컨텍스트 복사
+            futures = {executor.submit(contextvars.copy_context().run, fn, timeout)}
+            try:
+                if policy.hedge_after is not None and policy.hedge_after < timeout:
+                    done, _ = wait(futures, timeout=policy.hedge_after)
+                    if not done:
+                        futures.add(executor.submit(contextvars.copy_context().run, fn, timeout - policy.hedge_after))
+                remaining = timeout - (time.monotonic() - started)
+                done, _ = wait(futures, timeout=max(remaining, 0), return_when=FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError(f"{upstream} call timed out after {timeout:.1f}s")
+                result = next(iter(done)).result()
+            except Exception as exc:
+                last_error = exc
+                if not _is_retryable(exc):
+                    break  # 요청 자체의 오류는 업스트림 장애로 세지 않음
+                breaker.record_failure()
+                probing = False
+                if attempt == policy.retries:
+                    break
+                delay = policy.backoff(attempt)
+                if deadline_at is not None and time.time() + delay >= deadline_at:
+                    break
+                time.sleep(delay)
+                probing = breaker.allow()
+                continue
+            breaker.record_success()
+            probing = False
+            return result
+    finally:
+        # 마감 초과/취소 등으로 결과를 기록하지 못한 시험 호출은 반납 (다음 호출이 다시 시험할 수 있도록)
+        if probing:
+            breaker.release_probe()
+    
+    raise UpstreamUnavailable(f"{upstream} call failed after {attempt + 1} attempt(s): {last_error}") from last_error
+
+async def acall_with_resilience(upstream: str, afn: Callable[[float], Any], *, deadline_at: Optional[float] = None) -> Any:
+    """call_with_resilience 의 비동기 버전 - afn 은 제한 시간을 받는 코루틴 함수, 진 쪽 헤징 요청은 취소"""
+    policy = RESILIENCE_POLICIES[upstream]
+    breaker = CIRCUIT_BREAKERS[upstream]
+    probing = breaker.allow()
+    last_error: Optional[BaseException] = None
+    
+    try:
+        for attempt in range(policy.retries + 1):
+            timeout = _attempt_timeout(policy, deadline_at)
+            started = time.monotonic()
+            tasks = {asyncio.ensure_future(afn(timeout))}
+            try:
+                if policy.hedge_after is not None and policy.hedge_after < timeout:
+                    done, _ = await asyncio.wait(tasks, timeout=policy.hedge_after)
+                    if not done:
+                        tasks.add(asyncio.ensure_future(afn(timeout - policy.hedge_after)))
+                remaining = timeout - (time.monotonic() - started)
+                done, _ = await asyncio.wait(tasks, timeout=max(remaining, 0), return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError(f"{upstream} call timed out after {timeout:.1f}s")
+                result = next(iter(done)).result()
+            except Exception as exc:
+                last_error = exc
+                if not _is_retryable(exc):
+                    break
+                breaker.record_failure()
+                probing = False
+                if attempt == policy.retries:
+                    break
+                delay = policy.backoff(attempt)
+                if deadline_at is not None and time.time() + delay >= deadline_at:
+                    break
+                await asyncio.sleep(delay)
+                probing = breaker.allow()
+                continue
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+            breaker.record_success()
+            probing = False
+            return result
+    finally:
+        if probing:
+            breaker.release_probe()
+    
+    raise UpstreamUnavailable(f"{upstream} call failed after {attempt + 1} attempt(s): {last_error}") from last_error
+
+# 캐시 계층 (검색 결과 등 외부 API 응답 재사용)
+CACHE_PATH = Path(os.getenv("RESEARCHER_CACHE_PATH", Path(__file__).resolve().parent / ".researcher_cache.sqlite3"))
+
+class _MemoryCacheBackend:
+    """프로세스 내 LRU 캐시 백엔드"""
+    blocking = False  # 비동기 경로에서 바로 호출해도 이벤트 루프를 막지 않음
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, stored_at: float, payload: str) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def iter_payloads(self) -> Iterator[str]:
+        """저장된 값 전체 (최근 사용 순 역순, 스냅샷)"""
+        with self._lock:
+            payloads = [payload for _, payload in self._entries.values()]
+        return iter(payloads)
+
+class _SqliteCacheBackend:
+    """SQLite 디스크 캐시 백엔드 - 같은 호스트의 워커들이 공유"""
+    blocking = True  # 디스크 I/O - 비동기 경로에서는 스레드로 실행
+    
+    _EVICTION_INTERVAL = 64
+    
+    def __init__(self, path: Path, table: str, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._table = table
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, accessed_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)")
+    
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT stored_at, payload FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    f"UPDATE {self._table} SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+            return row
+    
+    def set(self, key: str, stored_at: float, payload: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} (key, stored_at, accessed_at, payload) VALUES (?, ?, ?, ?)",
+                (key, stored_at, time.time(), payload),
+            )
+            self._writes += 1
+            if self._writes % self._EVICTION_INTERVAL == 0:
+                # 최근 접근 순으로 max_entries 개만 유지 (LRU)
+                self._conn.execute(
+                    f"DELETE FROM {self._table} WHERE key NOT IN "
+                    f"(SELECT key FROM {self._table} ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+    
+    def iter_payloads(self) -> Iterator[str]:
+        """저장된 값 전체 (최근 접근 순)"""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT payload FROM {self._table} ORDER BY accessed_at DESC").fetchall()
+        return (row[0] for row in rows)
+
+_USE_DEFAULT = object()
+
+class _SingleFlight:
+    """동일 키에 대한 동시 호출을 하나의 실행으로 합침"""
+    def __init__(self):
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """(결과, 다른 호출의 결과를 공유했는지) 반환"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        if not leader:
+            return future.result(), True
+        
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+        return future.result(), False
+
+@lru_cache
+def _get_background_executor() -> ThreadPoolExecutor:
+    """캐시 재검증 등 백그라운드 작업용 스레드 풀"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="researcher-bg")
+
+class TTLCache:
+    """TTL + stale-while-revalidate 캐시
+
+    - age < ttl: 캐시 값 반환 (hit)
+    - ttl <= age < ttl + stale_ttl: 캐시 값을 즉시 반환하고 백그라운드에서 갱신 (stale hit)
+    - 그 외: 계산 후 저장 (miss) - 같은 키의 동시 miss 는 한 번만 계산 (single-flight)
+    값은 JSON 으로 직렬화해 저장하므로 호출자가 반환값을 수정해도 캐시가 오염되지 않는다.
+    """
+    def __init__(self, backend, *, ttl: float, stale_ttl: float = 0.0, name: str = "cache"):
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self._counters = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "deduplicated": 0, "refreshes": 0, "refresh_errors": 0,
+        }
+        self._refreshing: set = set()
+        self._inflight = _SingleFlight()
+        self._async_inflight: Dict[Tuple[int, str], "asyncio.Future"] = {}
+        self._background_tasks: set = set()
+        self._lock = threading.Lock()
+    
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+        if counter in ("hits", "stale_hits", "deduplicated"):
+            _record("cache_hits")
+        elif counter == "misses":
+            _record("cache_misses")
+    
+    def stats(self) -> Dict[str, int]:
+        """hit/miss 카운터 스냅샷"""
+        with self._lock:
+            return dict(self._counters)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """TTL 이내 값 조회 (없거나 만료면 None, 카운터 미반영)"""
+        entry = self.backend.get(key)
+        if entry is None or time.time() - entry[0] >= self.ttl:
+            return None
+        return json.loads(entry[1])
+    
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(key, time.time(), json.dumps(value, ensure_ascii=False))
+    
+    def values(self) -> Iterator[Any]:
+        """만료 여부와 관계없이 저장된 값 전체 (로컬 코퍼스 적재용, 카운터 미반영)"""
+        for payload in self.backend.iter_payloads():
+            yield json.loads(payload)
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        entry = self.backend.get(key)
+        if entry is not None:
+            stored_at, payload = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self._count("hits")
+                return json.loads(payload)
+            if age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._schedule_refresh(key, compute)
+                return json.loads(payload)
+        
+        def compute_and_store() -> str:
+            payload = json.dumps(compute(), ensure_ascii=False)
+            self.backend.set(key, time.time(), payload)
+            return payload
+        
+        payload, shared = self._inflight.do(key, compute_and_store)
+        self._count("deduplicated" if shared else "misses")
+        return json.loads(payload)
+    
+    async def _abackend_get(self, key: str) -> Optional[Tuple[float, str]]:
+        if getattr(self.backend, "blocking", False):
+            return await asyncio.to_thread(self.backend.get, key)
+        return self.backend.get(key)
+    
+    async def _abackend_set(self, key: str, stored_at: float, payload: str) -> None:
+        if getattr(self.backend, "blocking", False):
+            await asyncio.to_thread(self.backend.set, key, stored_at, payload)
+        else:
+            self.backend.set(key, stored_at, payload)
+    
+    async def aget_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """get_or_compute 의 비동기 버전 - compute 는 코루틴 함수 (SQLite 백엔드 조회/저장은 스레드에서 실행)"""
+        entry = await self._abackend_get(key)
+        if entry is not None:
+            stored_at, payload = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self._count("hits")
+                return json.loads(payload)
+            if age < self.ttl + self.stale_ttl:
+                self._count("stale_hits")
+                self._schedule_async_refresh(key, compute)
+                return json.loads(payload)
+        
+        loop = asyncio.get_running_loop()
+        inflight_key = (id(loop), key)
+        with self._lock:
+            future = self._async_inflight.get(inflight_key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                self._async_inflight[inflight_key] = future
+        if not leader:
+            payload = await asyncio.shield(future)
+            self._count("deduplicated")
+            return json.loads(payload)
+        
+        self._count("misses")
+        try:
+            payload = json.dumps(await compute(), ensure_ascii=False)
+            await self._abackend_set(key, time.time(), payload)
+            future.set_result(payload)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # 대기자가 없을 때 "exception never retrieved" 경고 방지
+            raise
+        finally:
+            with self._lock:
+                self._async_inflight.pop(inflight_key, None)
+        return json.loads(payload)
+    
+    def _schedule_async_refresh(self, key: str, compute: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        async def refresh() -> None:
+            try:
+                value = await compute()
+                await self._abackend_set(key, time.time(), json.dumps(value, ensure_ascii=False))
+                self._count("refreshes")
+            except Exception:
+                self._count("refresh_errors")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def _schedule_refresh(self, key: str, compute: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh() -> None:
+            try:
+                value = compute()
+                self.backend.set(key, time.time(), json.dumps(value, ensure_ascii=False))
+                self._count("refreshes")
+            except Exception:
+                # 갱신 실패 시 기존 값을 유지하고 다음 요청에서 재시도
+                self._count("refresh_errors")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        _get_background_executor().submit(refresh)
+
+def _build_cache(kind: str, *, table: str, ttl: float, stale_ttl: float, max_entries: int, name: str) -> Optional[TTLCache]:
+    """설정값(memory/sqlite/off)에 맞는 캐시 생성"""
+    kind = kind.lower()
+    if kind in ("off", "none", "0", ""):
+        return None
+    if kind == "sqlite":
+        backend = _SqliteCacheBackend(CACHE_PATH, table, max_entries=max_entries)
+    else:
+        backend = _MemoryCacheBackend(max_entries=max_entries)
+    return TTLCache(backend, ttl=ttl, stale_ttl=stale_ttl, name=name)
+
+@lru_cache
+def get_search_cache() -> Optional[TTLCache]:
+    """Tavily 검색 결과 캐시 (RESEARCHER_SEARCH_CACHE=memory|sqlite|off)"""
+    return _build_cache(
+        os.getenv("RESEARCHER_SEARCH_CACHE", "memory"),
+        table="search_cache",
+        ttl=float(os.getenv("RESEARCHER_SEARCH_CACHE_TTL", "900")),
+        stale_ttl=float(os.getenv("RESEARCHER_SEARCH_CACHE_STALE_TTL", "3600")),
+        max_entries=int(os.getenv("RESEARCHER_SEARCH_CACHE_SIZE", "2048")),
+        name="search",
+    )
+
+@lru_cache
+def get_llm_cache() -> Optional[TTLCache]:
+    """OpenAI 응답 캐시 (RESEARCHER_LLM_CACHE=memory|sqlite|off)"""
+    return _build_cache(
+        os.getenv("RESEARCHER_LLM_CACHE", "memory"),
+        table="llm_cache",
+        ttl=float(os.getenv("RESEARCHER_LLM_CACHE_TTL", "86400")),
+        stale_ttl=0.0,
+        max_entries=int(os.getenv("RESEARCHER_LLM_CACHE_SIZE", "4096")),
+        name="llm",
+    )
+
+def _llm_cache_key(model: str, prompt: str, temperature: float) -> str:
+    raw = json.dumps([model, prompt, temperature], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _search_cache_key(
+    query: str, include_domains: Optional[List[str]], max_results: int, search_depth: str
+) -> str:
+    raw = json.dumps([query, sorted(include_domains or []), max_results, search_depth], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+# 서브 키워드 평가 지표
+_ENGAGEMENT_INDICATORS = ["방법", "가이드", "팁", "추천", "후기", "비교", "순위", "best", "top"]
+_QUESTION_WORDS = ["어떻게", "왜", "무엇", "언제", "어디서"]
+_TREND_WORDS = ["2024", "최신", "신규", "새로운", "트렌드", "인기", "핫"]
+_COMMERCIAL_INDICATORS = ["구매", "가격", "비용", "할인", "추천", "순위", "비교", "리뷰", "후기"]
+
+class _AccumulatedScores:
+    """지표 개수 -> 점수 조회표 (기존 루프의 `score += step` 누적 결과와 비트 단위로 동일)"""
+    def __init__(self, base: float, step: float, max_hits: int, bonus: float = 0.0):
+        rows = []
+        for with_bonus in (False, True):
+            score, row = base, []
+            for _ in range(max_hits + 1):
+                row.append(min(score + bonus, 1.0) if with_bonus else min(score, 1.0))
+                score += step
+            rows.append(row)
+        self._rows = rows
+        self._table = None
+    
+    def __getitem__(self, index):
+        if self._table is None:
+            np = _load_dependency("numpy")
+            self._table = np.array(self._rows, dtype=np.float64).T
+        if isinstance(index, tuple):
+            return self._table[index]
+        return self._table[index, 0]
+
+_ACCUMULATED_ENGAGEMENT_SCORES = _AccumulatedScores(0.5, 0.1, len(_ENGAGEMENT_INDICATORS), bonus=0.2)
+_ACCUMULATED_TREND_SCORES = _AccumulatedScores(0.6, 0.1, len(_TREND_WORDS))
+_ACCUMULATED_COMMERCIAL_SCORES = _AccumulatedScores(0.3, 0.15, len(_COMMERCIAL_INDICATORS))
+
+# 로컬 키워드 확장 (저장된 검색 결과의 n-gram / 동시 출현 통계)
+_CORPUS_TOKEN_PATTERN = re.compile(r"[^\W_]{2,}")
+_CORPUS_STOPWORDS = frozenset((
+    "the", "and", "for", "with", "this", "that", "you", "your", "are", "was", "but", "not", "have", "has",
+    "from", "they", "will", "just", "all", "our", "can", "its", "it's", "about", "more", "what", "when",
+    "https", "http", "www", "com", "그리고", "하지만", "그래서", "이것", "저것", "정말", "진짜", "너무",
+))
+LOCAL_KEYWORD_CONFIDENCE = float(os.getenv("RESEARCHER_LOCAL_KEYWORD_CONFIDENCE", "0.6"))
+
+class SearchCorpus:
+    """검색 결과 문서의 n-gram 역색인 - 메인 키워드와 함께 자주 등장하는 표현으로 연관 키워드 후보 생성
+
+    최근 max_documents 개 문서만 유지하며 (오래된 문서부터 제거) 스레드 안전하다.
+    """
+    def __init__(
+        self,
+        max_documents: int = 2000,
+        max_ngram: int = 3,
+        max_support_documents: int = 300,
+        seed_cache: Optional["TTLCache"] = None,
+    ):
+        self.max_documents = max_documents
+        self.max_ngram = max_ngram
+        self.max_support_documents = max_support_documents
+        self._documents: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()  # 문서 키 -> n-gram 집합
+        self._postings: Dict[str, Set[str]] = {}  # 단어 -> 문서 키
+        self._document_frequency: Dict[str, int] = {}
+        self._seed_cache = seed_cache
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+    
+    def _ngrams(self, text: str) -> FrozenSet[str]:
+        tokens = _CORPUS_TOKEN_PATTERN.findall(text.lower())
+        ngrams = set()
+        for size in range(1, self.max_ngram + 1):
+            for start in range(len(tokens) - size + 1):
+                window = tokens[start:start + size]
+                # 불용어로 시작/끝나는 n-gram 은 키워드로 쓸 수 없음
+                if window[0] in _CORPUS_STOPWORDS or window[-1] in _CORPUS_STOPWORDS:
+                    continue
+                ngrams.add(" ".join(window))
+        return frozenset(ngrams)
+    
+    def add_results(self, results: Iterable[Dict[str, Any]]) -> int:
+        """검색 결과를 코퍼스에 추가 (같은 URL/본문은 한 번만), 추가된 문서 수 반환"""
+        added = 0
+        for result in results:
+            text = _content_text(result)
+            if not text:
+                continue
+            key = canonicalize_url(result.get("url", "")) or hashlib.sha1(text.encode("utf-8")).hexdigest()
+            ngrams = self._ngrams(text)
+            with self._lock:
+                if key in self._documents:
+                    continue
+                self._documents[key] = ngrams
+                for ngram in ngrams:
+                    self._document_frequency[ngram] = self._document_frequency.get(ngram, 0) + 1
+                    if " " not in ngram:
+                        self._postings.setdefault(ngram, set()).add(key)
+                while len(self._documents) > self.max_documents:
+                    self._evict_oldest()
+            added += 1
+        return added
+    
+    def _evict_oldest(self) -> None:
+        key, ngrams = self._documents.popitem(last=False)
+        for ngram in ngrams:
+            remaining = self._document_frequency[ngram] - 1
+            if remaining:
+                self._document_frequency[ngram] = remaining
+            else:
+                del self._document_frequency[ngram]
+            if " " not in ngram:
+                postings = self._postings[ngram]
+                postings.discard(key)
+                if not postings:
+                    del self._postings[ngram]
+    
+    def _ensure_seeded(self) -> None:
+        """처음 사용할 때 검색 결과 캐시에 남아 있는 응답으로 코퍼스를 채움"""
+        cache, self._seed_cache = self._seed_cache, None
+        if cache is None:
+            return
+        for results in cache.values():
+            if isinstance(results, list):
+                self.add_results(result for result in results if isinstance(result, dict))
+    
+    def expand(self, main_keyword: str, limit: int = 10, min_support: int = 10) -> Tuple[List[Dict[str, Any]], float]:
+        """메인 키워드와 동시 출현하는 n-gram 으로 후보 키워드와 신뢰도(0-1) 반환
+
+        점수는 동시 출현 문서 수 x log(1 + 전체 문서 수 / 문서 빈도) - 흔한 표현보다 특징적인 표현 우선.
+        신뢰도는 근거 문서 수(min_support 기준)와 2회 이상 동시 출현한 후보 수(limit 기준)로 계산.
+        """
+        self._ensure_seeded()
+        seed_tokens = [token for token in _CORPUS_TOKEN_PATTERN.findall(main_keyword.lower())
+                       if token not in _CORPUS_STOPWORDS]
+        if not seed_tokens:
+            return [], 0.0
+        
+        with self._lock:
+            total = len(self._documents)
+            supporting: Any = set()
+            for token in seed_tokens:
+                supporting |= self._postings.get(token, set())
+            # 근거 문서가 많으면 최근 문서만 사용 (응답 시간 상한)
+            if len(supporting) > self.max_support_documents:
+                recent = []
+                for key in reversed(self._documents):
+                    if key in supporting:
+                        recent.append(key)
+                        if len(recent) == self.max_support_documents:
+                            break
+                supporting = recent
+            cooccurrence: Counter = Counter()
+            for key in supporting:
+                cooccurrence.update(self._documents[key])
+            seed_set = set(seed_tokens)
+            scored = [
+                (count * math.log(1 + total / self._document_frequency[ngram]), ngram)
+                for ngram, count in cooccurrence.items()
+                if count >= 2 and seed_set.isdisjoint(ngram.split())
+            ]
+        
+        top = heapq.nlargest(limit * 3, scored)
+        if not top:
+            return [], 0.0
+        best = top[0][0]
+        candidates = []
+        for score, ngram in top:
+            words = ngram.split()
+            if any(word in _QUESTION_WORDS for word in words):
+                keyword_type = "question"
+            elif len(words) >= 2:
+                keyword_type = "longtail"
+            else:
+                keyword_type = "related"
+            candidates.append({
+                "keyword": f"{main_keyword} {ngram}",
+                "type": keyword_type,
+                "relevance": round(score / best, 3),
+                "source": "local",
+            })
+        confidence = min(len(supporting) / min_support, 1.0) * min(len(scored) / limit, 1.0)
+        return candidates, confidence
+
+@lru_cache
+def get_search_corpus() -> SearchCorpus:
+    """프로세스 전역 로컬 키워드 코퍼스 (검색 결과 캐시에 남은 응답으로 초기화)"""
+    return SearchCorpus(
+        max_documents=int(os.getenv("RESEARCHER_CORPUS_SIZE", "2000")),
+        seed_cache=get_search_cache(),
+    )
+
+# 코퍼스 IDF 모델 (오프라인 빌드 -> 워커들이 읽기 전용 mmap 으로 공유)
+# 빌드 산출물 디렉터리 (hashes.npy / idf.npy / meta.json), 비우면 기존 요청 시점 계산 사용
+IDF_MODEL_PATH = os.getenv("RESEARCHER_IDF_MODEL", "")
+_IDF_TOKENIZER_VERSION = "corpus-v1"
+# 어절 끝 조사 (긴 것부터, 떼고 남은 어간이 2자 이상일 때만)
+_KOREAN_PARTICLES = ("에서", "으로", "에게", "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도", "만")
+
+def _idf_tokens(text: str) -> List[str]:
+    """IDF 용 토큰 (영어 단어 + 조사를 뗀 한국어 어절)"""
+    tokens = []
+    for token in _CORPUS_TOKEN_PATTERN.findall(text.lower()):
+        if token in _CORPUS_STOPWORDS:
+            continue
+        if "가" <= token[-1] <= "힣":
+            for particle in _KOREAN_PARTICLES:
+                if token.endswith(particle) and len(token) - len(particle) >= 2:
+                    token = token[:-len(particle)]
+                    break
+        tokens.append(token)
+    return tokens
+
+def _token_hash(token: str) -> int:
+    # 프로세스마다 달라지는 hash() 대신 고정 64비트 해시
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+class IdfModel:
+    """정렬된 토큰 해시(uint64) + IDF(float32) 배열
+
+    어휘 문자열을 메모리에 올리지 않고 해시 이진 탐색으로 가중치를 찾으므로,
+    mmap 으로 열면 같은 호스트의 워커들이 페이지 캐시 한 벌을 공유한다.
+    """
+    def __init__(self, hashes, idf, document_count: int):
+        self.hashes = hashes
+        self.idf = idf
+        self.document_count = document_count
+        # 코퍼스에 없는 토큰은 문서 빈도 0 으로 간주 (smooth idf)
+        self.unknown_idf = math.log(1 + document_count) + 1.0
+    
+    @classmethod
+    def load(cls, path: str) -> "IdfModel":
+        np = _load_dependency("numpy")
+        directory = _idf_model_directory(path)
+        if directory is None:
+            raise FileNotFoundError(f"No IDF model found at {path}")
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("tokenizer") != _IDF_TOKENIZER_VERSION:
+            raise ValueError(f"IDF model at {path} was built with tokenizer {meta.get('tokenizer')!r}")
+        return cls(
+            np.load(directory / "hashes.npy", mmap_mode="r"),
+            np.load(directory / "idf.npy", mmap_mode="r"),
+            int(meta["document_count"]),
+        )
+    
+    def weights(self, tokens: List[str]) -> Dict[str, float]:
+        """토큰별 IDF (중복 제거)"""
+        np = _load_dependency("numpy")
+        unique = list(dict.fromkeys(tokens))
+        if not unique:
+            return {}
+        hashes = np.array([_token_hash(token) for token in unique], dtype=np.uint64)
+        positions = np.minimum(np.searchsorted(self.hashes, hashes), max(len(self.hashes) - 1, 0))
+        if len(self.hashes):
+            found = self.hashes[positions] == hashes
+            values = np.where(found, self.idf[positions], self.unknown_idf)
+        else:
+            values = np.full(len(unique), self.unknown_idf)
+        return dict(zip(unique, values.tolist()))
+    
+    def similarities(self, texts: List[str], reference: str):
+        """reference 와 각 텍스트의 TF-IDF 코사인 유사도 (고정 가중치 희소 벡터 내적)"""
+        np = _load_dependency("numpy")
+        token_lists = [_idf_tokens(text) for text in texts]
+        reference_counts = Counter(_idf_tokens(reference))
+        weights = self.weights([*reference_counts, *(token for tokens in token_lists for token in tokens)])
+        
+        reference_vector = {token: count * weights[token] for token, count in reference_counts.items()}
+        reference_norm = math.sqrt(sum(value * value for value in reference_vector.values()))
+        scores = np.zeros(len(texts))
+        for index, tokens in enumerate(token_lists):
+            vector = {token: count * weights[token] for token, count in Counter(tokens).items()}
+            norm = math.sqrt(sum(value * value for value in vector.values()))
+            if norm and reference_norm:
+                dot = sum(value * reference_vector.get(token, 0.0) for token, value in vector.items())
+                scores[index] = dot / (norm * reference_norm)
+        return scores
+
+def iter_corpus_documents(
+    cache: Optional["TTLCache"] = None, paths: Iterable[str] = ()
+) -> Iterator[str]:
+    """IDF 빌드용 문서 본문 - 검색 결과 캐시 + JSON/JSONL 파일(결과 dict 또는 문자열), URL/본문 기준 중복 제거"""
+    seen: Set[str] = set()
+    
+    def documents_in(value: Any) -> Iterator[Tuple[str, str]]:
+        if isinstance(value, str):
+            yield "", value
+        elif isinstance(value, dict) and ("content" in value or "snippet" in value):
+            yield value.get("url", ""), _content_text(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from documents_in(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from documents_in(item)
+    
+    def payloads() -> Iterator[Any]:
+        if cache is not None:
+            yield from cache.values()
+        for path in paths:
+            with open(path, encoding="utf-8") as source:
+                if str(path).endswith(".jsonl"):
+                    yield from (json.loads(line) for line in source if line.strip())
+                else:
+                    yield json.load(source)
+    
+    for payload in payloads():
+        for url, text in documents_in(payload):
+            if not text:
+                continue
+            key = canonicalize_url(url) or hashlib.sha1(text.encode("utf-8")).hexdigest()
+            if key in seen:
+                continue
+            seen.add(key)
+            yield text
+
+# 모델 디렉터리 구조: versions/<빌드 ID>/{hashes.npy,idf.npy,meta.json} + 현재 버전 이름을 담은 CURRENT
+# (CURRENT 만 원자적으로 교체하므로 읽는 쪽이 서로 다른 빌드의 파일을 섞어 열지 않음)
+_IDF_KEEP_VERSIONS = 3
+
+def _idf_model_directory(path: str) -> Optional[Path]:
+    """CURRENT 가 가리키는 빌드 디렉터리 (이전 평면 구조면 path 자체, 빌드 전이면 None)"""
+    root = Path(path)
+    pointer = root / "CURRENT"
+    if pointer.exists():
+        directory = root / "versions" / pointer.read_text(encoding="utf-8").strip()
+        return directory if (directory / "meta.json").exists() else None
+    return root if (root / "meta.json").exists() else None
+
+def build_idf_model(documents: Iterable[str], output_dir: str, *, min_df: int = 2) -> Dict[str, Any]:
+    """문서 모음에서 IDF 모델을 만들어 output_dir 에 새 버전으로 저장하고 메타데이터 반환
+
+    idf = ln((1 + N) / (1 + df)) + 1 (scikit-learn smooth_idf 와 같은 식). min_df 미만 토큰은
+    저장하지 않고 조회 시 미등록 토큰 가중치를 쓴다. 새 버전 디렉터리를 다 쓴 뒤 CURRENT 를 교체하므로
+    이미 mmap 으로 열어 둔 워커는 이전 버전을 계속 읽는다. 문서가 없으면 기존 모델을 덮어쓰지 않고 ValueError.
+    """
+    np = _load_dependency("numpy")
+    document_frequency: Counter = Counter()
+    document_count = 0
+    for text in documents:
+        tokens = set(_idf_tokens(text))
+        if tokens:
+            document_count += 1
+            document_frequency.update(tokens)
+    if not document_count:
+        raise ValueError("No documents with indexable text; refusing to build an empty IDF model.")
+    
+    by_hash: Dict[int, int] = {}
+    for token, frequency in document_frequency.items():
+        if frequency >= min_df:
+            token_hash = _token_hash(token)
+            by_hash[token_hash] = max(by_hash.get(token_hash, 0), frequency)  # 해시 충돌 시 더 흔한 쪽
+    hashes = np.array(sorted(by_hash), dtype=np.uint64)
+    frequencies = np.array([by_hash[int(token_hash)] for token_hash in hashes], dtype=np.float64)
+    idf = (np.log((1 + document_count) / (1 + frequencies)) + 1.0).astype(np.float32)
+    
+    root = Path(output_dir)
+    now = time.time_ns()
+    version = f"{time.strftime('%Y%m%dT%H%M%S', time.localtime(now // 10**9))}.{now % 10**9:09d}-{uuid.uuid4().hex[:8]}"
+    directory = root / "versions" / version
+    directory.mkdir(parents=True)
+    meta = {
+        "tokenizer": _IDF_TOKENIZER_VERSION,
+        "version": version,
+        "document_count": document_count,
+        "vocabulary_size": int(len(hashes)),
+        "min_df": min_df,
+        "built_at": time.time(),
+    }
+    np.save(directory / "hashes.npy", hashes)
+    np.save(directory / "idf.npy", idf)
+    (directory / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    (root / ".CURRENT.tmp").write_text(version, encoding="utf-8")
+    os.replace(root / ".CURRENT.tmp", root / "CURRENT")
+    
+    # 오래된 버전 정리 (방금 이전 버전을 연 워커가 있을 수 있으므로 최근 몇 개는 유지)
+    for stale in sorted((root / "versions").iterdir(), reverse=True)[_IDF_KEEP_VERSIONS:]:
+        if stale.name != version:  # 같은 초에 빌드가 겹쳐도 방금 게시한 버전은 지우지 않음
+            shutil.rmtree(stale, ignore_errors=True)
+    return meta
+
+@lru_cache
+def get_idf_model() -> Optional[IdfModel]:
+    """RESEARCHER_IDF_MODEL 의 IDF 모델 (미설정이거나 아직 빌드 전이면 None)"""
+    if not IDF_MODEL_PATH or _idf_model_directory(IDF_MODEL_PATH) is None:
+        return None
+    return IdfModel.load(IDF_MODEL_PATH)
+
+# 묶음 프롬프트 하나에 넣는 항목 수 - 응답이 OpenAI 시도당 제한 시간(기본 30초) 안에 끝나도록 작게 유지
+# (브레이크다운은 항목마다 키워드 객체 10개를 생성하므로 메인 키워드보다 작게)
+PREFETCH_MAIN_KEYWORD_CHUNK = int(os.getenv("RESEARCHER_PREFETCH_MAIN_CHUNK", "8"))
+PREFETCH_BREAKDOWN_CHUNK = int(os.getenv("RESEARCHER_PREFETCH_BREAKDOWN_CHUNK", "3"))
 
 # 키워드 인텔리전스 클래스
 class KeywordIntelligence:
-    def __init__(self):
-        self.openai_client = _get_openai_client()
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+    def __init__(
+        self,
+        openai_client=None,
+        llm_cache: Any = _USE_DEFAULT,
+        async_openai_client=None,
+        search_corpus: Any = _USE_DEFAULT,
+        local_confidence: float = LOCAL_KEYWORD_CONFIDENCE,
+        idf_model: Any = _USE_DEFAULT,
+    ):
+        # 클라이언트는 첫 사용 시 생성 (레지스트리에서 공유되는 장수명 인스턴스)
+        self._openai_client = openai_client
+        # 동기 클라이언트만 주입했으면 비동기 경로도 그 클라이언트를 스레드에서 사용
+        self._async_openai_client = async_openai_client or (
+            _ThreadedOpenAIClient(openai_client) if openai_client is not None else None
+        )
+        # llm_cache=None 이면 매 호출마다 OpenAI 요청
+        self.llm_cache: Optional[TTLCache] = get_llm_cache() if llm_cache is _USE_DEFAULT else llm_cache
+        # search_corpus=None 이면 로컬 키워드 확장 없이 항상 LLM 사용
+        self.search_corpus: Optional[SearchCorpus] = get_search_corpus() if search_corpus is _USE_DEFAULT else search_corpus
+        self.local_confidence = local_confidence
+        # idf_model=None 이면 주제 일관성을 요청마다 두 문서 TF-IDF 로 계산
+        self.idf_model: Optional[IdfModel] = get_idf_model() if idf_model is _USE_DEFAULT else idf_model
+        self._refinements: set = set()
+        self._refinements_lock = threading.Lock()
+        self._background_tasks: set = set()
+    
+    @property
+    def openai_client(self):
+        if self._openai_client is None:
+            self._openai_client = _get_openai_client()
+        return self._openai_client
+    
+    @property
+    def async_openai_client(self):
+        # 기본 비동기 클라이언트는 이벤트 루프별로 공유
+        return self._async_openai_client or _get_async_openai_client()
+    
+    def _complete_json(
+        self,
+        openai_client,
+        prompt: str,
+        temperature: float,
+        model: str = "gpt-4",
+        *,
+        deadline_at: Optional[float] = None,
+        validate: Optional[Callable[[Any], Any]] = None,
+        cache: bool = True,
+    ) -> Any:
+        """JSON 응답 chat completion - 모델/프롬프트/temperature 해시로 캐시하고 동시 요청은 합침
+
+        validate 가 주어지면 형식이 맞지 않는 응답(예외 발생)은 캐시하지 않고 예외를 그대로 전달한다.
+        cache=False 면 LLM 캐시를 거치지 않는다 (다시 조회되지 않는 묶음 프롬프트 응답).
+        """
+        def complete() -> Any:
+            response = call_with_resilience("openai", lambda timeout: openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                timeout=timeout
+            ), deadline_at=deadline_at)
+            _record_openai_usage(response)
+            # 파싱 가능하고 기대한 형식인 응답만 캐시에 저장
+            value = json.loads(response.choices[0].message.content)
+            if validate is not None:
+                validate(value)
+            return value
+        
+        if self.llm_cache is None or not cache:
+            return complete()
+        return self.llm_cache.get_or_compute(_llm_cache_key(model, prompt, temperature), complete)
+    
+    async def _acomplete_json(
+        self,
+        openai_client,
+        prompt: str,
+        temperature: float,
+        model: str = "gpt-4",
+        *,
+        deadline_at: Optional[float] = None,
+        validate: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """_complete_json 의 비동기 버전 (같은 캐시 공유)"""
+        async def complete() -> Any:
+            response = await acall_with_resilience("openai", lambda timeout: openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                timeout=timeout
+            ), deadline_at=deadline_at)
+            _record_openai_usage(response)
+            value = json.loads(response.choices[0].message.content)
+            if validate is not None:
+                validate(value)
+            return value
+        
+        if self.llm_cache is None:
+            return await complete()
+        return await self.llm_cache.aget_or_compute(_llm_cache_key(model, prompt, temperature), complete)
     
-    def extract_main_keyword(self, topic: str) -> MainKeyword:
-        """메인 키워드 추출 및 분석"""
+    def extract_main_keyword(
+        self, topic: str, *, deadline_at: Optional[float] = None, allow_llm: bool = True
+    ) -> MainKeyword:
+        """메인 키워드 추출 및 분석 (allow_llm=False 면 캐시된 응답 또는 폴백만 사용)"""
+        if not allow_llm:
+            return self._cached_main_keyword(topic)
+        openai_client = self.openai_client
         try:
             # OpenAI를 사용한 키워드 추출 및 분석
-            prompt = f"""
+            result = self._complete_json(
+                openai_client, self._main_keyword_prompt(topic), temperature=0.3, deadline_at=deadline_at,
+                validate=self._build_main_keyword,
+            )
+            return self._build_main_keyword(result)
+        except Exception as e:
+            return self._fallback_main_keyword(topic)
+    
+    async def aextract_main_keyword(
+        self, topic: str, *, deadline_at: Optional[float] = None, allow_llm: bool = True
+    ) -> MainKeyword:
+        """메인 키워드 추출 및 분석 (비동기)"""
+        if not allow_llm:
+            return self._cached_main_keyword(topic)
+        openai_client = self.async_openai_client
+        try:
+            result = await self._acomplete_json(
+                openai_client, self._main_keyword_prompt(topic), temperature=0.3, deadline_at=deadline_at,
+                validate=self._build_main_keyword,
+            )
+            return self._build_main_keyword(result)
+        except Exception as e:
+            return self._fallback_main_keyword(topic)
+    
+    def _cached_main_keyword(self, topic: str) -> MainKeyword:
+        cached = None
+        if self.llm_cache is not None:
+            cached = self.llm_cache.get(_llm_cache_key("gpt-4", self._main_keyword_prompt(topic), 0.3))
+        try:
+            if cached is not None:
+                return self._build_main_keyword(cached)
+        except Exception:
+            pass
+        return self._fallback_main_keyword(topic)
+    
+    @staticmethod
+    def _main_keyword_prompt(topic: str) -> str:
+        return f"""
             주제: "{topic}"
             
             위 주제에서 가장 핵심적이고 검색량이 많을 것으로 예상되는 메인 키워드를 추출하고 분석해주세요.
@@ -214,44 +1583,159 @@ class KeywordIntelligence:
                 "analysis_reason": "선택 이유"
             }}
             """
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            return MainKeyword(
-                keyword=result["keyword"],
-                search_volume=result["search_volume"],
-                competition_level=result["competition_level"],
-                cpc_range={"min": 0.5, "max": 2.0},  # 기본값
-                trend_score=result["trend_score"],
-                relevance_score=result["relevance_score"],
-                regional_data={"korea": {"popularity": 85}}
+    
+    @staticmethod
+    def _build_main_keyword(result: Dict[str, Any]) -> MainKeyword:
+        return MainKeyword(
+            keyword=result["keyword"],
+            search_volume=result["search_volume"],
+            competition_level=result["competition_level"],
+            cpc_range={"min": 0.5, "max": 2.0},  # 기본값
+            trend_score=result["trend_score"],
+            relevance_score=result["relevance_score"],
+            regional_data={"korea": {"popularity": 85}}
+        )
+    
+    @staticmethod
+    def _validate_breakdown(keywords: Any) -> None:
+        """브레이크다운 응답 형식 검사 ("keyword" 문자열을 가진 객체 목록)"""
+        if not isinstance(keywords, list) or not keywords:
+            raise ValueError("Keyword breakdown response must be a non-empty JSON array")
+        for item in keywords:
+            if not isinstance(item, dict) or not isinstance(item.get("keyword"), str) or not item["keyword"].strip():
+                raise ValueError(f"Invalid keyword breakdown item: {item!r}")
+    
+    @staticmethod
+    def _fallback_main_keyword(topic: str) -> MainKeyword:
+        """폴백: 간단한 키워드 추출"""
+        words = topic.split()
+        main_word = max(words, key=len) if words else topic
+        
+        return MainKeyword(
+            keyword=main_word,
+            search_volume=1000,
+            competition_level="MEDIUM",
+            cpc_range={"min": 0.5, "max": 2.0},
+            trend_score=70.0,
+            relevance_score=0.8,
+            regional_data={"korea": {"popularity": 75}}
+        )
+    
+    def generate_keyword_breakdown(
+        self, main_keyword: str, topic: str, *, deadline_at: Optional[float] = None, allow_llm: bool = True
+    ) -> List[Dict[str, Any]]:
+        """키워드 브레이크다운 - 연관 키워드 10개 생성 (캐시된 LLM 응답 -> 로컬 확장 -> LLM 순)
+
+        allow_llm=False 면 LLM 을 호출하지 않고 캐시/로컬 결과, 없으면 기본 변형 키워드를 반환.
+        """
+        prompt = self._breakdown_prompt(main_keyword, topic)
+        local = self._cached_or_local_breakdown(main_keyword, topic, prompt)
+        if local is not None:
+            if local and local[0].get("source") == "local":
+                self._schedule_refinement(prompt)
+            return local
+        if not allow_llm:
+            return self._fallback_breakdown(main_keyword)
+        
+        openai_client = self.openai_client
+        try:
+            keywords = self._complete_json(
+                openai_client, prompt, temperature=0.5, deadline_at=deadline_at, validate=self._validate_breakdown
             )
-            
+            return keywords[:10]  # 정확히 10개만 반환
         except Exception as e:
-            # 폴백: 간단한 키워드 추출
-            words = topic.split()
-            main_word = max(words, key=len) if words else topic
-            
-            return MainKeyword(
-                keyword=main_word,
-                search_volume=1000,
-                competition_level="MEDIUM",
-                cpc_range={"min": 0.5, "max": 2.0},
-                trend_score=70.0,
-                relevance_score=0.8,
-                regional_data={"korea": {"popularity": 75}}
-            )
+            return self._fallback_breakdown(main_keyword)
     
-    def generate_keyword_breakdown(self, main_keyword: str, topic: str) -> List[Dict[str, Any]]:
-        """키워드 브레이크다운 - 연관 키워드 10개 생성"""
+    async def agenerate_keyword_breakdown(
+        self, main_keyword: str, topic: str, *, deadline_at: Optional[float] = None, allow_llm: bool = True
+    ) -> List[Dict[str, Any]]:
+        """키워드 브레이크다운 (비동기)"""
+        prompt = self._breakdown_prompt(main_keyword, topic)
+        # 캐시 조회(SQLite)/코퍼스 확장/sklearn 점수 계산은 이벤트 루프를 막지 않도록 스레드에서 실행
+        local = await asyncio.to_thread(self._cached_or_local_breakdown, main_keyword, topic, prompt)
+        if local is not None:
+            if local and local[0].get("source") == "local":
+                self._schedule_async_refinement(prompt)
+            return local
+        if not allow_llm:
+            return self._fallback_breakdown(main_keyword)
+        
+        openai_client = self.async_openai_client
         try:
-            prompt = f"""
+            keywords = await self._acomplete_json(
+                openai_client, prompt, temperature=0.5, deadline_at=deadline_at, validate=self._validate_breakdown
+            )
+            return keywords[:10]
+        except Exception as e:
+            return self._fallback_breakdown(main_keyword)
+    
+    def _cached_or_local_breakdown(self, main_keyword: str, topic: str, prompt: str) -> Optional[List[Dict[str, Any]]]:
+        """LLM 캐시 적중 또는 신뢰도가 충분한 로컬 확장 결과 (둘 다 없으면 None)"""
+        if self.llm_cache is not None:
+            cached = self.llm_cache.get(_llm_cache_key("gpt-4", prompt, 0.5))
+            if isinstance(cached, list):
+                return cached[:10]
+        if self.search_corpus is None:
+            return None
+        
+        candidates, confidence = self.search_corpus.expand(main_keyword)
+        if confidence < self.local_confidence or len(candidates) < 10:
+            return None
+        # 기존 서브 키워드 평가 지표와 동시 출현 점수를 함께 반영해 10개 선택
+        evaluations = self.score_sub_keywords(candidates, topic)
+        ranked = sorted(
+            zip(candidates, evaluations),
+            key=lambda pair: (pair[0]["relevance"] + pair[1]["final_score"]) / 2,
+            reverse=True,
+        )
+        return [candidate for candidate, _ in ranked[:10]]
+    
+    def _schedule_refinement(self, prompt: str) -> None:
+        """로컬 결과를 돌려준 뒤 백그라운드에서 LLM 응답을 캐시에 채워 다음 요청부터 사용"""
+        if self.llm_cache is None:
+            return
+        with self._refinements_lock:
+            if prompt in self._refinements:
+                return
+            self._refinements.add(prompt)
+        
+        def refine() -> None:
+            try:
+                self._complete_json(self.openai_client, prompt, temperature=0.5, validate=self._validate_breakdown)
+            except Exception:
+                pass  # 다음 요청도 로컬 결과로 응답
+            finally:
+                with self._refinements_lock:
+                    self._refinements.discard(prompt)
+        
+        _get_background_executor().submit(refine)
+    
+    def _schedule_async_refinement(self, prompt: str) -> None:
+        if self.llm_cache is None:
+            return
+        with self._refinements_lock:
+            if prompt in self._refinements:
+                return
+            self._refinements.add(prompt)
+        
+        async def refine() -> None:
+            try:
+                await self._acomplete_json(
+                    self.async_openai_client, prompt, temperature=0.5, validate=self._validate_breakdown
+                )
+            except Exception:
+                pass  # 다음 요청도 로컬 결과로 응답
+            finally:
+                with self._refinements_lock:
+                    self._refinements.discard(prompt)
+        
+        task = asyncio.get_running_loop().create_task(refine())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    @staticmethod
+    def _breakdown_prompt(main_keyword: str, topic: str) -> str:
+        return f"""
             메인 키워드: "{main_keyword}"
             원본 주제: "{topic}"
             
@@ -270,144 +1754,262 @@ class KeywordIntelligence:
                 ...
             ]
             """
-            
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.5
-            )
-            
-            keywords = json.loads(response.choices[0].message.content)
-            return keywords[:10]  # 정확히 10개만 반환
-            
-        except Exception as e:
-            # 폴백: 기본 키워드 변형 생성
-            base_variations = [
-                f"{main_keyword} 방법",
-                f"{main_keyword} 가이드", 
-                f"{main_keyword} 팁",
-                f"{main_keyword} 추천",
-                f"{main_keyword} 비교",
-                f"최고의 {main_keyword}",
-                f"{main_keyword} 후기",
-                f"{main_keyword} 장단점",
-                f"{main_keyword} 선택법",
-                f"{main_keyword} 트렌드"
-            ]
-            
-            return [
-                {"keyword": kw, "type": "related", "relevance": 0.7}
-                for kw in base_variations
-            ]
+    
+    @staticmethod
+    def _fallback_breakdown(main_keyword: str) -> List[Dict[str, Any]]:
+        """폴백: 기본 키워드 변형 생성"""
+        base_variations = [
+            f"{main_keyword} 방법",
+            f"{main_keyword} 가이드", 
+            f"{main_keyword} 팁",
+            f"{main_keyword} 추천",
+            f"{main_keyword} 비교",
+            f"최고의 {main_keyword}",
+            f"{main_keyword} 후기",
+            f"{main_keyword} 장단점",
+            f"{main_keyword} 선택법",
+            f"{main_keyword} 트렌드"
+        ]
+        
+        return [
+            {"keyword": kw, "type": "related", "relevance": 0.7}
+            for kw in base_variations
+        ]
+    
+    def prefetch_main_keywords(
+        self, topics: List[str], chunk_size: int = PREFETCH_MAIN_KEYWORD_CHUNK, *, executor: Optional[Executor] = None
+    ) -> int:
+        """여러 주제의 메인 키워드를 묶음 completion 으로 요청해 주제별 캐시 항목을 미리 채움
+
+        이후 extract_main_keyword(topic) 는 캐시에서 바로 응답한다. 채운 주제 수를 반환.
+        """
+        items = [(topic, self._main_keyword_prompt(topic)) for topic in dict.fromkeys(topics)]
+        return self._prefetch_batched(items, chunk_size, executor=executor, temperature=0.3, instruction=(
+            "아래 각 주제에서 가장 핵심적이고 검색량이 많을 것으로 예상되는 메인 키워드를 추출하고 분석해주세요.\n"
+            "각 주제마다 다음 필드를 가진 객체를 만들어 입력 순서대로 JSON 배열로 응답해주세요: "
+            '"index", "keyword", "search_volume"(숫자), "competition_level"(LOW/MEDIUM/HIGH), '
+            '"relevance_score"(0-1), "trend_score"(0-100), "analysis_reason"'
+        ), validate=self._build_main_keyword)
+    
+    def prefetch_keyword_breakdowns(
+        self,
+        pairs: List[Tuple[str, str]],
+        chunk_size: int = PREFETCH_BREAKDOWN_CHUNK,
+        *,
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """(메인 키워드, 주제) 목록의 브레이크다운을 묶음 completion 으로 미리 채움"""
+        items = [
+            (f"{main_keyword} / {topic}", self._breakdown_prompt(main_keyword, topic))
+            for main_keyword, topic in dict.fromkeys(pairs)
+        ]
+        return self._prefetch_batched(items, chunk_size, executor=executor, temperature=0.5, instruction=(
+            "아래 각 항목(메인 키워드 / 원본 주제)에 대해 Google 연관 검색어로 노출될 수 있는 하위 키워드를 정확히 10개씩 생성해주세요. "
+            "롱테일 키워드(3-5단어)와 질문형 키워드(\"어떻게\", \"왜\", \"무엇\" 등)를 포함해야 합니다.\n"
+            '입력 순서대로 {"index": 번호, "keywords": [{"keyword": ..., "type": "related/longtail/question", "relevance": 0.9}, ...]} '
+            "객체의 JSON 배열로 응답해주세요"
+        ), result_key="keywords", validate=self._validate_breakdown)
+    
+    def _prefetch_batched(
+        self,
+        items: List[Tuple[str, str]],
+        chunk_size: int,
+        *,
+        temperature: float,
+        instruction: str,
+        validate: Optional[Callable[[Any], Any]] = None,
+        result_key: Optional[str] = None,
+        model: str = "gpt-4",
+        executor: Optional[Executor] = None,
+    ) -> int:
+        """(라벨, 단건 프롬프트) 목록을 묶음 프롬프트로 요청하고 결과를 단건 프롬프트 키로 캐시에 저장
+
+        executor 가 주어지면 묶음들을 동시에 요청한다. 묶음 응답 자체는 캐시하지 않는다.
+        """
+        if self.llm_cache is None:
+            return 0
+        pending = [
+            (label, prompt) for label, prompt in items
+            if self.llm_cache.get(_llm_cache_key(model, prompt, temperature)) is None
+        ]
+        chunk_size = max(1, chunk_size)
+        chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+        openai_client = self.openai_client
+        
+        def request(chunk: List[Tuple[str, str]]) -> Any:
+            listing = "\n".join(f'{index}. "{label}"' for index, (label, _) in enumerate(chunk))
+            try:
+                return self._complete_json(openai_client, f"{instruction}\n\n{listing}", temperature, model, cache=False)
+            except Exception:
+                # 묶음 요청 실패 시 각 주제는 그래프 실행 중 개별 요청으로 처리
+                return None
+        
+        filled = 0
+        responses = executor.map(request, chunks) if executor is not None else map(request, chunks)
+        for chunk, results in zip(chunks, responses):
+            for result in results if isinstance(results, list) else []:
+                try:
+                    label, prompt = chunk[int(result["index"])]
+                    value = result[result_key] if result_key else result
+                    if validate is not None:
+                        validate(value)
+                except (KeyError, IndexError, TypeError, ValueError):
+                    continue
+                self.llm_cache.set(_llm_cache_key(model, prompt, temperature), value)
+                filled += 1
+        return filled
     
     def evaluate_sub_keywords(self, keywords: List[Dict[str, Any]], topic: str, main_keyword: str) -> List[SubKeywordEvaluation]:
         """서브 키워드 평가 및 최대 2개 선별"""
-        evaluations = []
+        evaluations = self.score_sub_keywords(keywords, topic)
         
-        for kw_data in keywords:
-            keyword = kw_data["keyword"]
-            
-            # 각 평가 기준별 점수 계산
-            topic_coherence = self._calculate_topic_coherence(keyword, topic)
-            engagement_potential = self._predict_engagement_potential(keyword)
-            trend_momentum = self._analyze_trend_momentum(keyword)
-            competition_advantage = self._assess_competition_advantage(keyword)
-            commercial_value = self._evaluate_commercial_value(keyword)
-            
-            # 가중치 적용한 최종 점수 계산
-            final_score = (
-                topic_coherence * 0.30 +
-                engagement_potential * 0.25 +
-                trend_momentum * 0.20 +
-                competition_advantage * 0.15 +
-                commercial_value * 0.10
-            )
-            
-            evaluation = SubKeywordEvaluation(
+        # 점수 기준 상위 2개 선택 (전체 정렬 대신 힙)
+        return heapq.nlargest(2, evaluations, key=lambda x: x["final_score"])
+    
+    def score_sub_keywords(self, keywords: List[Dict[str, Any]], topic: str) -> List[SubKeywordEvaluation]:
+        """후보 키워드 일괄 평가 - 벡터라이저 fit 1회 + 행렬 연산으로 전체 점수 계산"""
+        if not keywords:
+            return []
+        names = [kw_data["keyword"] for kw_data in keywords]
+        
+        # 각 평가 기준별 점수 계산
+        topic_coherence = self._batch_topic_coherence(names, topic)
+        engagement_potential = self._batch_engagement_potential(names)
+        trend_momentum = _ACCUMULATED_TREND_SCORES[self._count_indicator_hits(names, _TREND_WORDS)]
+        competition_advantage = self._batch_competition_advantage(names)
+        commercial_value = _ACCUMULATED_COMMERCIAL_SCORES[self._count_indicator_hits(names, _COMMERCIAL_INDICATORS)]
+        
+        # 가중치 적용한 최종 점수 계산
+        final_scores = (
+            topic_coherence * 0.30 +
+            engagement_potential * 0.25 +
+            trend_momentum * 0.20 +
+            competition_advantage * 0.15 +
+            commercial_value * 0.10
+        )
+        
+        return [
+            SubKeywordEvaluation(
                 keyword=keyword,
-                topic_coherence_score=topic_coherence,
-                engagement_potential=engagement_potential,
-                trend_momentum=trend_momentum,
-                competition_advantage=competition_advantage,
-                commercial_value=commercial_value,
-                final_score=final_score,
-                selection_reason=self._generate_selection_reason(keyword, final_score)
+                topic_coherence_score=float(topic_coherence[i]),
+                engagement_potential=float(engagement_potential[i]),
+                trend_momentum=float(trend_momentum[i]),
+                competition_advantage=float(competition_advantage[i]),
+                commercial_value=float(commercial_value[i]),
+                final_score=float(final_scores[i]),
+                selection_reason=self._generate_selection_reason(keyword, float(final_scores[i]))
             )
-            
-            evaluations.append(evaluation)
+            for i, keyword in enumerate(names)
+        ]
+    
+    def _batch_topic_coherence(self, keywords: List[str], topic: str):
+        """주제 일관성 점수 일괄 계산
+
+        기존 구현은 후보마다 [keyword, topic] 두 문서로 TF-IDF 를 새로 fit 했다.
+        두 문서 IDF 는 공유 단어 1, 한쪽에만 있는 단어 1 + ln(3/2) 이므로,
+        전체 후보에 대한 단어 빈도 행렬 하나로 동일한 코사인 유사도를 행렬 연산으로 계산한다.
+        """
+        np = _load_dependency("numpy")
+        if self.idf_model is not None:
+            return self._idf_topic_coherence(keywords, topic)
+        CountVectorizer = _lazy_sklearn()
+        try:
+            counts = CountVectorizer(stop_words='english').fit_transform([topic, *keywords]).tocsr().astype(np.float64)
+        except ValueError:
+            # 토픽과 모든 후보에 유효한 단어가 없음
+            return np.array([self._word_overlap_coherence(keyword, topic) for keyword in keywords])
+        
+        topic_counts = counts[0].toarray().ravel()
+        keyword_counts = counts[1:]
+        unique_weight_sq = (1.0 + np.log(1.5)) ** 2
+        
+        topic_columns = np.flatnonzero(topic_counts)
+        keyword_topic_counts = keyword_counts[:, topic_columns]
+        topic_values = topic_counts[topic_columns]
+        
+        # 공유 단어는 양쪽 IDF 가 1 이므로 내적은 단순 빈도 내적
+        dot = keyword_topic_counts @ topic_values
+        keyword_sq = np.asarray(keyword_counts.multiply(keyword_counts).sum(axis=1)).ravel()
+        keyword_shared_sq = np.asarray(keyword_topic_counts.multiply(keyword_topic_counts).sum(axis=1)).ravel()
+        keyword_norm_sq = unique_weight_sq * keyword_sq - (unique_weight_sq - 1.0) * keyword_shared_sq
+        shared_topic_sq = (keyword_topic_counts > 0).astype(np.float64) @ (topic_values ** 2)
+        topic_norm_sq = unique_weight_sq * float(topic_values @ topic_values) - (unique_weight_sq - 1.0) * shared_topic_sq
         
-        # 점수 기준으로 정렬하고 상위 2개 선택
-        evaluations.sort(key=lambda x: x["final_score"], reverse=True)
-        return evaluations[:2]
+        denominator = np.sqrt(keyword_norm_sq * topic_norm_sq)
+        similarity = np.divide(dot, denominator, out=np.zeros_like(dot), where=denominator > 0)
+        coherence = np.minimum(similarity * 1.2, 1.0)  # 약간의 부스팅
+        
+        # 후보와 토픽 모두 유효 단어가 없으면 기존처럼 단순 단어 겹침으로 계산
+        if topic_columns.size == 0:
+            for i in np.flatnonzero(keyword_sq == 0):
+                coherence[i] = self._word_overlap_coherence(keywords[i], topic)
+        return coherence
+    
+    def _idf_topic_coherence(self, keywords: List[str], topic: str):
+        """코퍼스 IDF 모델 가중치로 계산한 주제 일관성 (요청 시점 fit 없음)"""
+        np = _load_dependency("numpy")
+        coherence = np.minimum(self.idf_model.similarities(keywords, topic) * 1.2, 1.0)  # 약간의 부스팅
+        # 후보와 토픽 모두 유효 단어가 없으면 단순 단어 겹침으로 계산
+        if not _idf_tokens(topic):
+            for i, keyword in enumerate(keywords):
+                if not _idf_tokens(keyword):
+                    coherence[i] = self._word_overlap_coherence(keyword, topic)
+        return coherence
     
     def _calculate_topic_coherence(self, keyword: str, topic: str) -> float:
         """주제 일관성 점수 계산"""
-        try:
-            # 텍스트 유사도 계산
-            texts = [keyword, topic]
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return min(similarity * 1.2, 1.0)  # 약간의 부스팅
-        except:
-            # 단순 단어 겹침 기반 계산
-            keyword_words = set(keyword.lower().split())
-            topic_words = set(topic.lower().split())
-            overlap = len(keyword_words.intersection(topic_words))
-            return min(overlap / max(len(keyword_words), len(topic_words)), 1.0)
+        return float(self._batch_topic_coherence([keyword], topic)[0])
+    
+    @staticmethod
+    def _word_overlap_coherence(keyword: str, topic: str) -> float:
+        """단순 단어 겹침 기반 계산"""
+        keyword_words = set(keyword.lower().split())
+        topic_words = set(topic.lower().split())
+        overlap = len(keyword_words.intersection(topic_words))
+        return min(overlap / max(len(keyword_words), len(topic_words), 1), 1.0)
+    
+    @staticmethod
+    def _count_indicator_hits(keywords: List[str], indicators: List[str], lowercase: bool = False):
+        """키워드별로 포함된 지표 단어 수"""
+        np = _load_dependency("numpy")
+        texts = [keyword.lower() for keyword in keywords] if lowercase else keywords
+        return np.array(
+            [sum(1 for indicator in indicators if indicator in text) for text in texts],
+            dtype=np.intp,
+        )
+    
+    def _batch_engagement_potential(self, keywords: List[str]):
+        """engagement 잠재력 일괄 예측"""
+        np = _load_dependency("numpy")
+        hits = self._count_indicator_hits(keywords, _ENGAGEMENT_INDICATORS, lowercase=True)
+        # 질문형 키워드는 engagement가 높음
+        questions = np.array(
+            [any(q in keyword for q in _QUESTION_WORDS) for keyword in keywords], dtype=np.intp
+        )
+        return _ACCUMULATED_ENGAGEMENT_SCORES[hits, questions]
+    
+    @staticmethod
+    def _batch_competition_advantage(keywords: List[str]):
+        """경쟁 우위도 일괄 평가 - 롱테일 키워드는 경쟁이 낮음"""
+        np = _load_dependency("numpy")
+        word_counts = np.array([len(keyword.split()) for keyword in keywords])
+        return np.select([word_counts >= 4, word_counts == 3], [0.8, 0.6], default=0.4)
     
     def _predict_engagement_potential(self, keyword: str) -> float:
         """engagement 잠재력 예측"""
-        # 키워드 특성 기반 engagement 예측
-        engagement_indicators = [
-            "방법", "가이드", "팁", "추천", "후기", "비교", "순위", "best", "top"
-        ]
-        
-        score = 0.5  # 기본 점수
-        for indicator in engagement_indicators:
-            if indicator in keyword.lower():
-                score += 0.1
-        
-        # 질문형 키워드는 engagement가 높음
-        if any(q in keyword for q in ["어떻게", "왜", "무엇", "언제", "어디서"]):
-            score += 0.2
-            
-        return min(score, 1.0)
+        return float(self._batch_engagement_potential([keyword])[0])
     
     def _analyze_trend_momentum(self, keyword: str) -> float:
         """트렌드 모멘텀 분석"""
-        # 트렌드 키워드 패턴 분석
-        trend_words = ["2024", "최신", "신규", "새로운", "트렌드", "인기", "핫"]
-        
-        score = 0.6  # 기본 점수
-        for word in trend_words:
-            if word in keyword:
-                score += 0.1
-                
-        return min(score, 1.0)
+        return float(_ACCUMULATED_TREND_SCORES[self._count_indicator_hits([keyword], _TREND_WORDS)[0]])
     
     def _assess_competition_advantage(self, keyword: str) -> float:
         """경쟁 우위도 평가"""
-        # 롱테일 키워드는 경쟁이 낮음
-        word_count = len(keyword.split())
-        if word_count >= 4:
-            return 0.8
-        elif word_count == 3:
-            return 0.6
-        else:
-            return 0.4
+        return float(self._batch_competition_advantage([keyword])[0])
     
     def _evaluate_commercial_value(self, keyword: str) -> float:
         """상업적 가치 평가"""
-        commercial_indicators = [
-            "구매", "가격", "비용", "할인", "추천", "순위", "비교", "리뷰", "후기"
-        ]
-        
-        score = 0.3  # 기본 점수
-        for indicator in commercial_indicators:
-            if indicator in keyword:
-                score += 0.15
-                
-        return min(score, 1.0)
+        return float(_ACCUMULATED_COMMERCIAL_SCORES[self._count_indicator_hits([keyword], _COMMERCIAL_INDICATORS)[0]])
     
     def _generate_selection_reason(self, keyword: str, score: float) -> str:
         """선택 사유 생성"""
@@ -418,30 +2020,612 @@ class KeywordIntelligence:
         else:
             return f"'{keyword}'는 기본적인 요구사항을 충족하여 선택되었습니다."
 
+# 문서 단위 텍스트 분석 (필터/품질 점수/감정 분석이 같은 기록을 공유)
+_QUALITY_ENGAGEMENT_INDICATORS = ('?', '!', '#', '@')
+_UNSET = object()
+
+class TextAnalysis:
+    """문서 텍스트를 한 번만 분석한 기록
+
+    토큰/소문자/지표 개수는 생성 시 계산하고, TextBlob 문장 파싱은
+    처음 필요할 때 한 번만 계산해 보관한다.
+    """
+    __slots__ = (
+        "text", "lower", "tokens", "token_count", "unique_word_count",
+        "stripped_length", "indicator_count", "_blob_counts", "_simhash",
+    )
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.tokens = text.split()
+        self.token_count = len(self.tokens)
+        self.unique_word_count = len(set(self.lower.split()))
+        self.stripped_length = len(text.strip())
+        self.indicator_count = sum(text.count(indicator) for indicator in _QUALITY_ENGAGEMENT_INDICATORS)
+        self._blob_counts = _UNSET
+        self._simhash = _UNSET
+    
+    @property
+    def blob_counts(self) -> Optional[Tuple[int, int]]:
+        """TextBlob 기준 (단어 수, 문장 수) - 파싱 실패 시 None"""
+        if self._blob_counts is _UNSET:
+            TextBlob = _lazy_textblob()
+            try:
+                blob = TextBlob(self.text)
+                self._blob_counts = (len(blob.words), len(blob.sentences))
+            except Exception:
+                self._blob_counts = None
+        return self._blob_counts
+    
+    @property
+    def sentence_count(self) -> Optional[int]:
+        counts = self.blob_counts
+        return counts[1] if counts else None
+    
+    def prime(self, blob_counts: Any) -> None:
+        """다른 프로세스에서 계산한 TextBlob 결과 채우기 (이미 계산된 값은 유지)"""
+        if self._blob_counts is _UNSET:
+            self._blob_counts = blob_counts
+    
+    @property
+    def simhash(self) -> Optional[int]:
+        """64비트 SimHash (단어 3-gram 기준) - 유사 중복 판별용, 단어가 너무 적으면 None"""
+        if self._simhash is _UNSET:
+            self._simhash = _simhash64(self.lower.split())
+        return self._simhash
+
+_SIMHASH_MIN_TOKENS = 8
+_SIMHASH_SHINGLE = 3
+
+def _simhash64(tokens: List[str]) -> Optional[int]:
+    if len(tokens) < _SIMHASH_MIN_TOKENS:
+        return None
+    np = _load_dependency("numpy")
+    shingles = {" ".join(tokens[i:i + _SIMHASH_SHINGLE]) for i in range(len(tokens) - _SIMHASH_SHINGLE + 1)}
+    digests = b"".join(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest() for shingle in shingles)
+    # 해시 비트별 다수결 -> 64비트 지문
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(len(shingles), 8), axis=1)
+    fingerprint = np.packbits(bits.sum(axis=0) * 2 > len(shingles))
+    return int.from_bytes(fingerprint.tobytes(), "big")
+
+@lru_cache(maxsize=4096)
+def analyze_text(text: str) -> TextAnalysis:
+    """텍스트 분석 기록 조회 (같은 텍스트는 팬아웃 쿼리/반복 실행 간에도 재사용)"""
+    return TextAnalysis(text)
+
+def _content_text(content: Any) -> str:
+    if isinstance(content, SearchResult):
+        return content.text
+    return content.get('content', '') or content.get('snippet', '')
+
+# 병렬 텍스트 분석 (결과가 많을 때 TextBlob 문장 파싱을 프로세스 풀로 분산)
+# 이 수 미만이면 프로세스 간 전송 비용이 더 크므로 기존 직렬 경로 사용
+PARALLEL_ANALYSIS_MIN_DOCUMENTS = int(os.getenv("RESEARCHER_PARALLEL_SCORING_MIN", "256"))
+# 미리 계산한 기록이 analyze_text 캐시(4096)에서 밀려나지 않도록 청크 단위로 계산 -> 소비
+_PARALLEL_ANALYSIS_CHUNK = 512
+# 마감이 없어도 워커 배치 하나를 기다리는 최대 시간 (초, 넘기면 남은 항목은 직렬 계산)
+PARALLEL_ANALYSIS_TIMEOUT = float(os.getenv("RESEARCHER_PARALLEL_SCORING_TIMEOUT", "30"))
+
+def _scoring_process_count() -> int:
+    """스코어링 워커 프로세스 수 (RESEARCHER_SCORING_PROCESSES, 기본 CPU 수 - 1, 최대 8)"""
+    configured = os.getenv("RESEARCHER_SCORING_PROCESSES")
+    if configured:
+        return max(int(configured), 0)
+    return min(max((os.cpu_count() or 1) - 1, 0), 8)
+
+def _scoring_worker_init(nltk_data_dir: Optional[str]) -> None:
+    """워커 시작 시 한 번만 NLTK 코퍼스/TextBlob 모델 로드"""
+    if nltk_data_dir:
+        _ensure_nltk_data(nltk_data_dir)
+    # 코퍼스가 없으면 분석 시점에 None 으로 처리되므로 워밍업 실패로 워커를 죽이지 않음
+    TextAnalysis("Warm up the tokenizer. Load the sentence splitter.").blob_counts
+
+@lru_cache
+def _get_scoring_pool() -> Optional[ProcessPoolExecutor]:
+    """CPU 점수 계산용 영속 프로세스 풀 (워커가 2개 미만이면 None -> 직렬)"""
+    processes = _scoring_process_count()
+    if processes < 2:
+        return None
+    # 그래프 실행 스레드가 떠 있는 상태에서 fork 하지 않도록 spawn 사용
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_scoring_worker_init,
+        initargs=(str(NLTK_DATA_DIR),),
+    )
+
+def _analyze_text_batch(texts: List[str]) -> List[Optional[Tuple[int, int]]]:
+    """워커 프로세스: 직렬 경로와 같은 TextAnalysis 코드로 (단어 수, 문장 수) 계산"""
+    return [TextAnalysis(text).blob_counts for text in texts]
+
+def prime_text_analyses(
+    items: List[_T],
+    text_of: Callable[[_T], str],
+    *,
+    readability: bool = False,
+    want: Optional[Callable[[_T], bool]] = None,
+    deadline_at: Optional[float] = None,
+) -> Iterator[_T]:
+    """items 를 그대로 내보내되, 그 전에 프로세스 풀에서 TextBlob 가독성 분석을 미리 채움
+
+    다음 청크를 워커에 보내 둔 채 현재 청크를 소비하므로 계산과 점수 계산이 겹친다.
+    풀이 없거나 결과가 적거나 워커가 실패/마감을 넘기면 남은 항목은 직렬 경로에서 계산된다.
+    """
+    pool = _get_scoring_pool() if len(items) >= PARALLEL_ANALYSIS_MIN_DOCUMENTS else None
+    if pool is None or not readability:
+        yield from items
+        return
+    
+    shards = _scoring_process_count()
+    broken = False
+    
+    def submit(chunk: List[_T]) -> List[Tuple[List[str], Future]]:
+        texts = []
+        for item in chunk:
+            if want is not None and not want(item):
+                continue
+            analysis = analyze_text(text_of(item))
+            if analysis._blob_counts is _UNSET:
+                texts.append(analysis.text)
+        texts = list(dict.fromkeys(texts))
+        size = max(1, -(-len(texts) // shards))
+        batches = [texts[start:start + size] for start in range(0, len(texts), size)]
+        try:
+            return [(batch, pool.submit(_analyze_text_batch, batch)) for batch in batches]
+        except Exception:
+            return []
+    
+    def apply(submitted: List[Tuple[List[str], Future]]) -> None:
+        nonlocal broken
+        for batch, future in submitted:
+            if broken:
+                future.cancel()
+                continue
+            try:
+                timeout = PARALLEL_ANALYSIS_TIMEOUT
+                if deadline_at is not None:
+                    timeout = min(timeout, max(deadline_at - time.time(), 0.0))
+                blob_counts = future.result(timeout=timeout)
+            except Exception as exc:
+                # 마감 초과/워커 오류 -> 나머지는 직렬 계산, 깨진 풀은 정리하고 다음 호출에서 새로 생성
+                broken = True
+                if isinstance(exc, BrokenProcessPool):
+                    _get_scoring_pool.cache_clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                continue
+            for index, text in enumerate(batch):
+                analyze_text(text).prime(blob_counts[index])
+            _record("offloaded_analyses", len(batch))
+    
+    pending: Optional[Tuple[List[_T], List[Tuple[List[str], Future]]]] = None
+    for start in range(0, len(items), _PARALLEL_ANALYSIS_CHUNK):
+        chunk = items[start:start + _PARALLEL_ANALYSIS_CHUNK]
+        submitted = [] if broken else submit(chunk)
+        if pending is not None:
+            apply(pending[1])
+            yield from pending[0]
+        pending = (chunk, submitted)
+    if pending is not None:
+        apply(pending[1])
+        yield from pending[0]
+
+# 배치 감정 분석 (영어 단어 + 한국어 어간 사전)
+# 극성 값은 TextBlob(pattern) 사전과 비슷한 척도 (-1.0 ~ 1.0)
+DEFAULT_SENTIMENT_LEXICON: Dict[str, Any] = {
+    "en": {
+        "good": 0.7, "great": 0.8, "excellent": 1.0, "amazing": 0.6, "awesome": 1.0, "best": 1.0, "better": 0.5,
+        "love": 0.5, "loved": 0.7, "loving": 0.6, "lovely": 0.5, "like": 0.2, "liked": 0.3, "happy": 0.8,
+        "nice": 0.6, "cool": 0.35, "fun": 0.3, "funny": 0.25, "beautiful": 0.85, "perfect": 1.0,
+        "wonderful": 1.0, "fantastic": 0.4, "brilliant": 0.9, "incredible": 0.9, "impressive": 1.0,
+        "helpful": 0.5, "useful": 0.3, "valuable": 0.5, "easy": 0.43, "effective": 0.6, "efficient": 0.5,
+        "successful": 0.75, "success": 0.3, "win": 0.8, "winning": 0.5, "wins": 0.5, "recommend": 0.4,
+        "recommended": 0.4, "favorite": 0.5, "exciting": 0.3, "excited": 0.4, "interesting": 0.5,
+        "inspiring": 0.5, "powerful": 0.3, "positive": 0.23, "glad": 0.5, "enjoy": 0.4, "enjoyed": 0.4,
+        "thanks": 0.2, "thank": 0.2, "grateful": 0.5, "smart": 0.21, "clean": 0.37, "fresh": 0.3,
+        "fast": 0.2, "free": 0.4, "worth": 0.3, "solid": 0.2, "strong": 0.43, "top": 0.5, "viral": 0.2,
+        "popular": 0.6, "trending": 0.2, "growth": 0.2, "proud": 0.8, "satisfied": 0.5, "superb": 1.0,
+        "outstanding": 0.5, "remarkable": 0.75, "genius": 0.6, "epic": 0.6, "wow": 0.1, "yay": 0.5,
+        "okay": 0.5, "ok": 0.5, "fine": 0.42, "decent": 0.17, "sweet": 0.35, "super": 0.33, "pleased": 0.5,
+        "pleasant": 0.73, "clever": 0.17, "safe": 0.5, "delightful": 1.0, "enjoyable": 0.5, "handy": 0.6,
+        "smooth": 0.4, "elegant": 0.5, "gorgeous": 0.7, "lucky": 0.33, "friendly": 0.38, "fabulous": 0.4,
+        "splendid": 0.83, "joy": 0.8, "cute": 0.5, "greatest": 1.0, "loves": 0.5, "likes": 0.2,
+        "bad": -0.7, "worse": -0.4, "worst": -1.0, "terrible": -1.0, "awful": -1.0, "horrible": -1.0,
+        "hate": -0.8, "hated": -0.9, "poor": -0.4, "boring": -1.0, "bored": -0.5, "sad": -0.5,
+        "angry": -0.5, "annoying": -0.8, "annoyed": -0.6, "disappointed": -0.75, "disappointing": -0.6,
+        "fail": -0.5, "failed": -0.5, "failure": -0.3, "fails": -0.5, "broken": -0.4, "wrong": -0.5,
+        "useless": -0.5, "waste": -0.2, "wasted": -0.2, "expensive": -0.5, "difficult": -0.5, "hard": -0.29,
+        "problem": -0.2, "problems": -0.2, "issue": -0.1, "bug": -0.3, "buggy": -0.4, "slow": -0.3,
+        "scam": -0.8, "spam": -0.5, "fake": -0.5, "toxic": -0.7, "ugly": -0.7, "stupid": -0.8,
+        "dumb": -0.38, "ridiculous": -0.33, "lame": -0.5, "sucks": -0.3, "crap": -0.8, "mess": -0.5,
+        "risky": -0.3, "dangerous": -0.6, "painful": -0.7, "frustrating": -0.4, "frustrated": -0.7,
+        "worried": -0.4, "confusing": -0.3, "unfortunately": -0.5, "sorry": -0.5, "negative": -0.3,
+        "overrated": -0.5, "mediocre": -0.5, "disaster": -0.6, "nightmare": -0.6, "regret": -0.5,
+        "weak": -0.38, "sick": -0.71, "dull": -0.29, "unhappy": -0.6, "upset": -0.5, "evil": -1.0,
+        "tired": -0.4, "disgusting": -1.0, "pathetic": -1.0, "weird": -0.5, "crazy": -0.6, "unfortunate": -0.5,
+        "worthless": -0.8, "bland": -0.17, "miserable": -1.0, "dreadful": -1.0, "lousy": -0.5, "poorly": -0.4,
+        "badly": -0.7, "mad": -0.62, "scary": -0.5, "silly": -0.5, "complicated": -0.5,
+    },
+    "ko": {
+        # 어간 접두사 (좋다/좋아요/좋은 -> "좋")
+        "좋": 0.7, "최고": 1.0, "훌륭": 0.8, "멋지": 0.7, "멋져": 0.7, "멋있": 0.7, "대박": 0.8, "행복": 0.8,
+        "감사": 0.6, "고마": 0.6, "고맙": 0.6, "사랑": 0.7, "추천": 0.4, "강추": 0.8, "만족": 0.6,
+        "재밌": 0.6, "재미있": 0.6, "신나": 0.6, "신난": 0.6, "기쁘": 0.7, "기뻐": 0.7, "기쁜": 0.7,
+        "유용": 0.5, "편리": 0.5, "편하": 0.4, "편해": 0.4, "효과적": 0.5, "성공": 0.5, "완벽": 1.0,
+        "굿": 0.6, "짱": 0.7, "예쁘": 0.6, "예뻐": 0.6, "예쁜": 0.6, "귀여": 0.6, "귀엽": 0.6, "아름다": 0.7,
+        "감동": 0.7, "흥미": 0.5, "인상적": 0.6, "탁월": 0.8, "우수": 0.6, "뛰어나": 0.7, "뛰어난": 0.7,
+        "친절": 0.6, "깔끔": 0.5, "유익": 0.6, "꿀팁": 0.6, "든든": 0.5, "기대": 0.3, "희망": 0.4,
+        "나쁘": -0.7, "나빠": -0.7, "나쁜": -0.7, "최악": -1.0, "싫": -0.7, "별로": -0.4, "실망": -0.6,
+        "짜증": -0.8, "화나": -0.6, "화난": -0.6, "슬프": -0.6, "슬퍼": -0.6, "슬픈": -0.6, "불편": -0.5,
+        "불만": -0.6, "불친절": -0.6, "어렵": -0.3, "어려운": -0.3, "어려워": -0.3, "힘들": -0.4,
+        "실패": -0.6, "걱정": -0.4, "위험": -0.5, "비싸": -0.3, "비싼": -0.3, "아쉽": -0.4, "아쉬": -0.4,
+        "후회": -0.6, "지루": -0.6, "재미없": -0.6, "쓰레기": -0.9, "끔찍": -1.0, "형편없": -0.9,
+        "불안": -0.5, "우울": -0.6, "피곤": -0.4, "망했": -0.7, "망하": -0.7, "비추": -0.7, "귀찮": -0.5,
+        "답답": -0.5, "부족": -0.4, "오류": -0.4, "버그": -0.4, "논란": -0.3, "손해": -0.5, "사기꾼": -0.8,
+    },
+    # 바로 다음 감정어를 부정 (토큰 전체 일치)
+    "negators": [
+        "not", "never", "no", "nor", "hardly", "isn", "aren", "wasn", "weren", "don", "doesn", "didn",
+        "couldn", "shouldn", "wouldn", "안", "못",
+    ],
+    # 바로 앞 감정어를 부정 (한국어 부정 보조용언 어간, 예: 좋지 않아요)
+    "post_negators": ["않", "못하", "못해", "못한"],
+}
+# 공백 기준 토큰의 앞뒤에서 떼어 내는 문장 부호
+_TOKEN_PUNCTUATION = "!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~“”‘’…·「」『』《》〈〉"
+
+def load_sentiment_lexicon(path: Optional[str] = None) -> Dict[str, Any]:
+    """감정 사전 로드 - JSON 파일(RESEARCHER_SENTIMENT_LEXICON)의 단어/어간이 기본값에 추가/대체"""
+    lexicon = {
+        key: dict(value) if isinstance(value, dict) else list(value) for key, value in DEFAULT_SENTIMENT_LEXICON.items()
+    }
+    path = path or os.getenv("RESEARCHER_SENTIMENT_LEXICON")
+    if path:
+        with open(path, encoding="utf-8") as lexicon_file:
+            for key, value in json.load(lexicon_file).items():
+                if isinstance(value, dict):
+                    lexicon.setdefault(key, {}).update(value)
+                else:
+                    lexicon[key] = list(value)
+    return lexicon
+
+class _TokenPolarityTable(dict):
+    """토큰 -> 극성 해시 테이블 - 처음 보는 토큰만 어간 접두사로 계산해 저장 (이후엔 dict 조회)"""
+    def __init__(self, resolve: Callable[[str], float], max_entries: int):
+        super().__init__()
+        self._resolve = resolve
+        self._max_entries = max_entries
+    
+    def __missing__(self, token: str) -> float:
+        polarity = self._resolve(token)
+        if len(self) < self._max_entries:
+            self[token] = polarity
+        return polarity
+
+class SentimentLexicon:
+    """사전 기반 배치 감정 분석기 (TextBlob 문서별 파싱 대체)
+
+    문서 묶음을 구분자로 이어 공백 기준으로 한 번에 나누고 토큰 극성을 해시 테이블로 조회한 뒤,
+    numpy bincount 로 문서별 감정어 극성 평균을 구한다. TextBlob 처럼 바로 앞 부정어(not, 안, 못)나
+    바로 뒤 부정 보조용언(않다, 못하다)이 붙은 감정어는 극성에 -0.5 를 곱한다.
+    """
+    _SEPARATOR = "\x00"
+    _JOINER = " \x00 "  # 구분자가 항상 독립 토큰이 되도록 공백으로 감쌈
+    _PRE_NEGATOR = 2.0  # 극성 범위 밖 값으로 토큰 종류 표시
+    _POST_NEGATOR = 3.0
+    _BATCH_SIZE = 4096  # 한 번에 토큰화하는 문서 수 (토큰 목록 메모리 상한)
+    
+    def __init__(self, lexicon: Optional[Dict[str, Any]] = None, max_cached_tokens: int = 200_000):
+        lexicon = lexicon or load_sentiment_lexicon()
+        self._stems: Dict[str, float] = {stem: float(value) for stem, value in lexicon.get("ko", {}).items()}
+        self._stems.update(dict.fromkeys(lexicon.get("post_negators", ()), self._POST_NEGATOR))
+        self._max_stem_length = max(map(len, self._stems), default=0)
+        
+        self._table = _TokenPolarityTable(self._resolve, max_cached_tokens)
+        self._table.update((word.lower(), float(value)) for word, value in lexicon.get("en", {}).items())
+        self._table.update(dict.fromkeys(lexicon.get("negators", ()), self._PRE_NEGATOR))
+        self._table[self._SEPARATOR] = float("nan")
+    
+    def _resolve(self, token: str) -> float:
+        """테이블에 없는 토큰: 문장 부호를 떼고 다시 조회 -> 영어 축약 부정(n't) -> 한국어 어간 접두사"""
+        word = token.strip(_TOKEN_PUNCTUATION)
+        if word != token:
+            return self._table[word]
+        if word.endswith(("n't", "n’t")):
+            return self._PRE_NEGATOR
+        # 가장 긴 어간 우선 (재미없 > 재미)
+        for length in range(min(len(word), self._max_stem_length), 0, -1):
+            polarity = self._stems.get(word[:length])
+            if polarity is not None:
+                return polarity
+        return 0.0
+    
+    def score_batch(self, texts: List[str]):
+        """문서별 극성 (numpy float 배열, 감정어가 없으면 0.0)"""
+        np = _load_dependency("numpy")
+        scores = np.zeros(len(texts))
+        for start in range(0, len(texts), self._BATCH_SIZE):
+            chunk = texts[start:start + self._BATCH_SIZE]
+            joined = (self._JOINER + self._JOINER.join(chunk)).lower()
+            if joined.count(self._SEPARATOR) != len(chunk):
+                # 본문에 구분자 문자가 들어 있으면 지우고 다시 이어 붙임
+                cleaned = (text.replace(self._SEPARATOR, " ") for text in chunk)
+                joined = (self._JOINER + self._JOINER.join(cleaned)).lower()
+            tokens = joined.split()
+            values = np.fromiter(map(self._table.__getitem__, tokens), dtype=np.float64, count=len(tokens))
+            
+            # 구분자(NaN)/부정어/감정어 토큰만 남겨 이후 연산량을 줄임
+            positions = np.flatnonzero(values)
+            marks = values[positions]
+            separators = np.isnan(marks)
+            documents = np.cumsum(separators) - 1
+            pre_negators = marks == self._PRE_NEGATOR
+            post_negators = marks == self._POST_NEGATOR
+            hits = ~(separators | pre_negators | post_negators)
+            adjacent = positions[1:] - positions[:-1] == 1
+            negated = np.zeros(len(marks), dtype=bool)
+            negated[1:] |= pre_negators[:-1] & adjacent
+            negated[:-1] |= post_negators[1:] & adjacent
+            weights = np.where(negated, marks * -0.5, marks)[hits]
+            
+            sums = np.bincount(documents[hits], weights=weights, minlength=len(chunk))
+            counts = np.bincount(documents[hits], minlength=len(chunk))
+            scores[start:start + len(chunk)] = np.divide(sums, counts, out=np.zeros(len(chunk)), where=counts > 0)
+        return scores
+    
+    def polarity(self, text: str) -> float:
+        return float(self.score_batch([text])[0])
+
+@lru_cache
+def get_sentiment_lexicon() -> SentimentLexicon:
+    """기본 감정 분석기 (프로세스당 한 번 컴파일)"""
+    return SentimentLexicon()
+
+def sentiment_distribution(texts: List[str], threshold: float = 0.1) -> Dict[str, int]:
+    """극성 > threshold 긍정, < -threshold 부정, 나머지 중립으로 문서 수 집계"""
+    polarities = get_sentiment_lexicon().score_batch(texts)
+    positive = int((polarities > threshold).sum())
+    negative = int((polarities < -threshold).sum())
+    return {"positive": positive, "neutral": len(texts) - positive - negative, "negative": negative}
+
+# 결과 중복 제거 (URL 정규화 + SimHash 유사 중복)
+_HOST_ALIASES = {
+    "twitter.com": "x.com",
+    "threads.com": "threads.net",
+}
+_HOST_PREFIXES = ("www.", "mobile.", "m.")
+_SIMHASH_MAX_DISTANCE = 3
+_SIMHASH_BANDS = 4  # 거리 3 이하면 16비트 밴드 4개 중 최소 하나는 완전히 일치
+
+def canonicalize_url(url: str) -> str:
+    """같은 게시글을 가리키는 URL 변형(x.com/twitter.com, threads.net/threads.com, 쿼리스트링 등)을 하나로"""
+    if not url:
+        return ""
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    host = _HOST_ALIASES.get(host, host)
+    path = parsed.path.rstrip("/") or "/"
+    return f"{host}{path}" if host else url.strip()
+
+def deduplicate_results(
+    results: List[Dict[str, Any]],
+    quality_key: Callable[[Dict[str, Any]], Any],
+) -> List[Dict[str, Any]]:
+    """정규화 URL 중복과 본문 유사 중복을 제거하고 그룹마다 품질이 가장 높은 대표만 유지
+
+    품질 내림차순으로 한 번 훑으며 SimHash 밴드 버킷으로 후보만 비교하므로 결과 수에 대해 거의 선형.
+    반환 순서는 입력 순서를 유지한다.
+    """
+    order = sorted(range(len(results)), key=lambda index: quality_key(results[index]), reverse=True)
+    seen_urls: Set[str] = set()
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    band_bits = 64 // _SIMHASH_BANDS
+    band_mask = (1 << band_bits) - 1
+    kept: Set[int] = set()
+    
+    for index in order:
+        result = results[index]
+        canonical = canonicalize_url(result.get("url", ""))
+        if canonical:
+            if canonical in seen_urls:
+                continue
+        
+        fingerprint = analyze_text(_content_text(result)).simhash
+        if fingerprint is not None:
+            bands = [(band, (fingerprint >> (band * band_bits)) & band_mask) for band in range(_SIMHASH_BANDS)]
+            if any(
+                bin(fingerprint ^ other).count("1") <= _SIMHASH_MAX_DISTANCE
+                for band in bands
+                for other in buckets.get(band, ())
+            ):
+                continue
+            for band in bands:
+                buckets.setdefault(band, []).append(fingerprint)
+        
+        if canonical:
+            seen_urls.add(canonical)
+        kept.add(index)
+    
+    return [result for index, result in enumerate(results) if index in kept]
+
+def _pre_score_quality(result: Dict[str, Any]) -> Tuple[float, int]:
+    """점수 계산 전 대표 선택용 품질 근사치 (Tavily 관련도, 본문 길이)"""
+    return (result.get("score") or 0.0, len(_content_text(result)))
+
+# 상위 k개 스트리밍 선택
+
+def select_top_k(
+    items: Iterable[_T],
+    k: int,
+    score: Callable[[_T], float],
+    upper_bound: Optional[Callable[[_T], float]] = None,
+) -> List[Tuple[float, _T]]:
+    """크기 k 의 최소 힙으로 상위 k개를 (점수, 항목) 내림차순으로 반환
+
+    `sorted(..., reverse=True)[:k]` 와 같은 결과(동점이면 먼저 들어온 항목 우선)를 보장한다.
+    upper_bound 가 힙 최솟값 이하인 항목은 score 를 계산하지 않고 버린다.
+    """
+    if k <= 0:
+        return []
+    heap: List[Tuple[float, int, _T]] = []
+    for index, item in enumerate(items):
+        if len(heap) >= k and upper_bound is not None and upper_bound(item) <= heap[0][0]:
+            continue
+        entry = (score(item), -index, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    return [(entry[0], entry[2]) for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+
+# 콘텐츠 필터 규칙 엔진
+# 문자열은 부분 문자열 규칙, {"pattern": ..., "regex": true} 는 정규식 규칙 ("id" 로 규칙 ID 지정 가능)
+DEFAULT_CONTENT_RULES: Dict[str, List[Any]] = {
+    "profile": ['/profile/', '/user/', '/u/', '/@', '/about', '/bio'],
+    "reply": [
+        {"id": "status_reply", "pattern": r'/status/\d+/reply', "regex": True},
+        '/thread/', '/comment/', '/replies',
+    ],
+    "spam": ['follow me', 'check bio', 'link in bio', 'dm me', 'subscribe'],
+}
+_URL_RULE_CLASSES = ("profile", "reply")
+_TEXT_RULE_CLASSES = ("spam",)
+
+def _trie_regex(literals: List[str]) -> str:
+    """리터럴 목록을 접두사 트리 형태의 정규식으로 변환 (규칙 수가 늘어도 위치당 비교가 선형으로 늘지 않음)"""
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 더 긴 규칙을 우선 매칭하고, 끝나는 지점이면 생략 가능
+        return f"(?:{pattern})?" if "" in node else pattern
+    
+    return build(trie)
+
+class CompiledRuleSet:
+    """리터럴 규칙은 접두사 트리 정규식 하나로, 정규식 규칙은 규칙별로 스캔해 매칭된 규칙 ID 를 모두 반환
+
+    한 alternation 에 함께 넣으면 같은 위치에서 먼저 매칭된 규칙만 보고되므로 두 종류를 따로 스캔한다.
+    """
+    def __init__(self, rules: List[Tuple[str, str, bool]]):
+        self._literal_ids: Dict[str, List[str]] = {}
+        self._regexes: List[Tuple[str, "re.Pattern[str]"]] = []
+        for rule_id, pattern, is_regex in rules:
+            if is_regex:
+                self._regexes.append((rule_id, re.compile(pattern, re.IGNORECASE)))
+            else:
+                self._literal_ids.setdefault(pattern.lower(), []).append(rule_id)
+        
+        # 같은 위치에서 시작하는 짧은 규칙도 놓치지 않도록 접두사 규칙 ID 를 미리 계산
+        self._prefix_ids: Dict[str, List[str]] = {
+            literal: [
+                rule_id
+                for end in range(1, len(literal) + 1)
+                for rule_id in self._literal_ids.get(literal[:end], [])
+            ]
+            for literal in self._literal_ids
+        }
+        # 전방 탐색으로 감싸 겹치는 매칭도 모든 시작 위치에서 검사
+        self._literal_pattern = (
+            re.compile(f"(?=({_trie_regex(list(self._literal_ids))}))") if self._literal_ids else None
+        )
+    
+    def scan(self, text_lower: str) -> Set[str]:
+        matched: Set[str] = set()
+        if not text_lower:
+            return matched
+        if self._literal_pattern is not None:
+            for match in self._literal_pattern.finditer(text_lower):
+                matched.update(self._prefix_ids[match.group(1)])
+        for rule_id, pattern in self._regexes:
+            if pattern.search(text_lower):
+                matched.add(rule_id)
+        return matched
+
+class ContentRuleEngine:
+    """URL 규칙(profile/reply)과 본문 규칙(spam)을 각각 하나의 컴파일된 규칙 세트로 보관"""
+    def __init__(self, rules: Dict[str, List[Any]]):
+        self.url_rules = CompiledRuleSet(self._flatten(rules, _URL_RULE_CLASSES))
+        self.text_rules = CompiledRuleSet(self._flatten(rules, _TEXT_RULE_CLASSES))
+    
+    @staticmethod
+    def _flatten(rules: Dict[str, List[Any]], rule_classes: Tuple[str, ...]) -> List[Tuple[str, str, bool]]:
+        flattened = []
+        for rule_class in rule_classes:
+            for rule in rules.get(rule_class, []):
+                if isinstance(rule, str):
+                    rule = {"pattern": rule}
+                pattern = rule["pattern"]
+                rule_id = f"{rule_class}:{rule.get('id', pattern)}"
+                flattened.append((rule_id, pattern, bool(rule.get("regex", False))))
+        return flattened
+    
+    def scan_url(self, url: str) -> Set[str]:
+        return self.url_rules.scan(url.lower())
+    
+    def scan_text(self, text_lower: str) -> Set[str]:
+        return self.text_rules.scan(text_lower)
+
+def load_content_rules(path: Optional[str] = None) -> Dict[str, List[Any]]:
+    """콘텐츠 필터 규칙 로드 - JSON 파일(RESEARCHER_CONTENT_RULES)의 규칙 클래스가 기본값을 대체"""
+    rules = dict(DEFAULT_CONTENT_RULES)
+    path = path or os.getenv("RESEARCHER_CONTENT_RULES")
+    if path:
+        with open(path, encoding="utf-8") as rules_file:
+            rules.update(json.load(rules_file))
+    return rules
+
+@lru_cache(maxsize=16)
+def _compile_content_rules(rules_json: str) -> ContentRuleEngine:
+    return ContentRuleEngine(json.loads(rules_json))
+
+def _rule_classes(rule_ids: Set[str]) -> Set[str]:
+    return {rule_id.split(":", 1)[0] for rule_id in rule_ids}
+
 # 콘텐츠 필터링 클래스
 class ContentFilter:
-    def __init__(self):
-        self.profile_patterns = [
-            r'/profile/', r'/user/', r'/u/', r'/@', r'/about', r'/bio'
-        ]
-        self.reply_patterns = [
-            r'/status/\d+/reply', r'/thread/', r'/comment/', r'/replies'
-        ]
-        self.spam_keywords = [
-            'follow me', 'check bio', 'link in bio', 'dm me', 'subscribe'
-        ]
+    def __init__(self, rules: Optional[Dict[str, List[Any]]] = None):
+        rules = rules or load_content_rules()
+        self.profile_patterns = self._patterns(rules, "profile")
+        self.reply_patterns = self._patterns(rules, "reply")
+        self.spam_keywords = self._patterns(rules, "spam")
+        # 같은 규칙이면 컴파일된 엔진을 인스턴스 간 공유
+        self.rule_engine = _compile_content_rules(json.dumps(rules, sort_keys=True, ensure_ascii=False))
+        self._check_valid = lru_cache(maxsize=4096)(self._is_valid)
+    
+    @staticmethod
+    def _patterns(rules: Dict[str, List[Any]], rule_class: str) -> List[str]:
+        return [rule if isinstance(rule, str) else rule["pattern"] for rule in rules.get(rule_class, [])]
+    
+    def match_rules(self, content: Dict[str, Any]) -> Set[str]:
+        """문서에 매칭된 모든 규칙 ID ("클래스:규칙") 반환"""
+        text = _content_text(content)
+        return self.rule_engine.scan_url(content.get('url', '')) | self.rule_engine.scan_text(analyze_text(text).lower)
     
     def is_valid_content(self, content: Dict[str, Any]) -> bool:
-        """콘텐츠 유효성 검사"""
-        url = content.get('url', '')
-        text = content.get('content', '') or content.get('snippet', '')
-        
-        # URL 패턴으로 프로필 페이지 제외
-        if self._is_profile_page(url):
+        """콘텐츠 유효성 검사 (같은 URL/본문은 중복 제거·사전 분석·점수 계산 단계가 한 번의 검사 결과를 공유)"""
+        return self._check_valid(content.get('url', ''), _content_text(content))
+    
+    def _is_valid(self, url: str, text: str) -> bool:
+        # URL 패턴으로 프로필 페이지 / 하위 쓰레드·댓글 제외 (URL 은 한 번만 스캔)
+        url_classes = _rule_classes(self.rule_engine.scan_url(url))
+        if "profile" in url_classes or "reply" in url_classes:
             return False
         
-        # 하위 쓰레드/댓글 제외
-        if self._is_reply_or_comment(url, content):
+        # 답글 특성의 콘텐츠 제외
+        if self._looks_like_reply(text):
             return False
         
         # 텍스트 품질 검사
@@ -456,44 +2640,46 @@ class ContentFilter:
     
     def _is_profile_page(self, url: str) -> bool:
         """프로필 페이지 여부 확인"""
-        return any(pattern in url.lower() for pattern in self.profile_patterns)
+        return "profile" in _rule_classes(self.rule_engine.scan_url(url))
     
     def _is_reply_or_comment(self, url: str, content: Dict[str, Any]) -> bool:
         """답글/댓글 여부 확인"""
         # URL 패턴 확인
-        if any(pattern in url.lower() for pattern in self.reply_patterns):
-            return True
-        
-        # 콘텐츠 구조 확인 (답글 특성)
-        text = content.get('content', '') or content.get('snippet', '')
-        if text.startswith('@') or text.startswith('Re:'):
+        if "reply" in _rule_classes(self.rule_engine.scan_url(url)):
             return True
         
-        return False
+        return self._looks_like_reply(_content_text(content))
+    
+    @staticmethod
+    def _looks_like_reply(text: str) -> bool:
+        """콘텐츠 구조 확인 (답글 특성)"""
+        return text.startswith('@') or text.startswith('Re:')
     
     def _meets_quality_threshold(self, text: str) -> bool:
         """텍스트 품질 임계값 확인"""
-        if not text or len(text.strip()) < 50:
+        if not text:
+            return False
+        analysis = analyze_text(text)
+        if analysis.stripped_length < 50:
             return False
         
         # 의미있는 단어 비율 확인
-        words = text.split()
-        if len(words) < 10:
+        if analysis.token_count < 10:
             return False
         
         return True
     
     def _is_spam_content(self, text: str) -> bool:
         """스팸 콘텐츠 여부 확인"""
-        text_lower = text.lower()
-        spam_count = sum(1 for keyword in self.spam_keywords if keyword in text_lower)
+        spam_count = len(self.rule_engine.scan_text(analyze_text(text).lower))
         
         # 스팸 키워드가 2개 이상이면 스팸으로 판단
         return spam_count >= 2
     
-    def calculate_content_quality(self, content: Dict[str, Any]) -> float:
-        """콘텐츠 품질 점수 계산"""
-        text = content.get('content', '') or content.get('snippet', '')
+    def calculate_content_quality(self, content: Dict[str, Any], include_readability: bool = True) -> float:
+        """콘텐츠 품질 점수 계산 (include_readability=False 면 TextBlob 파싱 없이 기본 가독성 점수 사용)"""
+        text = _content_text(content)
+        analysis = analyze_text(text)
         
         quality_score = 0.0
         
@@ -502,29 +2688,75 @@ class ContentFilter:
         quality_score += length_score
         
         # 언어 품질 점수 (0.2 가중치)
-        try:
-            blob = TextBlob(text)
+        blob_counts = analysis.blob_counts if include_readability else None
+        if blob_counts is not None:
             # 문장 수와 단어 수의 비율로 가독성 측정
-            sentences = len(blob.sentences)
-            words = len(blob.words)
+            words, sentences = blob_counts
             readability = min(words / max(sentences, 1) / 20, 1.0) * 0.2
             quality_score += readability
-        except:
+        else:
             quality_score += 0.1  # 기본 점수
         
         # 정보 밀도 점수 (0.3 가중치)
-        unique_words = len(set(text.lower().split()))
-        total_words = len(text.split())
-        density = (unique_words / max(total_words, 1)) * 0.3
+        density = (analysis.unique_word_count / max(analysis.token_count, 1)) * 0.3
         quality_score += density
         
         # engagement 지표 점수 (0.2 가중치)
-        engagement_indicators = ['?', '!', '#', '@']
-        engagement_count = sum(text.count(indicator) for indicator in engagement_indicators)
-        engagement_score = min(engagement_count / 10, 1.0) * 0.2
+        engagement_score = min(analysis.indicator_count / 10, 1.0) * 0.2
         quality_score += engagement_score
         
         return min(quality_score, 1.0)
+    
+    def quality_upper_bound(self, content: Dict[str, Any]) -> float:
+        """TextBlob 없이 계산하는 품질 점수 상한 (가독성 항목을 최대치 0.2 로 가정)"""
+        text = _content_text(content)
+        analysis = analyze_text(text)
+        
+        # calculate_content_quality 와 같은 순서로 더해야 부동소수 오차 없이 상한이 보장됨
+        bound = min(len(text) / 500, 1.0) * 0.3
+        bound += 0.2
+        bound += (analysis.unique_word_count / max(analysis.token_count, 1)) * 0.3
+        bound += min(analysis.indicator_count / 10, 1.0) * 0.2
+        return min(bound, 1.0)
+    
+    def rank_contents(
+        self,
+        contents: Iterable[Dict[str, Any]],
+        k: int,
+        cpu_budget: Optional[float] = None,
+    ) -> Tuple[List[Tuple[float, Dict[str, Any]]], ScoringTierMetrics]:
+        """계층형 점수 계산으로 상위 k개 선택
+
+        1단계 규칙 필터 -> 2단계 저비용 상한으로 가지치기 -> 3단계 TextBlob 가독성 포함 전체 점수.
+        cpu_budget(초, 스레드 CPU 시간)을 넘기면 남은 결과는 저비용 특성만으로 점수를 매긴다.
+        """
+        metrics = ScoringTierMetrics(
+            candidates=0, rejected_by_filter=0, pruned_by_bound=0, full_scored=0, degraded_scored=0, cpu_seconds=0.0
+        )
+        started = time.thread_time()
+        
+        def valid_contents() -> Iterator[Dict[str, Any]]:
+            for content in contents:
+                metrics["candidates"] += 1
+                if self.is_valid_content(content):
+                    yield content
+                else:
+                    metrics["rejected_by_filter"] += 1
+        
+        def score(content: Dict[str, Any]) -> float:
+            if cpu_budget is not None and time.thread_time() - started >= cpu_budget:
+                metrics["degraded_scored"] += 1
+                return self.calculate_content_quality(content, include_readability=False)
+            metrics["full_scored"] += 1
+            return self.calculate_content_quality(content)
+        
+        # 저비용 점수의 가독성 항목(0.1)도 상한(0.2) 이하이므로 가지치기는 예산 소진 후에도 유효
+        top = select_top_k(valid_contents(), k, score, upper_bound=self.quality_upper_bound)
+        metrics["pruned_by_bound"] = (
+            metrics["candidates"] - metrics["rejected_by_filter"] - metrics["full_scored"] - metrics["degraded_scored"]
+        )
+        metrics["cpu_seconds"] = round(time.thread_time() - started, 6)
+        return top, metrics
 
 # 고급 검색 쿼리 생성기
 class AdvancedSearchQuery:
@@ -566,6 +2798,70 @@ class AdvancedSearchQuery:
         else:
             return base_query
 
+# 분석 컴포넌트 레지스트리
+class ResearchComponents:
+    """그래프 실행 간 공유되는 장수명 분석 객체 묶음
+
+    `config["configurable"]["components"]` 로 주입하면 해당 인스턴스를 사용하고,
+    없으면 프로세스 전역 기본 인스턴스를 사용한다. 테스트에서는 스텁 클라이언트를 넘긴다.
+    """
+    def __init__(
+        self,
+        *,
+        keyword_intelligence: Optional[KeywordIntelligence] = None,
+        content_filter: Optional[ContentFilter] = None,
+        query_generator: Optional[AdvancedSearchQuery] = None,
+        openai_client=None,
+        tavily_client=None,
+        async_openai_client=None,
+        async_tavily_client=None,
+        search_cache: Any = _USE_DEFAULT,
+        search_corpus: Any = _USE_DEFAULT,
+    ):
+        # search_corpus=None 이면 검색 결과를 로컬 키워드 코퍼스에 적재하지 않음
+        self.search_corpus: Optional[SearchCorpus] = get_search_corpus() if search_corpus is _USE_DEFAULT else search_corpus
+        self.keyword_intelligence = keyword_intelligence or KeywordIntelligence(
+            openai_client=openai_client, async_openai_client=async_openai_client, search_corpus=self.search_corpus
+        )
+        self.content_filter = content_filter or ContentFilter()
+        self.query_generator = query_generator or AdvancedSearchQuery()
+        self._tavily_client = tavily_client
+        self._async_tavily_client = async_tavily_client or (
+            _ThreadedTavilyClient(tavily_client) if tavily_client is not None else None
+        )
+        # search_cache=None 이면 캐시 없이 매번 Tavily 호출
+        self.search_cache: Optional[TTLCache] = (
+            get_search_cache() if search_cache is _USE_DEFAULT else search_cache
+        )
+    
+    @property
+    def tavily_client(self) -> "TavilyClient":
+        if self._tavily_client is None:
+            self._tavily_client = _get_tavily_client()
+        return self._tavily_client
+    
+    @property
+    def async_tavily_client(self):
+        # 기본 비동기 클라이언트는 이벤트 루프별로 공유
+        return self._async_tavily_client or _get_async_tavily_client()
+
+_default_components_lock = threading.Lock()
+_default_components: Optional[ResearchComponents] = None
+
+def get_default_components() -> ResearchComponents:
+    """프로세스 전역 기본 컴포넌트 (최초 호출 시 한 번만 생성)"""
+    global _default_components
+    if _default_components is None:
+        with _default_components_lock:
+            if _default_components is None:
+                _default_components = ResearchComponents()
+    return _default_components
+
+def get_components(config: Optional[RunnableConfig] = None) -> ResearchComponents:
+    """그래프 config 에서 컴포넌트 조회 (없으면 기본 인스턴스)"""
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("components") or get_default_components()
+
 # 기존 기본 워크플로우 함수들 (호환성 유지)
 def keyword_planner(state: ResearchState) -> ResearchState:
     """기존 키워드 플래너"""
@@ -582,15 +2878,21 @@ def keyword_planner(state: ResearchState) -> ResearchState:
         },
     }
 
-def search_threads(state: ResearchState) -> ResearchState:
+def search_threads(state: ResearchState, config: Optional[RunnableConfig] = None) -> ResearchState:
     """기존 Threads 검색"""
     queries = state.get("search_queries", {})
     query = queries.get("threads")
-    results: List[Dict[str, Any]] = []
+    results: List[SearchResult] = []
     errors: List[str] = []
     if query:
         try:
-            results = _run_tavily_query(query, include_domains=["threads.com"])
+            components = get_components(config)
+            results = to_search_results(_run_tavily_query(
+                query,
+                include_domains=["threads.com"],
+                client=components.tavily_client,
+                cache=components.search_cache,
+            ), "threads")
         except Exception as exc:
             errors.append(f"Threads search failed: {exc}")
     else:
@@ -601,15 +2903,21 @@ def search_threads(state: ResearchState) -> ResearchState:
         updates["errors"] = errors
     return updates
 
-def search_x(state: ResearchState) -> ResearchState:
+def search_x(state: ResearchState, config: Optional[RunnableConfig] = None) -> ResearchState:
     """기존 X 검색"""
     queries = state.get("search_queries", {})
     query = queries.get("x")
-    results: List[Dict[str, Any]] = []
+    results: List[SearchResult] = []
     errors: List[str] = []
     if query:
         try:
-            results = _run_tavily_query(query, include_domains=["x.com"])
+            components = get_components(config)
+            results = to_search_results(_run_tavily_query(
+                query,
+                include_domains=["x.com"],
+                client=components.tavily_client,
+                cache=components.search_cache,
+            ), "x")
         except Exception as exc:
             errors.append(f"X search failed: {exc}")
     else:
@@ -620,14 +2928,14 @@ def search_x(state: ResearchState) -> ResearchState:
         updates["errors"] = errors
     return updates
 
-def _summarize_platform(platform: str, items: List[Dict[str, Any]]) -> Optional[str]:
+def _summarize_platform(platform: str, items: List[SearchResult]) -> Optional[str]:
     """플랫폼별 요약 생성"""
     if not items:
         return None
 
     highlights: List[str] = []
     for item in items[:2]:  # grab top highlights
-        snippet = item.get("content") or item.get("snippet") or ""
+        snippet = _content_text(item)
         snippet = " ".join(snippet.split())  # collapse whitespace
         if not snippet:
             snippet = "언급된 게시글에 대한 추가 설명 없음"
@@ -654,14 +2962,8 @@ def summarize_results(state: ResearchState) -> ResearchState:
                 "Threads에서 발견된 자료가 없습니다." if platform == "threads" else "X에서 발견된 자료가 없습니다."
             )
 
-        for item in items:
-            reference = {
-                "platform": "Threads" if platform == "threads" else "X",
-                "title": item.get("title") or item.get("url", ""),
-                "url": item.get("url", ""),
-                "snippet": (item.get("content") or item.get("snippet") or "").strip(),
-            }
-            references.append(reference)
+        platform_label = "Threads" if platform == "threads" else "X"
+        references.extend(item.reference(platform_label) for item in to_search_results(items, platform))
 
     if state.get("errors"):
         summary_lines.append("오류: " + " | ".join(state["errors"]))
@@ -670,64 +2972,172 @@ def summarize_results(state: ResearchState) -> ResearchState:
     state["references"] = references
     return state
 
+# 요청 마감 시간 (종단 간 지연 예산)
+# 단계별 최소 잔여 시간 (초) - 남은 예산이 이보다 적으면 해당 단계를 건너뛰거나 저비용 경로로 대체
+STAGE_MIN_BUDGET: Dict[str, float] = {
+    "main_keyword_llm": 1.5,
+    "keyword_breakdown_llm": 2.5,
+    "secondary_searches": 2.0,
+    "platform_search": 0.5,
+    "readability": 1.0,
+    "sentiment": 0.5,
+}
+# 기본 예산 (초, 비우면 무제한) - 요청별로는 config["configurable"]["deadline_seconds"] 또는 state 의 deadline_seconds
+DEFAULT_DEADLINE_SECONDS = os.getenv("RESEARCHER_DEADLINE_SECONDS", "")
+
+def _request_deadline(state, config: Optional[RunnableConfig]) -> Optional[float]:
+    """요청의 절대 마감 시각 (epoch 초) - 첫 노드가 예산으로 계산해 state["deadline_at"] 에 기록
+
+    호출자가 준 configurable deadline_at 이 가장 우선 (체크포인트에서 재개할 때 이전 실행의 마감 시각 대체,
+    None 이면 마감 없음).
+    """
+    configurable = (config or {}).get("configurable") or {}
+    if "deadline_at" in configurable:
+        return float(configurable["deadline_at"]) if configurable["deadline_at"] else None
+    if state.get("deadline_at"):
+        return state["deadline_at"]
+    budget = state.get("deadline_seconds") or configurable.get("deadline_seconds") or DEFAULT_DEADLINE_SECONDS
+    return time.time() + float(budget) if budget else None
+
+def _stage_allowed(deadline_at: Optional[float], stage: str) -> bool:
+    return deadline_at is None or deadline_at - time.time() >= STAGE_MIN_BUDGET[stage]
+
 # 고도화된 워크플로우 함수들
-def extract_main_keyword(state: EnhancedResearchState) -> EnhancedResearchState:
+def extract_main_keyword(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
     """메인 키워드 추출"""
     topic = _normalize_topic(state)
+    deadline_at = _request_deadline(state, config)
+    if state.get("main_keyword"):
+        # 주제 캐시에서 키워드 결과를 받아 시작한 실행은 추출을 건너뜀
+        return _with_deadline({"topic": topic}, deadline_at)
+    allow_llm = _stage_allowed(deadline_at, "main_keyword_llm")
     
     try:
-        keyword_intelligence = KeywordIntelligence()
-        main_keyword = keyword_intelligence.extract_main_keyword(topic)
-        
-        return {
+        keyword_intelligence = get_components(config).keyword_intelligence
+        main_keyword = keyword_intelligence.extract_main_keyword(topic, deadline_at=deadline_at, allow_llm=allow_llm)
+        return _main_keyword_update(topic, main_keyword, deadline_at, allow_llm)
+    except Exception as e:
+        return _with_deadline({
             "topic": topic,
-            "main_keyword": main_keyword,
-            "keyword_strategy": {
-                "phase": "main_keyword_extracted",
-                "confidence": main_keyword["relevance_score"]
-            }
-        }
+            "errors": [f"Main keyword extraction failed: {str(e)}"]
+        }, deadline_at)
+
+async def aextract_main_keyword(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """메인 키워드 추출 (비동기)"""
+    topic = _normalize_topic(state)
+    deadline_at = _request_deadline(state, config)
+    if state.get("main_keyword"):
+        # 주제 캐시에서 키워드 결과를 받아 시작한 실행은 추출을 건너뜀
+        return _with_deadline({"topic": topic}, deadline_at)
+    allow_llm = _stage_allowed(deadline_at, "main_keyword_llm")
+    
+    try:
+        keyword_intelligence = get_components(config).keyword_intelligence
+        main_keyword = await keyword_intelligence.aextract_main_keyword(
+            topic, deadline_at=deadline_at, allow_llm=allow_llm
+        )
+        return _main_keyword_update(topic, main_keyword, deadline_at, allow_llm)
     except Exception as e:
-        return {
+        return _with_deadline({
             "topic": topic,
             "errors": [f"Main keyword extraction failed: {str(e)}"]
+        }, deadline_at)
+
+def _with_deadline(update: EnhancedResearchState, deadline_at: Optional[float]) -> EnhancedResearchState:
+    """첫 노드의 모든 반환 경로에서 마감 시각을 state 에 기록 (이후 노드가 예산을 새로 계산하지 않도록)"""
+    if deadline_at is not None:
+        update["deadline_at"] = deadline_at
+    return update
+
+def _main_keyword_update(
+    topic: str, main_keyword: MainKeyword, deadline_at: Optional[float] = None, allow_llm: bool = True
+) -> EnhancedResearchState:
+    update: EnhancedResearchState = _with_deadline({
+        "topic": topic,
+        "main_keyword": main_keyword,
+        "keyword_strategy": {
+            "phase": "main_keyword_extracted",
+            "confidence": main_keyword["relevance_score"]
         }
+    }, deadline_at)
+    if not allow_llm:
+        update["skipped_stages"] = ["main_keyword_llm"]
+    return update
 
-def generate_keyword_breakdown(state: EnhancedResearchState) -> EnhancedResearchState:
+def generate_keyword_breakdown(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
     """키워드 브레이크다운"""
     main_keyword_data = state.get("main_keyword")
     if not main_keyword_data:
         return {"errors": ["Main keyword not found"]}
+    if state.get("keyword_breakdown"):
+        return {}  # 시드된 브레이크다운 사용
     
     topic = state.get("topic", "")
     main_keyword = main_keyword_data["keyword"]
     
+    deadline_at = _request_deadline(state, config)
+    allow_llm = _stage_allowed(deadline_at, "keyword_breakdown_llm")
+    
     try:
-        keyword_intelligence = KeywordIntelligence()
-        breakdown = keyword_intelligence.generate_keyword_breakdown(main_keyword, topic)
-        
-        return {
-            "keyword_breakdown": breakdown,
-            "keyword_strategy": {
-                **state.get("keyword_strategy", {}),
-                "phase": "breakdown_completed",
-                "breakdown_count": len(breakdown)
-            }
-        }
+        keyword_intelligence = get_components(config).keyword_intelligence
+        breakdown = keyword_intelligence.generate_keyword_breakdown(
+            main_keyword, topic, deadline_at=deadline_at, allow_llm=allow_llm
+        )
+        return _breakdown_update(state, breakdown, allow_llm)
+    except Exception as e:
+        return {"errors": [f"Keyword breakdown failed: {str(e)}"]}
+
+async def agenerate_keyword_breakdown(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """키워드 브레이크다운 (비동기)"""
+    main_keyword_data = state.get("main_keyword")
+    if not main_keyword_data:
+        return {"errors": ["Main keyword not found"]}
+    if state.get("keyword_breakdown"):
+        return {}  # 시드된 브레이크다운 사용
+    
+    topic = state.get("topic", "")
+    main_keyword = main_keyword_data["keyword"]
+    
+    deadline_at = _request_deadline(state, config)
+    allow_llm = _stage_allowed(deadline_at, "keyword_breakdown_llm")
+    
+    try:
+        keyword_intelligence = get_components(config).keyword_intelligence
+        breakdown = await keyword_intelligence.agenerate_keyword_breakdown(
+            main_keyword, topic, deadline_at=deadline_at, allow_llm=allow_llm
+        )
+        return _breakdown_update(state, breakdown, allow_llm)
     except Exception as e:
         return {"errors": [f"Keyword breakdown failed: {str(e)}"]}
 
-def evaluate_sub_keywords(state: EnhancedResearchState) -> EnhancedResearchState:
+def _breakdown_update(
+    state: EnhancedResearchState, breakdown: List[Dict[str, Any]], allow_llm: bool = True
+) -> EnhancedResearchState:
+    update: EnhancedResearchState = {
+        "keyword_breakdown": breakdown,
+        "keyword_strategy": {
+            **state.get("keyword_strategy", {}),
+            "phase": "breakdown_completed",
+            "breakdown_count": len(breakdown)
+        }
+    }
+    if not allow_llm:
+        update["skipped_stages"] = ["keyword_breakdown_llm"]
+    return update
+
+def evaluate_sub_keywords(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
     """서브 키워드 평가 및 선별"""
     breakdown = state.get("keyword_breakdown", [])
     if not breakdown:
         return {"errors": ["Keyword breakdown not found"]}
+    if state.get("selected_sub_keywords"):
+        return {}  # 시드된 서브 키워드 사용
     
     topic = state.get("topic", "")
     main_keyword = state.get("main_keyword", {}).get("keyword", "")
     
     try:
-        keyword_intelligence = KeywordIntelligence()
+        keyword_intelligence = get_components(config).keyword_intelligence
         selected_keywords = keyword_intelligence.evaluate_sub_keywords(breakdown, topic, main_keyword)
         
         return {
@@ -742,7 +3152,7 @@ def evaluate_sub_keywords(state: EnhancedResearchState) -> EnhancedResearchState
     except Exception as e:
         return {"errors": [f"Sub keyword evaluation failed: {str(e)}"]}
 
-def generate_advanced_queries(state: EnhancedResearchState) -> EnhancedResearchState:
+def generate_advanced_queries(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
     """고급 검색 쿼리 생성"""
     main_keyword_data = state.get("main_keyword")
     selected_keywords = state.get("selected_sub_keywords", [])
@@ -754,119 +3164,295 @@ def generate_advanced_queries(state: EnhancedResearchState) -> EnhancedResearchS
     sub_keywords = [kw["keyword"] for kw in selected_keywords]
     
     try:
-        query_generator = AdvancedSearchQuery()
+        query_generator = get_components(config).query_generator
         query_structure = query_generator.generate_queries(main_keyword, sub_keywords)
         
         # 플랫폼별 최적화된 쿼리 생성
         search_queries = {}
+        search_query_plan = {}
+        all_queries = query_structure['primary_queries'] + query_structure['secondary_queries']
+        # 남은 예산이 적으면 서브 키워드 기반 보조 검색 생략
+        skip_secondary = bool(query_structure['secondary_queries']) and not _stage_allowed(
+            _request_deadline(state, config), "secondary_searches"
+        )
+        if skip_secondary:
+            all_queries = query_structure['primary_queries']
         
         for platform in ['threads', 'x']:
             primary_query = query_structure['primary_queries'][0]
             optimized_query = query_generator.optimize_for_platform(primary_query, platform)
             search_queries[platform] = optimized_query
+            # 팬아웃 단계에서 병렬 실행할 전체 쿼리 (대표 쿼리가 맨 앞)
+            search_query_plan[platform] = [
+                query_generator.optimize_for_platform(query, platform) for query in all_queries
+            ]
         
-        return {
+        update: EnhancedResearchState = {
             "search_queries": search_queries,
+            "search_query_plan": search_query_plan,
             "keyword_strategy": {
                 **state.get("keyword_strategy", {}),
                 "phase": "queries_generated",
-                "query_count": len(search_queries)
+                "query_count": len(search_queries),
+                "fanout_query_count": sum(len(queries) for queries in search_query_plan.values())
             }
         }
+        if skip_secondary:
+            update["skipped_stages"] = ["secondary_searches"]
+        return update
     except Exception as e:
         return {"errors": [f"Query generation failed: {str(e)}"]}
 
-def search_threads_enhanced(state: EnhancedResearchState) -> EnhancedResearchState:
-    """고도화된 Threads 검색"""
-    queries = state.get("search_queries", {})
-    query = queries.get("threads")
-    results: List[Dict[str, Any]] = []
+# 고도화된 검색 대상 플랫폼 설정
+_ENHANCED_SEARCH_PLATFORMS: Dict[str, Dict[str, Any]] = {
+    "threads": {"label": "Threads", "include_domains": ["threads.net"]},
+    "x": {"label": "X", "include_domains": ["x.com", "twitter.com"]},
+}
+
+# 팬아웃 검색 동시 실행 한도 (config["configurable"]["max_search_concurrency"] 로 조정)
+SEARCH_CONCURRENCY = int(os.getenv("RESEARCHER_SEARCH_CONCURRENCY", "4"))
+
+def _search_concurrency(config: Optional[RunnableConfig]) -> int:
+    configurable = (config or {}).get("configurable") or {}
+    return max(int(configurable.get("max_search_concurrency") or SEARCH_CONCURRENCY), 1)
+
+# 요청당 점수 계산 CPU 예산 (밀리초, 비우면 무제한) - 플랫폼 검색 노드들이 균등하게 나눠 씀
+SCORING_CPU_BUDGET_MS = os.getenv("RESEARCHER_SCORING_CPU_BUDGET_MS", "")
+
+def _scoring_cpu_budget(config: Optional[RunnableConfig]) -> Optional[float]:
+    configurable = (config or {}).get("configurable") or {}
+    budget_ms = configurable.get("scoring_cpu_budget_ms", SCORING_CPU_BUDGET_MS)
+    if budget_ms in (None, ""):
+        return None
+    return max(float(budget_ms), 0.0) / 1000
+
+def _platform_queries(state: EnhancedResearchState, platform: str) -> List[str]:
+    """플랫폼 검색 쿼리 목록 (팬아웃 계획이 없으면 대표 쿼리 하나)"""
+    planned = (state.get("search_query_plan") or {}).get(platform)
+    if planned:
+        return list(dict.fromkeys(planned))
+    query = state.get("search_queries", {}).get(platform)
+    return [query] if query else []
+
+def _merge_unique_by_url(
+    result_lists: List[List[Dict[str, Any]]], content_filter: Optional["ContentFilter"] = None
+) -> List[Dict[str, Any]]:
+    """쿼리별 결과를 순서대로 합치고 URL 변형/유사 본문 중복 제거 (점수 계산 전)
+
+    content_filter 가 주어지면 필터를 통과하는 결과를 우선 대표로 골라, 유효한 중복본이
+    이후 필터에서 걸러질 사본 때문에 사라지지 않도록 한다.
+    """
+    merged = [result for results in result_lists for result in results]
+    if content_filter is None:
+        return deduplicate_results(merged, _pre_score_quality)
+    return deduplicate_results(
+        merged, lambda result: (content_filter.is_valid_content(result), *_pre_score_quality(result))
+    )
+
+def _rank_platform_results(
+    raw_results: Iterable[SearchResult],
+    platform: str,
+    content_filter: ContentFilter,
+    cpu_budget: Optional[float] = None,
+) -> Tuple[List[SearchResult], ScoringTierMetrics]:
+    """콘텐츠 필터링 + 계층형 품질 점수 계산 후 상위 5개와 단계별 통계 반환"""
+    top_results, metrics = content_filter.rank_contents(raw_results, 5, cpu_budget=cpu_budget)
+    
+    label = sys.intern(platform)
+    ranked = []
+    for quality_score, result in top_results:
+        result.quality_score = quality_score
+        result.platform = label
+        ranked.append(result)
+    return ranked, metrics
+
+def _platform_scoring_budget(
+    config: Optional[RunnableConfig], deadline_at: Optional[float], platform: str, skipped: List[str]
+) -> Optional[float]:
+    """플랫폼 노드의 점수 계산 CPU 예산 (요청 예산의 플랫폼 수 분의 1)
+
+    마감이 임박하면 0 (TextBlob 가독성 없이 저비용 특성만 사용).
+    """
+    if not _stage_allowed(deadline_at, "readability"):
+        skipped.append(f"readability:{platform}")
+        return 0.0
+    budget = _scoring_cpu_budget(config)
+    if budget is None:
+        return None
+    return budget / len(_ENHANCED_SEARCH_PLATFORMS)
+
+def _collect_and_rank(
+    result_lists: List[List[Dict[str, Any]]],
+    platform: str,
+    components: "ResearchComponents",
+    cpu_budget: Optional[float],
+    deadline_at: Optional[float] = None,
+) -> Tuple[List[SearchResult], ScoringTierMetrics]:
+    """쿼리별 결과 병합/중복 제거 -> 로컬 키워드 코퍼스 적재 -> 레코드 변환 후 점수 계산"""
+    merged = _merge_unique_by_url(result_lists, components.content_filter)
+    if components.search_corpus is not None:
+        components.search_corpus.add_results(merged)
+    # 캐시에 보관된 원본 dict 는 건드리지 않고, 중복 제거 후 남은 결과만 레코드로 변환
+    records = to_search_results(merged, platform)
+    content_filter = components.content_filter
+    # 결과가 많으면 가독성(TextBlob 문장 파싱)을 프로세스 풀에서 미리 계산 (예산 0 이면 가독성 자체를 생략)
+    primed = prime_text_analyses(
+        records, _content_text, readability=cpu_budget != 0, want=content_filter.is_valid_content, deadline_at=deadline_at
+    )
+    return _rank_platform_results(primed, platform, content_filter, cpu_budget)
+
+def _enhanced_platform_search(
+    state: EnhancedResearchState, config: Optional[RunnableConfig], platform: str
+) -> EnhancedResearchState:
+    """플랫폼별 고도화된 검색 - 계획된 쿼리를 제한된 동시성으로 병렬 실행"""
+    settings = _ENHANCED_SEARCH_PLATFORMS[platform]
+    queries = _platform_queries(state, platform)
+    results: List[SearchResult] = []
+    metrics: Optional[ScoringTierMetrics] = None
     errors: List[str] = []
+    skipped: List[str] = []
+    deadline_at = _request_deadline(state, config)
     
-    if query:
-        try:
-            client = _get_tavily_client()
-            response = client.search(
-                query=query,
+    if queries and not _stage_allowed(deadline_at, "platform_search"):
+        skipped.append(f"platform_search:{platform}")
+    elif queries:
+        components = get_components(config)
+        
+        def run(query: str) -> List[Dict[str, Any]]:
+            return _run_tavily_query(
+                query,
                 max_results=10,  # 더 많은 결과 수집
-                search_depth="advanced",
-                include_answer=False,
-                include_raw_content=False,
-                include_domains=["threads.net"]
+                include_domains=settings["include_domains"],
+                client=components.tavily_client,
+                cache=components.search_cache,
+                deadline_at=deadline_at,
             )
-            raw_results = response.get("results", [])
-            
-            # 콘텐츠 필터링 적용
-            content_filter = ContentFilter()
-            filtered_results = []
-            
-            for result in raw_results:
-                if content_filter.is_valid_content(result):
-                    # 품질 점수 계산
-                    quality_score = content_filter.calculate_content_quality(result)
-                    result['quality_score'] = quality_score
-                    result['platform'] = 'threads'
-                    filtered_results.append(result)
-            
-            # 품질 점수 기준으로 정렬
-            results = sorted(filtered_results, key=lambda x: x.get('quality_score', 0), reverse=True)[:5]
-            
+        
+        result_lists: List[List[Dict[str, Any]]] = []
+        with ThreadPoolExecutor(max_workers=min(_search_concurrency(config), len(queries))) as executor:
+            # 노드 계측 카운터가 작업 스레드에서도 보이도록 컨텍스트 복사
+            futures = [executor.submit(contextvars.copy_context().run, run, query) for query in queries]
+            for future in futures:
+                try:
+                    result_lists.append(future.result())
+                except Exception as exc:
+                    errors.append(f"Enhanced {settings['label']} search failed: {exc}")
+        
+        try:
+            cpu_budget = _platform_scoring_budget(config, deadline_at, platform, skipped)
+            results, metrics = _collect_and_rank(result_lists, platform, components, cpu_budget, deadline_at)
         except Exception as exc:
-            errors.append(f"Enhanced Threads search failed: {exc}")
+            errors.append(f"Enhanced {settings['label']} search failed: {exc}")
     else:
-        errors.append("Threads search skipped: query missing.")
+        errors.append(f"{settings['label']} search skipped: query missing.")
 
-    updates: EnhancedResearchState = {"search_results": {"threads": results}}
+    updates: EnhancedResearchState = {"search_results": {platform: results}}
+    if metrics is not None:
+        updates["scoring_metrics"] = {platform: metrics}
+    if skipped:
+        updates["skipped_stages"] = skipped
     if errors:
         updates["errors"] = errors
     return updates
 
-def search_x_enhanced(state: EnhancedResearchState) -> EnhancedResearchState:
-    """고도화된 X 검색"""
-    queries = state.get("search_queries", {})
-    query = queries.get("x")
-    results: List[Dict[str, Any]] = []
+async def _aenhanced_platform_search(
+    state: EnhancedResearchState, config: Optional[RunnableConfig], platform: str
+) -> EnhancedResearchState:
+    """플랫폼별 고도화된 검색 (비동기) - 점수 계산은 이벤트 루프를 막지 않도록 스레드에서 실행"""
+    settings = _ENHANCED_SEARCH_PLATFORMS[platform]
+    queries = _platform_queries(state, platform)
+    results: List[SearchResult] = []
+    metrics: Optional[ScoringTierMetrics] = None
     errors: List[str] = []
+    skipped: List[str] = []
+    deadline_at = _request_deadline(state, config)
     
-    if query:
+    if queries and not _stage_allowed(deadline_at, "platform_search"):
+        skipped.append(f"platform_search:{platform}")
+    elif queries:
+        components = get_components(config)
+        semaphore = asyncio.Semaphore(_search_concurrency(config))
+        
+        async def run(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await _arun_tavily_query(
+                    query,
+                    max_results=10,
+                    include_domains=settings["include_domains"],
+                    client=components.async_tavily_client,
+                    cache=components.search_cache,
+                    deadline_at=deadline_at,
+                )
+        
+        result_lists: List[List[Dict[str, Any]]] = []
+        for outcome in await asyncio.gather(*(run(query) for query in queries), return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                errors.append(f"Enhanced {settings['label']} search failed: {outcome}")
+            else:
+                result_lists.append(outcome)
+        
         try:
-            client = _get_tavily_client()
-            response = client.search(
-                query=query,
-                max_results=10,
-                search_depth="advanced",
-                include_answer=False,
-                include_raw_content=False,
-                include_domains=["x.com", "twitter.com"]
+            # SimHash 계산과 점수 계산 모두 CPU 작업이므로 이벤트 루프 밖에서 수행
+            cpu_budget = _platform_scoring_budget(config, deadline_at, platform, skipped)
+            results, metrics = await asyncio.to_thread(
+                _collect_and_rank, result_lists, platform, components, cpu_budget, deadline_at
             )
-            raw_results = response.get("results", [])
-            
-            # 콘텐츠 필터링 적용
-            content_filter = ContentFilter()
-            filtered_results = []
-            
-            for result in raw_results:
-                if content_filter.is_valid_content(result):
-                    quality_score = content_filter.calculate_content_quality(result)
-                    result['quality_score'] = quality_score
-                    result['platform'] = 'x'
-                    filtered_results.append(result)
-            
-            results = sorted(filtered_results, key=lambda x: x.get('quality_score', 0), reverse=True)[:5]
-            
         except Exception as exc:
-            errors.append(f"Enhanced X search failed: {exc}")
+            errors.append(f"Enhanced {settings['label']} search failed: {exc}")
     else:
-        errors.append("X search skipped: query missing.")
+        errors.append(f"{settings['label']} search skipped: query missing.")
 
-    updates: EnhancedResearchState = {"search_results": {"x": results}}
+    updates: EnhancedResearchState = {"search_results": {platform: results}}
+    if metrics is not None:
+        updates["scoring_metrics"] = {platform: metrics}
+    if skipped:
+        updates["skipped_stages"] = skipped
     if errors:
         updates["errors"] = errors
     return updates
 
-def analyze_engagement_potential(state: EnhancedResearchState) -> EnhancedResearchState:
-    """engagement 잠재력 분석"""
+def search_threads_enhanced(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """고도화된 Threads 검색"""
+    return _enhanced_platform_search(state, config, "threads")
+
+async def asearch_threads_enhanced(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """고도화된 Threads 검색 (비동기)"""
+    return await _aenhanced_platform_search(state, config, "threads")
+
+def search_x_enhanced(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """고도화된 X 검색"""
+    return _enhanced_platform_search(state, config, "x")
+
+async def asearch_x_enhanced(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """고도화된 X 검색 (비동기)"""
+    return await _aenhanced_platform_search(state, config, "x")
+
+def deduplicate_platform_results(state: EnhancedResearchState) -> EnhancedResearchState:
+    """플랫폼 간 교차 게시/유사 중복 제거 - 품질 점수가 높은 대표만 filtered_results 에 남김"""
     search_results = state.get("search_results", {})
+    # 점수 계산 단계에서 라벨이 붙은 레코드는 복사 없이 그대로 공유
+    tagged = [
+        result.with_platform(platform)
+        for platform, results in search_results.items()
+        for result in to_search_results(results, platform)
+    ]
+    unique = deduplicate_results(tagged, lambda result: result.quality_score or 0)
+    
+    filtered_results: Dict[str, List[SearchResult]] = {platform: [] for platform in search_results}
+    for result in unique:
+        filtered_results.setdefault(result.platform, []).append(result)
+    return {"filtered_results": filtered_results}
+
+def _final_results(state: EnhancedResearchState) -> Dict[str, List[SearchResult]]:
+    """중복 제거 단계 결과가 있으면 그것을, 없으면 원본 검색 결과 사용"""
+    if "filtered_results" in state:
+        return state["filtered_results"]
+    return state.get("search_results", {})
+
+def analyze_engagement_potential(state: EnhancedResearchState, config: Optional[RunnableConfig] = None) -> EnhancedResearchState:
+    """engagement 잠재력 분석 (마감이 임박하면 감정 분석 생략)"""
+    search_results = _final_results(state)
+    analyze_sentiment = _stage_allowed(_request_deadline(state, config), "sentiment")
     
     engagement_metrics = {
         "total_content_analyzed": 0,
@@ -894,21 +3480,14 @@ def analyze_engagement_potential(state: EnhancedResearchState) -> EnhancedResear
         engagement_metrics["average_quality_score"] = sum(
             r.get('quality_score', 0) for r in all_results
         ) / len(all_results)
-        
-        # 감정 분석
-        for result in all_results:
-            text = result.get('content', '') or result.get('snippet', '')
-            try:
-                blob = TextBlob(text)
-                sentiment = blob.sentiment.polarity
-                if sentiment > 0.1:
-                    engagement_metrics["sentiment_distribution"]["positive"] += 1
-                elif sentiment < -0.1:
-                    engagement_metrics["sentiment_distribution"]["negative"] += 1
-                else:
-                    engagement_metrics["sentiment_distribution"]["neutral"] += 1
-            except:
-                engagement_metrics["sentiment_distribution"]["neutral"] += 1
+    
+    if all_results and not analyze_sentiment:
+        engagement_metrics["sentiment_distribution"] = {}
+        return {"engagement_metrics": engagement_metrics, "skipped_stages": ["sentiment"]}
+    
+    if all_results:
+        # 감정 분석 (영어/한국어 사전으로 전체 결과를 한 번에 채점)
+        engagement_metrics["sentiment_distribution"] = sentiment_distribution([_content_text(result) for result in all_results])
     
     return {"engagement_metrics": engagement_metrics}
 
@@ -917,7 +3496,7 @@ def generate_content_strategy(state: EnhancedResearchState) -> EnhancedResearchS
     main_keyword = state.get("main_keyword", {})
     selected_keywords = state.get("selected_sub_keywords", [])
     engagement_metrics = state.get("engagement_metrics", {})
-    search_results = state.get("search_results", {})
+    search_results = _final_results(state)
     
     # 액션 가능한 인사이트 생성
     actionable_insights = []
@@ -1035,7 +3614,7 @@ def summarize_enhanced_results(state: EnhancedResearchState) -> EnhancedResearch
     """고도화된 결과 요약"""
     main_keyword = state.get("main_keyword", {})
     selected_keywords = state.get("selected_sub_keywords", [])
-    search_results = state.get("search_results", {})
+    search_results = _final_results(state)
     actionable_insights = state.get("actionable_insights", [])
     engagement_metrics = state.get("engagement_metrics", {})
     
@@ -1068,8 +3647,7 @@ def summarize_enhanced_results(state: EnhancedResearchState) -> EnhancedResearch
             
             # 상위 2개 하이라이트
             for item in items[:2]:
-                snippet = item.get("content") or item.get("snippet") or ""
-                snippet = " ".join(snippet.split())
+                snippet = " ".join(_content_text(item).split())
                 if len(snippet) > 150:
                     snippet = snippet[:147] + "..."
                 summary_lines.append(f"    • {snippet}")
@@ -1077,15 +3655,8 @@ def summarize_enhanced_results(state: EnhancedResearchState) -> EnhancedResearch
             summary_lines.append(f"  {platform_label}: 관련 콘텐츠를 찾지 못했습니다.")
         
         # 참조 링크 수집
-        for item in items:
-            reference = {
-                "platform": platform_label,
-                "title": item.get("title") or item.get("url", ""),
-                "url": item.get("url", ""),
-                "snippet": (item.get("content") or item.get("snippet") or "").strip(),
-                "quality_score": item.get("quality_score", 0)
-            }
-            references.append(reference)
+        for item in to_search_results(items, platform):
+            references.append({**item.reference(platform_label), "quality_score": item.quality_score or 0})
     
     # engagement 메트릭 요약
     if engagement_metrics:
@@ -1106,24 +3677,186 @@ def summarize_enhanced_results(state: EnhancedResearchState) -> EnhancedResearch
         for insight in actionable_insights[:3]:  # 상위 3개만 표시
             summary_lines.append(f"  • {insight}")
     
+    # 시간 예산으로 생략된 단계
+    if state.get("skipped_stages"):
+        summary_lines.append("\n⏱️ 시간 예산 부족으로 생략/간소화된 단계: " + ", ".join(state["skipped_stages"]))
+    
     # 에러 메시지 추가
     if state.get("errors"):
         summary_lines.append("\n⚠️ 처리 중 발생한 이슈:")
         for error in state["errors"]:
             summary_lines.append(f"  • {error}")
     
+    # 실행 시간 통계 (요약 노드 이전 단계까지) - API 라우트에서 로깅
+    node_timings = state.get("node_timings", {})
+    
     return {
         "summary": "\n".join(summary_lines),
-        "references": references
+        "references": references,
+        "keyword_strategy": {
+            **state.get("keyword_strategy", {}),
+            "node_timings": node_timings,
+            "total_node_wall_seconds": round(sum(timing["wall_seconds"] for timing in node_timings.values()), 6),
+        },
     }
 
+# 계측 (노드별 지연 시간 / 외부 호출 / 토큰 / 캐시 적중)
+class NodeMetrics(TypedDict):
+    graph: str
+    node: str
+    started_at: float  # epoch 초
+    wall_seconds: float
+    cpu_seconds: float  # 노드를 실행한 스레드의 CPU 시간 (팬아웃 작업 스레드 제외)
+    openai_calls: int
+    openai_prompt_tokens: int
+    openai_completion_tokens: int
+    tavily_calls: int
+    tavily_results: int
+    cache_hits: int
+    cache_misses: int
+    offloaded_analyses: int  # 스코어링 프로세스 풀에서 미리 계산한 TextBlob 분석 수
+    error: Optional[str]
+
+_NODE_COUNTER_NAMES = (
+    "openai_calls", "openai_prompt_tokens", "openai_completion_tokens",
+    "tavily_calls", "tavily_results", "cache_hits", "cache_misses", "offloaded_analyses",
+)
+
+# 실행 중인 노드의 카운터 (팬아웃 스레드/태스크에는 컨텍스트 복사로 전달되어 같은 dict 를 공유)
+_node_counters: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar(
+    "researcher_node_counters", default=None
+)
+_counter_lock = threading.Lock()
+
+def _record(counter: str, amount: int = 1) -> None:
+    """현재 노드 카운터 증가 (계측 중인 노드 밖이면 무시)"""
+    counters = _node_counters.get()
+    if counters is not None and amount:
+        with _counter_lock:
+            counters[counter] += amount
+
+def _record_openai_usage(response: Any) -> None:
+    _record("openai_calls")
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        _record("openai_prompt_tokens", getattr(usage, "prompt_tokens", 0) or 0)
+        _record("openai_completion_tokens", getattr(usage, "completion_tokens", 0) or 0)
+
+class InMemorySink:
+    """노드 메트릭을 메모리에 보관 (테스트/디버깅용)"""
+    def __init__(self):
+        self.records: List[NodeMetrics] = []
+        self._lock = threading.Lock()
+    
+    def emit(self, metrics: NodeMetrics) -> None:
+        with self._lock:
+            self.records.append(metrics)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+class JsonlSink:
+    """노드 메트릭을 JSON Lines 파일에 한 줄씩 추가"""
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+    
+    def emit(self, metrics: NodeMetrics) -> None:
+        line = json.dumps(metrics, ensure_ascii=False)
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+class OpenTelemetrySink:
+    """노드 메트릭을 OpenTelemetry span 으로 내보냄 (opentelemetry-api 필요)"""
+    def __init__(self, tracer=None):
+        if tracer is None:
+            tracer = _load_dependency("opentelemetry.trace").get_tracer("researcher")
+        self.tracer = tracer
+    
+    def emit(self, metrics: NodeMetrics) -> None:
+        started_ns = int(metrics["started_at"] * 1e9)
+        span = self.tracer.start_span(f"{metrics['graph']}.{metrics['node']}", start_time=started_ns)
+        span.set_attributes({
+            f"researcher.{key}": value for key, value in metrics.items() if value is not None
+        })
+        span.end(end_time=started_ns + int(metrics["wall_seconds"] * 1e9))
+
+# 기본 싱크 (config["configurable"]["instrumentation_sink"] 가 우선, RESEARCHER_METRICS_PATH 지정 시 JSONL)
+_default_sink: Any = JsonlSink(os.environ["RESEARCHER_METRICS_PATH"]) if os.getenv("RESEARCHER_METRICS_PATH") else None
+
+def set_instrumentation_sink(sink: Any) -> None:
+    """기본 계측 싱크 교체 (None 이면 state 의 node_timings 에만 기록)"""
+    global _default_sink
+    _default_sink = sink
+
+def _node_timing(metrics: NodeMetrics) -> Dict[str, Any]:
+    """state 에 남기는 요약 (싱크로 보내는 기록에서 식별 필드 제외)"""
+    return {key: value for key, value in metrics.items() if key not in ("graph", "node", "started_at")}
+
+def _instrumented(graph_name: str, node_name: str, func: Callable, afunc: Optional[Callable] = None) -> RunnableLambda:
+    """노드를 감싸 실행 시간/외부 호출을 측정하고 node_timings 와 싱크에 기록"""
+    passes_config = "config" in inspect.signature(func).parameters
+    
+    def start() -> Tuple[Dict[str, int], contextvars.Token, float, float, float]:
+        counters = dict.fromkeys(_NODE_COUNTER_NAMES, 0)
+        return counters, _node_counters.set(counters), time.time(), time.perf_counter(), time.thread_time()
+    
+    def finish(state_update, config, counters, token, started_at, wall_start, cpu_start, error):
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.thread_time() - cpu_start
+        _node_counters.reset(token)
+        metrics = NodeMetrics(
+            graph=graph_name,
+            node=node_name,
+            started_at=started_at,
+            wall_seconds=round(wall_seconds, 6),
+            cpu_seconds=round(cpu_seconds, 6),
+            error=error,
+            **counters,
+        )
+        sink = ((config or {}).get("configurable") or {}).get("instrumentation_sink", _default_sink)
+        if sink is not None:
+            try:
+                sink.emit(metrics)
+            except Exception:
+                pass  # 계측 실패가 리서치 실행을 막지 않도록
+        if isinstance(state_update, dict):
+            state_update = {**state_update, "node_timings": {node_name: _node_timing(metrics)}}
+        return state_update
+    
+    def run(state, config: RunnableConfig):
+        counters, token, *clock = start()
+        try:
+            update = func(state, config) if passes_config else func(state)
+        except Exception as exc:
+            finish(None, config, counters, token, *clock, error=repr(exc))
+            raise
+        return finish(update, config, counters, token, *clock, error=None)
+    
+    async def arun(state, config: RunnableConfig):
+        counters, token, *clock = start()
+        try:
+            if afunc is not None:
+                update = await afunc(state, config)
+            else:
+                # 동기 노드는 이벤트 루프를 막지 않도록 스레드에서 실행 (to_thread 가 계측 컨텍스트도 복사)
+                args = (state, config) if passes_config else (state,)
+                update = await asyncio.to_thread(func, *args)
+        except Exception as exc:
+            finish(None, config, counters, token, *clock, error=repr(exc))
+            raise
+        return finish(update, config, counters, token, *clock, error=None)
+    
+    return RunnableLambda(run, afunc=arun, name=node_name)
+
 # 기존 기본 워크플로우 (호환성 유지)
 basic_graph = StateGraph(ResearchState)
 
-basic_graph.add_node("Keyword Planner", keyword_planner)
-basic_graph.add_node("Threads Search", search_threads)
-basic_graph.add_node("X Search", search_x)
-basic_graph.add_node("Summarize", summarize_results)
+basic_graph.add_node("Keyword Planner", _instrumented("basic", "Keyword Planner", keyword_planner))
+basic_graph.add_node("Threads Search", _instrumented("basic", "Threads Search", search_threads))
+basic_graph.add_node("X Search", _instrumented("basic", "X Search", search_x))
+basic_graph.add_node("Summarize", _instrumented("basic", "Summarize", summarize_results))
 
 basic_graph.set_entry_point("Keyword Planner")
 basic_graph.add_edge("Keyword Planner", "Threads Search")
@@ -1135,16 +3868,21 @@ basic_graph.add_edge("Summarize", END)
 # 고도화된 워크플로우
 enhanced_graph = StateGraph(EnhancedResearchState)
 
-# 노드 추가
-enhanced_graph.add_node("Main Keyword Extractor", extract_main_keyword)
-enhanced_graph.add_node("Keyword Breakdown", generate_keyword_breakdown)
-enhanced_graph.add_node("Sub Keyword Evaluator", evaluate_sub_keywords)
-enhanced_graph.add_node("Advanced Query Generator", generate_advanced_queries)
-enhanced_graph.add_node("Enhanced Threads Search", search_threads_enhanced)
-enhanced_graph.add_node("Enhanced X Search", search_x_enhanced)
-enhanced_graph.add_node("Engagement Analyzer", analyze_engagement_potential)
-enhanced_graph.add_node("Strategy Generator", generate_content_strategy)
-enhanced_graph.add_node("Enhanced Summarizer", summarize_enhanced_results)
+# 노드 추가 (I/O 노드는 invoke/stream 에서는 동기, ainvoke/astream 에서는 비동기 구현으로 실행)
+_ENHANCED_NODES = (
+    ("Main Keyword Extractor", extract_main_keyword, aextract_main_keyword),
+    ("Keyword Breakdown", generate_keyword_breakdown, agenerate_keyword_breakdown),
+    ("Sub Keyword Evaluator", evaluate_sub_keywords, None),
+    ("Advanced Query Generator", generate_advanced_queries, None),
+    ("Enhanced Threads Search", search_threads_enhanced, asearch_threads_enhanced),
+    ("Enhanced X Search", search_x_enhanced, asearch_x_enhanced),
+    ("Result Deduplicator", deduplicate_platform_results, None),
+    ("Engagement Analyzer", analyze_engagement_potential, None),
+    ("Strategy Generator", generate_content_strategy, None),
+    ("Enhanced Summarizer", summarize_enhanced_results, None),
+)
+for _node_name, _func, _afunc in _ENHANCED_NODES:
+    enhanced_graph.add_node(_node_name, _instrumented("enhanced", _node_name, _func, _afunc))
 
 # 워크플로우 연결
 enhanced_graph.set_entry_point("Main Keyword Extractor")
@@ -1153,8 +3891,9 @@ enhanced_graph.add_edge("Keyword Breakdown", "Sub Keyword Evaluator")
 enhanced_graph.add_edge("Sub Keyword Evaluator", "Advanced Query Generator")
 enhanced_graph.add_edge("Advanced Query Generator", "Enhanced Threads Search")
 enhanced_graph.add_edge("Advanced Query Generator", "Enhanced X Search")
-enhanced_graph.add_edge("Enhanced Threads Search", "Engagement Analyzer")
-enhanced_graph.add_edge("Enhanced X Search", "Engagement Analyzer")
+enhanced_graph.add_edge("Enhanced Threads Search", "Result Deduplicator")
+enhanced_graph.add_edge("Enhanced X Search", "Result Deduplicator")
+enhanced_graph.add_edge("Result Deduplicator", "Engagement Analyzer")
 enhanced_graph.add_edge("Engagement Analyzer", "Strategy Generator")
 enhanced_graph.add_edge("Strategy Generator", "Enhanced Summarizer")
 enhanced_graph.add_edge("Enhanced Summarizer", END)
@@ -1164,4 +3903,518 @@ app = basic_graph.compile()  # 기존 기본 앱 (기본값)
 enhanced_app = enhanced_graph.compile()  # 고도화된 앱
 
 # 편의를 위한 별칭
-graph = basic_graph  # 기존 호환성
\ No newline at end of file
+graph = basic_graph  # 기존 호환성
+
+# 체크포인트 (실패/중단된 실행 재개, 같은 주제 재실행 시 키워드 단계 재사용)
+CHECKPOINT_PATH = Path(
+    os.getenv("RESEARCHER_CHECKPOINT_PATH", Path(__file__).resolve().parent / ".researcher_checkpoints.sqlite3")
+)
+# 같은 주제의 키워드 인텔리전스 결과를 재사용하는 기간 (초, 0 이면 재사용 안 함)
+KEYWORD_REUSE_SECONDS = float(os.getenv("RESEARCHER_KEYWORD_REUSE_SECONDS", "86400"))
+# 재사용 시 가져오는 키워드 단계 (Main Keyword Extractor ~ Sub Keyword Evaluator) 결과
+_KEYWORD_STAGE_KEYS = ("main_keyword", "keyword_breakdown", "selected_sub_keywords", "keyword_strategy")
+_KEYWORD_LLM_STAGES = frozenset(("main_keyword_llm", "keyword_breakdown_llm"))
+
+@lru_cache
+def get_checkpointed_enhanced_app(path: Optional[str] = None):
+    """SQLite 체크포인터로 컴파일한 enhanced_app (langgraph-checkpoint-sqlite 필요)
+
+    thread_id 별로 노드(슈퍼스텝)가 끝날 때마다 상태를 저장한다. 병렬 노드 중 일부만 실패하면
+    성공한 노드의 결과도 보관되므로 재개 시 실패한 노드만 다시 실행된다.
+    """
+    try:
+        sqlite_saver = importlib.import_module("langgraph.checkpoint.sqlite").SqliteSaver
+        jsonplus = importlib.import_module("langgraph.checkpoint.serde.jsonplus")
+    except ImportError as exc:
+        raise ImportError(
+            "langgraph-checkpoint-sqlite package is required for checkpointed runs. Please install it."
+        ) from exc
+    conn = sqlite3.connect(str(path or CHECKPOINT_PATH), check_same_thread=False, timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    serde = jsonplus.JsonPlusSerializer(allowed_msgpack_modules=[(SearchResult.__module__, SearchResult.__name__)])
+    return enhanced_graph.compile(checkpointer=sqlite_saver(conn, serde=serde))
+
+def _topic_key(topic: str) -> str:
+    return " ".join(topic.split()).casefold()
+
+def _reusable_keyword_state(checkpointer, topic_key: str, max_age: float) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """max_age 초 안에 같은 주제로 키워드 단계를 (LLM 생략 없이) 마친 체크포인트의 (thread_id, 키워드 결과)"""
+    if max_age <= 0:
+        return None
+    cutoff = time.time() - max_age
+    # 체크포인트 ID 는 시간순이므로 최신 것부터 보다가 기간을 벗어나면 중단
+    for checkpoint_tuple in checkpointer.list(None, filter={"research_topic": topic_key}):
+        checkpoint = checkpoint_tuple.checkpoint
+        if datetime.fromisoformat(checkpoint["ts"]).timestamp() < cutoff:
+            break
+        values = checkpoint["channel_values"]
+        if not values.get("main_keyword") or not values.get("selected_sub_keywords"):
+            continue
+        if _KEYWORD_LLM_STAGES.intersection(values.get("skipped_stages") or ()):
+            continue  # 마감 때문에 LLM 없이 만든 대체 결과는 재사용하지 않음
+        return (
+            checkpoint_tuple.config["configurable"]["thread_id"],
+            {key: values[key] for key in _KEYWORD_STAGE_KEYS if key in values},
+        )
+    return None
+
+def run_checkpointed_research(
+    topic: Optional[str] = None,
+    *,
+    thread_id: Optional[str] = None,
+    config: Optional[RunnableConfig] = None,
+    deadline_seconds: Optional[float] = None,
+    reuse_keywords_within: Optional[float] = None,
+) -> Dict[str, Any]:
+    """노드마다 체크포인트를 남기며 enhanced_app 실행
+
+    - thread_id 의 실행이 실패/중단됐으면 입력 없이 마지막 완료 노드 이후부터 재개 (완료된 실행이면 저장된 결과 반환)
+    - 새 실행이면 reuse_keywords_within 초(기본 RESEARCHER_KEYWORD_REUSE_SECONDS) 안에 같은 주제로 끝난
+      키워드 단계 결과를 가져와 GPT 호출 없이 Advanced Query Generator 부터 시작
+    - 결과는 research_topics 와 같이 export_value 로 변환된 값
+    """
+    checkpointed_app = get_checkpointed_enhanced_app()
+    configurable = {**((config or {}).get("configurable") or {}), "thread_id": thread_id or uuid.uuid4().hex}
+    budget = deadline_seconds or configurable.get("deadline_seconds") or DEFAULT_DEADLINE_SECONDS
+    if budget:
+        # 재개할 때 state 에 남은 이전 실행의 마감 시각 대신 이번 호출 기준 마감 사용
+        configurable["deadline_at"] = time.time() + float(budget)
+    run_config: RunnableConfig = {**(config or {}), "configurable": configurable}
+    
+    snapshot = checkpointed_app.get_state(run_config)
+    if snapshot.next:
+        if "deadline_at" not in configurable:
+            # state 에 남은 이전 실행의 (이미 지났을) 마감 시각 대신 저장된 예산으로 다시 계산, 예산이 없으면 마감 없음
+            stored_budget = snapshot.values.get("deadline_seconds")
+            configurable["deadline_at"] = time.time() + float(stored_budget) if stored_budget else None
+        return export_value(checkpointed_app.invoke(None, run_config))
+    if snapshot.values:
+        return export_value(snapshot.values)
+    
+    topic = _normalize_topic({"topic": topic})
+    topic_key = _topic_key(topic)
+    run_config["metadata"] = {**(run_config.get("metadata") or {}), "research_topic": topic_key}
+    window = KEYWORD_REUSE_SECONDS if reuse_keywords_within is None else reuse_keywords_within
+    reusable = _reusable_keyword_state(checkpointed_app.checkpointer, topic_key, window)
+    if reusable is None:
+        return export_value(checkpointed_app.invoke({"topic": topic}, run_config))
+    
+    # 키워드 단계를 마친 것처럼 새 thread 를 만들고 다음 노드부터 실행
+    source_thread_id, values = reusable
+    values["topic"] = topic
+    values["keyword_strategy"] = {**values.get("keyword_strategy", {}), "reused_from_thread": source_thread_id}
+    if "deadline_at" in configurable:
+        values["deadline_at"] = configurable["deadline_at"]
+    checkpointed_app.update_state(run_config, values, as_node="Sub Keyword Evaluator")
+    return export_value(checkpointed_app.invoke(None, run_config))
+
+# 주제 유사도 캐시 (표현만 조금 다른 주제는 이전 실행 결과를 반환하거나 키워드/검색 결과로 시작)
+# 벡터 유사도는 후보 검색에만 쓰고, 재사용 여부는 두 주제의 정규화 토큰 차이로 결정
+# (연도/숫자/지명처럼 한 단어만 달라도 다른 주제이므로 벡터 유사도만으로는 판단하지 않음)
+# 토큰이 같고 이 유사도 이상이면 저장된 결과를 그대로 반환
+TOPIC_CACHE_RETURN_THRESHOLD = float(os.getenv("RESEARCHER_TOPIC_CACHE_RETURN", "0.9"))
+# 일반적인 수식어만 다르고 이 유사도 이상이면 이전 실행의 메인/서브 키워드와 검색 결과로 시작
+TOPIC_CACHE_SEED_THRESHOLD = float(os.getenv("RESEARCHER_TOPIC_CACHE_SEED", "0.6"))
+TOPIC_CACHE_MAX_ENTRIES = int(os.getenv("RESEARCHER_TOPIC_CACHE_SIZE", "5000"))  # 0 이면 사용 안 함
+TOPIC_CACHE_MAX_BYTES = int(os.getenv("RESEARCHER_TOPIC_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 압축된 결과 합계
+TOPIC_CACHE_TTL_SECONDS = float(os.getenv("RESEARCHER_TOPIC_CACHE_TTL", "3600"))
+# 토큰 / 문자 3-gram 특성을 절반씩 해시하는 차원 수, 유사도에서 토큰 쪽 비중
+_TOPIC_VECTOR_DIMENSIONS = 512
+_TOPIC_TOKEN_WEIGHT = 0.7
+# 유사도가 높을 때 검사할 후보 수 (가장 비슷한 후보가 토큰 검사에서 탈락해도 다음 후보 확인)
+_TOPIC_CANDIDATES = 8
+# 한국어/영어 주제가 같은 토큰을 갖도록 자주 쓰는 외래어를 영어 표기로 맞춤
+_TOPIC_TERM_ALIASES = {
+    "스타트업": "startup", "마케팅": "marketing", "브랜드": "brand", "브랜딩": "branding",
+    "콘텐츠": "content", "컨텐츠": "content", "트렌드": "trend", "인플루언서": "influencer",
+    "커뮤니티": "community", "비즈니스": "business", "플랫폼": "platform", "서비스": "service",
+    "유튜브": "youtube", "인스타그램": "instagram", "스레드": "threads", "쓰레드": "threads",
+    "데이터": "data", "디자인": "design", "프로덕트": "product", "리서치": "research",
+    "전략": "strategy", "성장": "growth", "광고": "advertising", "창업": "startup",
+}
+# 주제를 바꾸지 않는 수식어/기능어 - 이것만 다르면 키워드/검색 결과 시드 허용 (결과 반환은 토큰이 같을 때만)
+_TOPIC_GENERIC_TERMS = frozenset((
+    "strategy", "strategies", "tips", "guide", "ideas", "how", "best", "ways", "trend", "trends",
+    "in", "of", "to", "on", "for", "the", "an", "and", "with",
+    "방법", "가이드", "노하우", "아이디어", "추천", "정리", "관련", "및",
+))
+_TOPIC_UNSCOPED_CONFIG_KEYS = frozenset((
+    "thread_id", "checkpoint_ns", "checkpoint_id", "instrumentation_sink", "deadline_seconds", "deadline_at",
+))
+
+def _topic_tokens(normalized: str) -> List[str]:
+    tokens = []
+    for keyword in _split_keywords(normalized):
+        keyword = keyword.strip(_TOKEN_PUNCTUATION)
+        # 한 글자 단어/숫자도 주제를 구분하므로 IDF 토큰이 없으면 어절 그대로 사용 (불용어 제외)
+        words = _idf_tokens(keyword) or ([keyword] if keyword and keyword not in _CORPUS_STOPWORDS else [])
+        tokens.extend(_TOPIC_TERM_ALIASES.get(word, word) for word in words)
+    return tokens
+
+def _topic_features(topic: str) -> Tuple[List[str], List[str]]:
+    """주제의 (키워드 토큰, 문자 3-gram) 특성"""
+    normalized = _topic_key(topic)
+    padded = f" {normalized} "
+    return _topic_tokens(normalized), [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+def topic_vector(topic: str, dimensions: int = _TOPIC_VECTOR_DIMENSIONS):
+    """주제의 단위 길이 float32 벡터 (부호 있는 특성 해싱, 내적 = 코사인 유사도)"""
+    np = _load_dependency("numpy")
+    half = dimensions // 2
+    vector = np.zeros(dimensions, dtype=np.float32)
+    tokens, trigrams = _topic_features(topic)
+    for offset, features, weight in ((0, tokens, _TOPIC_TOKEN_WEIGHT), (half, trigrams, 1.0 - _TOPIC_TOKEN_WEIGHT)):
+        part = vector[offset:offset + half]
+        for feature in features:
+            feature_hash = _token_hash(feature)
+            part[feature_hash % half] += 1.0 if feature_hash >> 63 else -1.0
+        norm = float(np.linalg.norm(part))
+        if norm:
+            part *= math.sqrt(weight) / norm
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+def _topic_reuse_mode(tokens: FrozenSet[str], cached_tokens: FrozenSet[str]) -> Optional[str]:
+    """두 주제의 토큰 차이로 허용되는 재사용 방식 ("result" / "seed" / None)"""
+    if tokens == cached_tokens:
+        return "result"
+    if (tokens ^ cached_tokens) <= _TOPIC_GENERIC_TERMS:
+        return "seed"
+    return None
+
+def _topic_cache_scope(config: Optional[RunnableConfig]) -> int:
+    """결과에 영향을 주는 configurable 값의 해시 (같은 범위의 항목만 재사용)"""
+    configurable = (config or {}).get("configurable") or {}
+    parts = []
+    for key in sorted(configurable):
+        if key in _TOPIC_UNSCOPED_CONFIG_KEYS or key.startswith("__"):
+            continue
+        value = configurable[key]
+        if isinstance(value, (str, int, float, bool, type(None))):
+            parts.append(f"{key}={value!r}")
+        else:
+            # 컴포넌트 등 객체는 같은 인스턴스일 때만 같은 범위
+            parts.append(f"{key}=<{type(value).__name__}:{id(value)}>")
+    return _token_hash("\x00".join(parts)) >> 1  # int64 배열에 들어가도록 63비트
+
+class TopicMatch(TypedDict):
+    topic: str
+    similarity: float
+    stored_at: float
+    mode: str  # "result" (저장된 결과 반환) / "seed" (키워드/검색 결과로 시작)
+    result: Dict[str, Any]
+
+class TopicIndex:
+    """주제 벡터 인덱스 (행렬-벡터 곱 한 번으로 비슷한 이전 주제 검색)
+
+    결과는 압축한 JSON 으로 보관해 max_bytes 안에서 유지하고, 꺼낼 때마다 새 객체로 복원한다.
+    가득 차면 가장 오래 전에 저장된 항목부터 교체하고, ttl 이 지난 항목은 검색에서 제외한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = TOPIC_CACHE_MAX_ENTRIES,
+        max_bytes: int = TOPIC_CACHE_MAX_BYTES,
+        ttl: float = TOPIC_CACHE_TTL_SECONDS,
+        dimensions: int = _TOPIC_VECTOR_DIMENSIONS,
+    ) -> None:
+        np = _load_dependency("numpy")
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.dimensions = dimensions
+        capacity = min(64, self.max_entries)
+        self._vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self._stored_at = np.full(capacity, np.inf)  # 빈 슬롯은 inf
+        self._scopes = np.zeros(capacity, dtype=np.int64)
+        # 슬롯별 (주제 키, 원래 주제, 토큰 집합, 압축된 결과)
+        self._entries: List[Optional[Tuple[str, str, FrozenSet[str], bytes]]] = [None] * capacity
+        self._slots: Dict[Tuple[int, str], int] = {}
+        self._free: List[int] = []
+        self._used = 0  # 할당된 적 있는 슬롯 수 (행렬에서 검색할 범위)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def stored_bytes(self) -> int:
+        return self._bytes
+
+    def add(self, topic: str, result: Dict[str, Any], *, scope: int = 0) -> None:
+        """export_value 로 변환된 (JSON 직렬화 가능한) 결과 저장"""
+        key = _topic_key(topic)
+        vector = topic_vector(topic, self.dimensions)
+        payload = zlib.compress(json.dumps(result, ensure_ascii=False, default=str).encode("utf-8"))
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            slot = self._slots.pop((scope, key), None)
+            if slot is not None:
+                self._release(slot)
+            while self._slots and (len(self._slots) >= self.max_entries or self._bytes + len(payload) > self.max_bytes):
+                self._release(int(self._stored_at[:self._used].argmin()))
+            slot = self._allocate()
+            self._vectors[slot] = vector
+            self._stored_at[slot] = time.time()
+            self._scopes[slot] = scope
+            self._entries[slot] = (key, topic, frozenset(_topic_tokens(key)), payload)
+            self._slots[(scope, key)] = slot
+            self._bytes += len(payload)
+
+    def _release(self, slot: int) -> None:
+        key, _, _, payload = self._entries[slot]
+        self._slots.pop((int(self._scopes[slot]), key), None)
+        self._entries[slot] = None
+        self._stored_at[slot] = float("inf")
+        self._bytes -= len(payload)
+        self._free.append(slot)
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._used == len(self._entries):
+            np = _load_dependency("numpy")
+            extra = min(self._used * 2, self.max_entries) - self._used
+            self._vectors = np.concatenate((self._vectors, np.zeros((extra, self.dimensions), dtype=np.float32)))
+            self._stored_at = np.concatenate((self._stored_at, np.full(extra, np.inf)))
+            self._scopes = np.concatenate((self._scopes, np.zeros(extra, dtype=np.int64)))
+            self._entries.extend([None] * extra)
+        self._used += 1
+        return self._used - 1
+
+    def match(
+        self,
+        topic: str,
+        *,
+        scope: int = 0,
+        return_threshold: float = TOPIC_CACHE_RETURN_THRESHOLD,
+        seed_threshold: float = TOPIC_CACHE_SEED_THRESHOLD,
+    ) -> Optional[TopicMatch]:
+        """재사용 가능한 가장 비슷한 (같은 범위, 만료 전) 이전 주제"""
+        np = _load_dependency("numpy")
+        key = _topic_key(topic)
+        tokens = frozenset(_topic_tokens(key))
+        vector = topic_vector(topic, self.dimensions)
+        threshold = min(return_threshold, seed_threshold)
+        with self._lock:
+            if not self._slots:
+                return None
+            stored_at = self._stored_at[:self._used]
+            similarities = self._vectors[:self._used] @ vector
+            stale = (self._scopes[:self._used] != scope) | np.isinf(stored_at)
+            if self.ttl > 0:
+                stale |= stored_at < time.time() - self.ttl
+            similarities[stale] = -1.0
+            candidates = np.flatnonzero(similarities >= threshold)
+            if len(candidates) > _TOPIC_CANDIDATES:
+                candidates = candidates[np.argpartition(similarities[candidates], -_TOPIC_CANDIDATES)[-_TOPIC_CANDIDATES:]]
+            for slot in sorted(candidates.tolist(), key=lambda index: -similarities[index]):
+                cached_key, stored_topic, cached_tokens, payload = self._entries[slot]
+                similarity = 1.0 if cached_key == key else float(similarities[slot])
+                mode = _topic_reuse_mode(tokens, cached_tokens)
+                if mode == "result" and similarity < return_threshold:
+                    mode = "seed" if similarity >= seed_threshold else None
+                elif mode == "seed" and similarity < seed_threshold:
+                    mode = None
+                if mode is not None:
+                    break
+            else:
+                return None
+            stored = float(stored_at[slot])
+        return TopicMatch(
+            topic=stored_topic,
+            similarity=similarity,
+            stored_at=stored,
+            mode=mode,
+            result=json.loads(zlib.decompress(payload)),
+        )
+
+@lru_cache
+def get_topic_index() -> Optional[TopicIndex]:
+    """프로세스 공유 주제 유사도 인덱스 (RESEARCHER_TOPIC_CACHE_SIZE=0 이면 None)"""
+    if TOPIC_CACHE_MAX_ENTRIES <= 0:
+        return None
+    return TopicIndex()
+
+def run_cached_research(
+    topic: str,
+    *,
+    config: Optional[RunnableConfig] = None,
+    topic_index: Any = _USE_DEFAULT,
+    return_threshold: Optional[float] = None,
+    seed_threshold: Optional[float] = None,
+) -> Dict[str, Any]:
+    """주제 유사도 캐시를 거쳐 enhanced_app 실행 (결과는 export_value 로 변환된 값)
+
+    - 같은 설정으로 실행한 이전 주제와 정규화 토큰이 같고 return_threshold 이상이면 저장된 결과 반환
+    - 일반적인 수식어만 다르고 seed_threshold 이상이면 이전 실행의 메인/서브 키워드를 state 에 넣고 검색부터 실행
+    - 오류나 마감으로 생략된 단계 없이 끝난 결과만 캐시에 저장
+    """
+    index = get_topic_index() if topic_index is _USE_DEFAULT else topic_index
+    topic = _normalize_topic({"topic": topic})
+    if index is None:
+        return export_value(enhanced_app.invoke({"topic": topic}, config))
+    scope = _topic_cache_scope(config)
+    match = index.match(
+        topic,
+        scope=scope,
+        return_threshold=TOPIC_CACHE_RETURN_THRESHOLD if return_threshold is None else return_threshold,
+        seed_threshold=TOPIC_CACHE_SEED_THRESHOLD if seed_threshold is None else seed_threshold,
+    )
+    inputs: EnhancedResearchState = {"topic": topic}
+    if match is not None:
+        previous = match["result"]
+        cache_info = {"matched_topic": match["topic"], "similarity": round(match["similarity"], 4), "mode": match["mode"]}
+        if match["mode"] == "result":
+            previous["topic"] = topic
+            previous["keyword_strategy"] = {**previous.get("keyword_strategy", {}), "topic_cache": cache_info}
+            return previous
+        # 키워드 단계만 재사용 - 이전 검색 결과를 넣으면 새 결과와 합쳐져 오래된 결과가 다시 순위에 오름
+        inputs.update({key: previous[key] for key in _KEYWORD_STAGE_KEYS if key in previous})
+        inputs["keyword_strategy"] = {**inputs.get("keyword_strategy", {}), "topic_cache": cache_info}
+    
+    result = export_value(enhanced_app.invoke(inputs, config))
+    if not result.get("errors") and not result.get("skipped_stages"):
+        index.add(topic, result, scope=scope)
+    return result
+
+# 배치 리서치 (여러 주제를 한 번에 처리하며 공유 가능한 작업은 합침)
+class BatchResearchResult(TypedDict):
+    topic: str
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+
+def research_topics(
+    topics: List[str],
+    *,
+    enhanced: bool = True,
+    max_workers: int = 8,
+    config: Optional[RunnableConfig] = None,
+    deadline_seconds: Optional[float] = None,
+) -> List[BatchResearchResult]:
+    """주제 목록을 제한된 병렬도로 실행하고 입력 순서대로 결과/오류 반환
+
+    - 고도화 그래프는 주제별 키워드 프롬프트를 묶음 completion 으로 미리 채워 호출 수를 줄임
+    - 모든 실행이 같은 컴포넌트(검색/LLM 캐시 + single-flight)를 공유해 동일한 Tavily 쿼리는 한 번만 실행
+    - deadline_seconds 는 주제별 지연 예산 (대화형 요청보다 넉넉하게 줄 수 있음)
+    """
+    components = get_components(config)
+    configurable = {**((config or {}).get("configurable") or {}), "components": components}
+    if deadline_seconds is not None:
+        configurable["deadline_seconds"] = deadline_seconds
+    run_config: RunnableConfig = {**(config or {}), "configurable": configurable}
+    target_app = enhanced_app if enhanced else app
+    
+    def run(topic: str) -> BatchResearchResult:
+        try:
+            result = export_value(target_app.invoke({"topic": topic}, run_config))
+            return BatchResearchResult(topic=topic, result=result, error=None)
+        except Exception as exc:
+            return BatchResearchResult(topic=topic, result=None, error=f"{type(exc).__name__}: {exc}")
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(topics) or 1))) as executor:
+        if enhanced:
+            _prefetch_keyword_intelligence(components.keyword_intelligence, topics, executor)
+        return list(executor.map(run, topics))
+
+def _prefetch_keyword_intelligence(
+    keyword_intelligence: KeywordIntelligence, topics: List[str], executor: ThreadPoolExecutor
+) -> None:
+    """배치 실행 전 메인 키워드 → 브레이크다운 순으로 묶음 프롬프트 캐시 채우기
+
+    묶음들은 배치의 executor 로 동시에 요청한다. 묶음 요청이 실패했거나 빠진 주제의 메인 키워드도
+    같은 executor 로 개별 요청한다 (max_workers 준수).
+    """
+    normalized = [topic.strip() for topic in topics if isinstance(topic, str) and topic.strip()]
+    if not normalized or keyword_intelligence.llm_cache is None:
+        return
+    try:
+        keyword_intelligence.prefetch_main_keywords(normalized, executor=executor)
+        main_keywords = executor.map(keyword_intelligence.extract_main_keyword, normalized)
+        pairs = [(main_keyword["keyword"], topic) for main_keyword, topic in zip(main_keywords, normalized)]
+        keyword_intelligence.prefetch_keyword_breakdowns(pairs, executor=executor)
+    except Exception:
+        # 미리 채우기는 최적화일 뿐이므로 실패해도 각 실행이 개별 요청으로 처리
+        pass
+
+# 스트리밍 (단계별 부분 결과)
+class ResearchEvent(TypedDict):
+    type: str  # main_keyword / keyword_breakdown / selected_sub_keywords / platform_results / filtered_results / engagement_metrics / skipped_stages / strategy / summary / error
+    node: str
+    data: Dict[str, Any]
+
+def _events_from_update(node: str, update: Optional[Dict[str, Any]]) -> List[ResearchEvent]:
+    """노드 업데이트를 프론트엔드용 타입 이벤트로 변환"""
+    if not update:
+        return []
+    
+    events: List[ResearchEvent] = []
+    for key in (
+        "main_keyword", "keyword_breakdown", "selected_sub_keywords", "filtered_results", "engagement_metrics",
+        "skipped_stages",
+    ):
+        if key in update:
+            events.append(ResearchEvent(type=key, node=node, data={key: export_value(update[key])}))
+    for platform, results in (update.get("search_results") or {}).items():
+        events.append(ResearchEvent(
+            type="platform_results", node=node, data={"platform": platform, "results": export_value(results)}
+        ))
+    if "actionable_insights" in update:
+        events.append(ResearchEvent(type="strategy", node=node, data={
+            "actionable_insights": update["actionable_insights"],
+            "content_recommendations": update.get("content_recommendations", []),
+            "competitive_analysis": update.get("competitive_analysis", {}),
+        }))
+    if "summary" in update:
+        events.append(ResearchEvent(type="summary", node=node, data={
+            "summary": update["summary"],
+            "references": update.get("references", []),
+        }))
+    if update.get("errors"):
+        events.append(ResearchEvent(type="error", node=node, data={"errors": update["errors"]}))
+    return events
+
+def stream_enhanced_research(topic: str, config: Optional[RunnableConfig] = None) -> Iterator[ResearchEvent]:
+    """enhanced_app 을 실행하며 단계가 끝날 때마다 부분 결과 이벤트를 내보냄"""
+    for chunk in enhanced_app.stream({"topic": topic}, config, stream_mode="updates"):
+        for node, update in chunk.items():
+            yield from _events_from_update(node, update)
+
+async def astream_enhanced_research(topic: str, config: Optional[RunnableConfig] = None) -> AsyncIterator[ResearchEvent]:
+    """stream_enhanced_research 의 비동기 버전"""
+    async for chunk in enhanced_app.astream({"topic": topic}, config, stream_mode="updates"):
+        for node, update in chunk.items():
+            for event in _events_from_update(node, update):
+                yield event
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="researcher 워커 유틸리티")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    prewarm_parser = subcommands.add_parser("prewarm", help="NLP/ML 의존성과 NLTK 코퍼스를 미리 로드")
+    prewarm_parser.add_argument("--nltk-data", default=None, help="번들된 NLTK 데이터 경로")
+    idf_parser = subcommands.add_parser("build-idf", help="누적 검색 결과로 코퍼스 IDF 모델 빌드")
+    idf_parser.add_argument("--output", default=IDF_MODEL_PATH or "idf_model", help="모델 디렉터리 (RESEARCHER_IDF_MODEL)")
+    idf_parser.add_argument("--input", action="append", default=[], help="추가 문서 JSON/JSONL 파일 (반복 가능)")
+    idf_parser.add_argument("--min-df", type=int, default=2, help="저장할 최소 문서 빈도")
+    idf_parser.add_argument("--no-cache", action="store_true", help="검색 결과 캐시를 읽지 않음")
+    args = parser.parse_args()
+
+    if args.command == "prewarm":
+        prewarm(args.nltk_data)
+    elif args.command == "build-idf":
+        cache = None if args.no_cache else get_search_cache()
+        # 메모리 캐시는 이 CLI 프로세스에서 새로 만들어져 비어 있으므로 코퍼스로 쓸 수 없음
+        if cache is not None and not isinstance(cache.backend, _SqliteCacheBackend):
+            cache = None
+        if cache is None and not args.input:
+            parser.error("build-idf needs RESEARCHER_SEARCH_CACHE=sqlite or at least one --input file")
+        try:
+            meta = build_idf_model(iter_corpus_documents(cache, args.input), args.output, min_df=args.min_df)
+        except ValueError as exc:
+            parser.exit(1, f"build-idf: {exc}\n")
+        print(json.dumps(meta, ensure_ascii=False))
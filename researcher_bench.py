@@ -0,0 +1,456 @@
+"""researcher.py 성능 벤치마크
+
+사용법:
+    python researcher_bench.py import [--budget 1.5] [--repeat 3]
+    python researcher_bench.py run [--sizes 10,1000,100000] [--repeat 5] [--cases ...]
+                                   [--fixtures researcher_bench_fixtures.json]
+                                   [--save-baseline baseline.json] [--baseline baseline.json] [--tolerance 0.2]
+    python researcher_bench.py record --topic "..." [--output researcher_bench_fixtures.json]
+
+`run` 은 기록된 Tavily/OpenAI 응답을 로컬 대체 클라이언트로 재생하므로 네트워크/API 키가 필요 없다.
+픽스처 파일이 없으면 고정 시드로 만든 합성 응답을 사용한다.
+"""
+import os
+import sys
+import json
+import time
+import types
+import random
+import hashlib
+import argparse
+import platform
+import contextlib
+import subprocess
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent
+
+# `import researcher; researcher.app` 허용 시간 (초)
+IMPORT_BUDGET_SECONDS = float(os.getenv("RESEARCHER_IMPORT_BUDGET", "1.5"))
+
+# import 시점에 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = ("tavily", "openai", "textblob", "nltk", "sklearn", "numpy")
+
+DEFAULT_FIXTURES_PATH = ROOT_DIR / "researcher_bench_fixtures.json"
+DEFAULT_SIZES = (10, 1000, 100000)
+DEFAULT_TOLERANCE = 0.2
+
+_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import researcher
+researcher.app
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded_heavy_modules": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+def measure_import_time() -> Dict[str, Any]:
+    """새 인터프리터에서 `import researcher; researcher.app` 시간을 측정"""
+    completed = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE.format(heavy=HEAVY_MODULES)],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "RESEARCHER_NLTK_DOWNLOAD": "0"},
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def run_import_benchmark(budget: float = IMPORT_BUDGET_SECONDS, repeat: int = 3) -> Dict[str, Any]:
+    """import 시간 벤치마크 - 최솟값이 예산 이내이고 무거운 의존성이 로드되지 않아야 통과"""
+    samples: List[Dict[str, Any]] = [measure_import_time() for _ in range(max(repeat, 1))]
+    best = min(sample["seconds"] for sample in samples)
+    loaded = sorted({name for sample in samples for name in sample["loaded_heavy_modules"]})
+    return {
+        "budget_seconds": budget,
+        "best_seconds": best,
+        "samples": [sample["seconds"] for sample in samples],
+        "loaded_heavy_modules": loaded,
+        "passed": best <= budget and not loaded,
+    }
+
+# 픽스처 (기록된 외부 API 응답)
+def _prompt_kind(prompt: str) -> str:
+    """researcher 프롬프트 종류 판별 (메인 키워드 / 키워드 브레이크다운)"""
+    return "keyword_breakdown" if prompt.strip().startswith("메인 키워드:") else "main_keyword"
+
+def _prompt_digest(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+_VOCABULARY = (
+    "AI", "startup", "marketing", "growth", "founder", "product", "launch", "community", "brand", "content",
+    "strategy", "creator", "audience", "retention", "pricing", "funnel", "newsletter", "threads", "viral",
+    "trending", "tips", "guide", "best", "review", "how", "why", "what", "share", "love", "amazing",
+    "마케팅", "스타트업", "성장", "콘텐츠", "브랜드", "전략", "추천", "방법", "후기", "트렌드",
+)
+_SPAM_TAILS = ("follow me", "dm me", "link in bio", "check bio")
+
+def synthetic_documents(count: int, seed: int = 7, domain: str = "threads.net") -> List[Dict[str, Any]]:
+    """고정 시드 합성 검색 결과 (길이/지표/스팸 비율이 실제 결과와 비슷하도록)"""
+    rng = random.Random(seed)
+    documents = []
+    for index in range(count):
+        words = [rng.choice(_VOCABULARY) for _ in range(rng.randint(8, 120))]
+        text = " ".join(words) + rng.choice((".", "!", "?", ". Thoughts?"))
+        if rng.random() < 0.05:
+            text += " " + " ".join(rng.sample(_SPAM_TAILS, 2))
+        documents.append({
+            "url": f"https://{domain}/@user{index % 997}/post/{seed}{index:07d}",
+            "title": " ".join(words[:6]),
+            "content": text,
+            "score": round(rng.random(), 4),
+        })
+    return documents
+
+def synthetic_fixtures(results_per_query: int = 10) -> Dict[str, Any]:
+    """픽스처 파일이 없을 때 쓰는 합성 응답"""
+    breakdown = [
+        {"keyword": f"AI 마케팅 {suffix}", "type": "related", "relevance": 0.8}
+        for suffix in ("방법", "가이드", "추천 순위", "2024 트렌드", "어떻게 시작", "비용 비교", "후기", "best tools", "top tips", "전략")
+    ]
+    main_keyword = {
+        "keyword": "AI 마케팅", "search_volume": 5000, "competition_level": "HIGH",
+        "relevance_score": 0.9, "trend_score": 85, "analysis_reason": "synthetic fixture",
+    }
+    return {
+        "tavily": [
+            {
+                "query": None,
+                "include_domains": [domain],
+                "response": {"results": synthetic_documents(results_per_query, seed=seed, domain=domain)},
+            }
+            for seed, domain in enumerate(("threads.net", "x.com", "threads.net", "x.com", "threads.net", "x.com"))
+        ],
+        "openai": [
+            {"prompt_sha256": None, "kind": "main_keyword", "content": json.dumps(main_keyword, ensure_ascii=False),
+             "usage": {"prompt_tokens": 180, "completion_tokens": 60}},
+            {"prompt_sha256": None, "kind": "keyword_breakdown", "content": json.dumps(breakdown, ensure_ascii=False),
+             "usage": {"prompt_tokens": 220, "completion_tokens": 240}},
+        ],
+    }
+
+def load_fixtures(path: Optional[Path] = None) -> Dict[str, Any]:
+    path = Path(path or DEFAULT_FIXTURES_PATH)
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return synthetic_fixtures()
+
+# 재생 / 기록 클라이언트
+class ReplayTavilyClient:
+    """기록된 Tavily 응답 재생 - (쿼리, 도메인) 일치 우선, 없으면 같은 도메인 응답을 순환"""
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.exact = {(entry["query"], tuple(entry.get("include_domains") or ())): entry["response"] for entry in entries}
+        self.by_domain: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for entry in entries:
+            self.by_domain.setdefault(tuple(entry.get("include_domains") or ()), []).append(entry["response"])
+        self.calls = 0
+
+    def search(self, query: str, max_results: int = 5, include_domains=None, **kwargs) -> Dict[str, Any]:
+        self.calls += 1
+        domains = tuple(include_domains or ())
+        response = self.exact.get((query, domains))
+        if response is None:
+            candidates = self.by_domain.get(domains) or [r for responses in self.by_domain.values() for r in responses]
+            response = candidates[self.calls % len(candidates)] if candidates else {"results": []}
+        return {**response, "results": json.loads(json.dumps(response.get("results", [])[:max_results]))}
+
+class ReplayOpenAIClient:
+    """기록된 chat completion 재생 - 프롬프트 해시 일치 우선, 없으면 같은 종류의 응답"""
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.exact = {entry["prompt_sha256"]: entry for entry in entries if entry.get("prompt_sha256")}
+        self.by_kind = {entry["kind"]: entry for entry in entries}
+        self.calls = 0
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    def create(self, model: str, messages: List[Dict[str, str]], temperature: float = 0.0, **kwargs):
+        self.calls += 1
+        prompt = messages[0]["content"]
+        entry = self.exact.get(_prompt_digest(prompt)) or self.by_kind[_prompt_kind(prompt)]
+        usage = entry.get("usage") or {}
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=entry["content"]))],
+            usage=types.SimpleNamespace(
+                prompt_tokens=usage.get("prompt_tokens", 0), completion_tokens=usage.get("completion_tokens", 0)
+            ),
+        )
+
+class RecordingTavilyClient:
+    def __init__(self, client, entries: List[Dict[str, Any]]):
+        self.client = client
+        self.entries = entries
+
+    def search(self, query: str, **kwargs) -> Dict[str, Any]:
+        response = self.client.search(query=query, **kwargs)
+        self.entries.append({
+            "query": query,
+            "include_domains": list(kwargs.get("include_domains") or []),
+            "response": {"results": response.get("results", [])},
+        })
+        return response
+
+class RecordingOpenAIClient:
+    def __init__(self, client, entries: List[Dict[str, Any]]):
+        self.client = client
+        self.entries = entries
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        response = self.client.chat.completions.create(**kwargs)
+        prompt = kwargs["messages"][0]["content"]
+        usage = getattr(response, "usage", None)
+        self.entries.append({
+            "prompt_sha256": _prompt_digest(prompt),
+            "kind": _prompt_kind(prompt),
+            "content": response.choices[0].message.content,
+            "usage": {
+                "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+                "completion_tokens": getattr(usage, "completion_tokens", 0),
+            },
+        })
+        return response
+
+@contextlib.contextmanager
+def replay_clients(fixtures: Dict[str, Any]) -> Iterator[Any]:
+    """researcher 의 클라이언트 getter 를 재생 클라이언트로 교체하고 캐시 없는 컴포넌트를 반환"""
+    import researcher
+
+    tavily = ReplayTavilyClient(fixtures["tavily"])
+    openai_client = ReplayOpenAIClient(fixtures["openai"])
+    originals = (researcher._get_tavily_client, researcher._get_openai_client, researcher._default_components)
+    researcher._get_tavily_client = lambda: tavily
+    researcher._get_openai_client = lambda: openai_client
+    researcher._default_components = None
+    try:
+        # 캐시를 끄지 않으면 두 번째 반복부터 캐시 적중만 측정하게 됨
+        yield researcher.ResearchComponents(
+            keyword_intelligence=researcher.KeywordIntelligence(llm_cache=None),
+            search_cache=None,
+        )
+    finally:
+        researcher._get_tavily_client, researcher._get_openai_client, researcher._default_components = originals
+
+# 벤치마크 케이스
+# 케이스는 (작업 목록, 작업당 처리 문서 수) 를 만드는 함수 - 작업마다 지연 시간을 하나씩 측정
+BenchCase = Callable[[Any, int, int], Tuple[List[Callable[[], Any]], int]]
+
+def _case_app(components, size: int, repeat: int):
+    import researcher
+    config = {"configurable": {"components": components}}
+    return [lambda: researcher.app.invoke({"topic": "AI 스타트업 마케팅"}, config)] * repeat, 1
+
+def _case_enhanced_app(components, size: int, repeat: int):
+    import researcher
+    config = {"configurable": {"components": components}}
+    return [lambda: researcher.enhanced_app.invoke({"topic": "AI 스타트업 마케팅"}, config)] * repeat, 1
+
+def _case_content_quality(components, size: int, repeat: int):
+    documents = synthetic_documents(size)
+    content_filter = components.content_filter
+    return [lambda document=document: content_filter.calculate_content_quality(document) for document in documents], 1
+
+def _case_evaluate_sub_keywords(components, size: int, repeat: int):
+    rng = random.Random(size)
+    keywords = [
+        {"keyword": " ".join(rng.choice(_VOCABULARY) for _ in range(rng.randint(1, 4))), "type": "related", "relevance": 0.8}
+        for _ in range(size)
+    ]
+    keyword_intelligence = components.keyword_intelligence
+    return [lambda: keyword_intelligence.evaluate_sub_keywords(keywords, "AI 스타트업 마케팅", "AI 마케팅")] * repeat, size
+
+def _case_engagement(components, size: int, repeat: int):
+    import researcher
+    rng = random.Random(size)
+    documents = [dict(document, quality_score=rng.random()) for document in synthetic_documents(size)]
+    state = {"filtered_results": {"threads": documents[::2], "x": documents[1::2]}}
+    return [lambda: researcher.analyze_engagement_potential(state)] * repeat, size
+
+def _case_state_reducers(components, size: int, repeat: int):
+    """그래프 한 번 실행의 상태 병합 - 플랫폼 노드마다 결과 한 묶음 + 재개/재시도로 같은 플랫폼에 한 묶음 더"""
+    import researcher
+    documents = researcher.to_search_results(synthetic_documents(size))
+    half = len(documents) // 2
+    updates = [
+        {"threads": documents[:half // 2]}, {"x": documents[half:half + half // 2]},
+        {"threads": documents[half // 2:half]}, {"x": documents[half + half // 2:]},
+    ]
+
+    def merge():
+        search_results, errors = {}, []
+        for update in updates:
+            search_results = researcher._merge_search_results(search_results, update)
+            errors = researcher._append_items(errors, [f"warning {len(errors)}"])
+        return search_results, errors
+    return [merge] * repeat, size
+
+# 파이프라인 케이스는 픽스처 응답 크기로 실행되므로 문서 수 축이 없음
+PIPELINE_CASES: Dict[str, BenchCase] = {
+    "app": _case_app,
+    "enhanced_app": _case_enhanced_app,
+}
+HOT_PATH_CASES: Dict[str, BenchCase] = {
+    "calculate_content_quality": _case_content_quality,
+    "evaluate_sub_keywords": _case_evaluate_sub_keywords,
+    "analyze_engagement_potential": _case_engagement,
+    "state_reducers": _case_state_reducers,
+}
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = max(int(round(percentile / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+def _reset_text_caches() -> None:
+    """문서 분석 메모이제이션을 비워 반복 간 캐시 효과 제거"""
+    import researcher
+    researcher.analyze_text.cache_clear()
+
+def run_case(name: str, case: BenchCase, components, size: int, repeat: int) -> Dict[str, Any]:
+    """작업별 지연 시간(1회차)과 tracemalloc 최대 메모리(2회차)를 측정 - 작업마다 문서 분석 캐시를 비움"""
+    operations, units = case(components, size, repeat)
+
+    # 지연 로딩되는 의존성(TextBlob/sklearn 등) 초기화 비용은 측정에서 제외
+    if operations:
+        operations[0]()
+
+    latencies = []
+    for operation in operations:
+        _reset_text_caches()
+        operation_started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - operation_started)
+    elapsed = sum(latencies)
+
+    # tracemalloc 은 실행을 느리게 하므로 시간 측정과 분리
+    tracemalloc.start()
+    try:
+        for operation in operations:
+            _reset_text_caches()
+            operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": name,
+        "size": size,
+        "operations": len(operations),
+        "seconds": round(elapsed, 6),
+        "throughput_per_second": round(len(operations) * units / elapsed, 3) if elapsed else None,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 4),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+def run_benchmarks(
+    sizes=DEFAULT_SIZES,
+    repeat: int = 5,
+    cases: Optional[List[str]] = None,
+    fixtures_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """선택된 케이스를 재생 클라이언트로 실행한 결과 보고서"""
+    fixtures = load_fixtures(fixtures_path)
+    selected = set(cases or list(PIPELINE_CASES) + list(HOT_PATH_CASES))
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with replay_clients(fixtures) as components:
+        for name, case in PIPELINE_CASES.items():
+            if name in selected:
+                fixture_size = max((len(entry["response"].get("results", [])) for entry in fixtures["tavily"]), default=0)
+                results[name] = run_case(name, case, components, fixture_size, repeat)
+        for name, case in HOT_PATH_CASES.items():
+            if name in selected:
+                for size in sizes:
+                    results[f"{name}@{size}"] = run_case(name, case, components, size, repeat)
+
+    return {
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "repeat": repeat,
+        "cases": results,
+    }
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """처리량 감소 또는 최대 메모리 증가가 tolerance 를 넘는 케이스 목록"""
+    regressions = []
+    for key, current in report["cases"].items():
+        previous = baseline.get("cases", {}).get(key)
+        if not previous:
+            continue
+        if previous.get("throughput_per_second") and current.get("throughput_per_second") is not None:
+            if current["throughput_per_second"] < previous["throughput_per_second"] * (1 - tolerance):
+                regressions.append(
+                    f"{key}: throughput {current['throughput_per_second']} < baseline {previous['throughput_per_second']}"
+                )
+        if previous.get("peak_memory_kb") and current["peak_memory_kb"] > previous["peak_memory_kb"] * (1 + tolerance):
+            regressions.append(f"{key}: peak memory {current['peak_memory_kb']}KB > baseline {previous['peak_memory_kb']}KB")
+    return regressions
+
+def record_fixtures(topic: str, output: Path) -> Dict[str, Any]:
+    """실제 Tavily/OpenAI 로 enhanced_app 을 한 번 실행하며 응답을 픽스처로 저장 (API 키 필요)"""
+    import researcher
+
+    fixtures: Dict[str, Any] = {"tavily": [], "openai": []}
+    components = researcher.ResearchComponents(
+        keyword_intelligence=researcher.KeywordIntelligence(
+            openai_client=RecordingOpenAIClient(researcher._get_openai_client(), fixtures["openai"]),
+            llm_cache=None,
+        ),
+        tavily_client=RecordingTavilyClient(researcher._get_tavily_client(), fixtures["tavily"]),
+        search_cache=None,
+    )
+    researcher.enhanced_app.invoke({"topic": topic}, {"configurable": {"components": components}})
+    output.write_text(json.dumps(fixtures, ensure_ascii=False, indent=2), encoding="utf-8")
+    return fixtures
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="researcher 파이프라인 벤치마크")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subcommands.add_parser("import", help="import 시간 예산 검사")
+    import_parser.add_argument("--budget", type=float, default=IMPORT_BUDGET_SECONDS)
+    import_parser.add_argument("--repeat", type=int, default=3)
+
+    run_parser = subcommands.add_parser("run", help="재생 클라이언트로 파이프라인/핫패스 벤치마크")
+    run_parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--cases", nargs="*", choices=list(PIPELINE_CASES) + list(HOT_PATH_CASES))
+    run_parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_PATH)
+    run_parser.add_argument("--save-baseline", type=Path)
+    run_parser.add_argument("--baseline", type=Path)
+    run_parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+
+    record_parser = subcommands.add_parser("record", help="실제 API 응답을 픽스처로 기록")
+    record_parser.add_argument("--topic", required=True)
+    record_parser.add_argument("--output", type=Path, default=DEFAULT_FIXTURES_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        report = run_import_benchmark(budget=args.budget, repeat=args.repeat)
+        print(json.dumps(report, indent=2))
+        return 0 if report["passed"] else 1
+    if args.command == "run":
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+        report = run_benchmarks(sizes=sizes, repeat=args.repeat, cases=args.cases, fixtures_path=args.fixtures)
+        if args.baseline:
+            report["regressions"] = compare_to_baseline(
+                report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance
+            )
+        if args.save_baseline:
+            args.save_baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 1 if report.get("regressions") else 0
+    if args.command == "record":
+        fixtures = record_fixtures(args.topic, args.output)
+        print(json.dumps({"tavily": len(fixtures["tavily"]), "openai": len(fixtures["openai"])}, indent=2))
+        return 0
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
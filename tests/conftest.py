@@ -0,0 +1,171 @@
+import os
+import re
+import sys
+import json
+import types
+import hashlib
+from pathlib import Path
+
+import pytest
+
+# 테스트는 네트워크/코퍼스 다운로드/프로세스 풀 없이 실행
+os.environ.setdefault("RESEARCHER_NLTK_DOWNLOAD", "0")
+os.environ.setdefault("RESEARCHER_SEARCH_CACHE", "memory")
+os.environ.setdefault("RESEARCHER_LLM_CACHE", "memory")
+os.environ.setdefault("RESEARCHER_SCORING_PROCESSES", "0")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import researcher  # noqa: E402
+
+_WORDS = (
+    "growth", "founders", "launch", "pricing", "retention", "community", "creators", "product", "funnel",
+    "story", "audience", "brand", "experiment", "metrics", "onboarding", "viral", "content", "signal",
+    "feedback", "market", "channel", "budget", "design", "insight", "network", "habit", "trust", "velocity",
+)
+
+def stub_post(seed: str, words: int = 24) -> str:
+    """시드별로 고정된, 서로 유사 중복이 아닌 게시글 본문"""
+    digest = hashlib.sha256(seed.encode("utf-8")).digest()
+    picked = [_WORDS[digest[i % len(digest)] % len(_WORDS)] + str(digest[(i * 7) % len(digest)] % 10) for i in range(words)]
+    return "AI marketing notes! " + " ".join(picked) + " #startup?"
+
+def main_keyword_payload(keyword: str) -> dict:
+    return {
+        "keyword": keyword,
+        "search_volume": 5000,
+        "competition_level": "HIGH",
+        "relevance_score": 0.9,
+        "trend_score": 85,
+        "analysis_reason": "stub",
+    }
+
+def breakdown_payload(main_keyword: str) -> list:
+    suffixes = ("방법", "가이드", "추천 순위", "2024 트렌드", "어떻게 시작", "비용 비교", "후기", "best tools", "top tips", "전략")
+    return [{"keyword": f"{main_keyword} {suffix}", "type": "related", "relevance": 0.8} for suffix in suffixes]
+
+_LISTING = re.compile(r'^(\d+)\. "(.*)"$', re.MULTILINE)
+
+def default_completion(prompt: str):
+    """프롬프트 종류에 맞는 JSON 응답 (단건/묶음 메인 키워드, 단건/묶음 브레이크다운)"""
+    if prompt.startswith("아래 각 주제"):
+        return [{"index": int(index), **main_keyword_payload(f"{label} 키워드")} for index, label in _LISTING.findall(prompt)]
+    if prompt.startswith("아래 각 항목"):
+        return [
+            {"index": int(index), "keywords": breakdown_payload(label.split(" / ")[0])}
+            for index, label in _LISTING.findall(prompt)
+        ]
+    if "메인 키워드를 추출" in prompt:
+        topic = re.search(r'주제: "(.*)"', prompt).group(1)
+        return main_keyword_payload(f"{topic} 키워드")
+    main_keyword = re.search(r'메인 키워드: "(.*)"', prompt).group(1)
+    return breakdown_payload(main_keyword)
+
+class StubOpenAI:
+    """chat.completions.create 호출을 기록하고 respond(prompt) 결과를 JSON 으로 돌려주는 스텁
+
+    respond 가 예외 인스턴스를 반환하면 그 예외를 발생시키고, 문자열이면 그대로 content 로 쓴다.
+    """
+    def __init__(self, respond=default_completion):
+        self.respond = respond
+        self.prompts = []
+        self.timeouts = []
+        self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=self.create))
+
+    @property
+    def calls(self) -> int:
+        return len(self.prompts)
+
+    def _response(self, messages, timeout):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        self.timeouts.append(timeout)
+        value = self.respond(prompt)
+        if isinstance(value, BaseException):
+            raise value
+        content = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        return types.SimpleNamespace(
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))],
+            usage=types.SimpleNamespace(prompt_tokens=10, completion_tokens=20),
+        )
+
+    def create(self, *, model, messages, temperature, timeout=None):
+        return self._response(messages, timeout)
+
+class AsyncStubOpenAI(StubOpenAI):
+    async def create(self, *, model, messages, temperature, timeout=None):
+        return self._response(messages, timeout)
+
+class StubTavily:
+    """search 호출을 기록하고 쿼리/도메인별로 고정된 결과를 돌려주는 스텁"""
+    def __init__(self, results=None):
+        self.results = results
+        self.queries = []
+
+    @property
+    def calls(self) -> int:
+        return len(self.queries)
+
+    def _response(self, query, max_results, include_domains):
+        self.queries.append(query)
+        if self.results is not None:
+            return {"results": json.loads(json.dumps(self.results[:max_results]))}
+        domain = (include_domains or ["x.com"])[0]
+        return {"results": [
+            {
+                "url": f"https://{domain}/post/{hashlib.sha1(f'{query}/{i}'.encode()).hexdigest()[:10]}",
+                "title": f"post {i}",
+                "content": stub_post(f"{domain}/{query}/{i}"),
+                "score": round(0.9 - i * 0.05, 2),
+            }
+            for i in range(max_results)
+        ]}
+
+    def search(self, query, max_results=5, include_domains=None, **kwargs):
+        return self._response(query, max_results, include_domains)
+
+class AsyncStubTavily(StubTavily):
+    async def search(self, query, max_results=5, include_domains=None, **kwargs):
+        return self._response(query, max_results, include_domains)
+
+@pytest.fixture(autouse=True)
+def fresh_resilience(monkeypatch):
+    """테스트마다 닫힌 서킷 브레이커와 대기 없는 재시도 정책"""
+    for upstream in researcher.RESILIENCE_POLICIES:
+        monkeypatch.setitem(researcher.CIRCUIT_BREAKERS, upstream, researcher.CircuitBreaker(upstream))
+        monkeypatch.setitem(
+            researcher.RESILIENCE_POLICIES, upstream,
+            researcher.ResiliencePolicy(timeout=5.0, retries=2, backoff_base=0.0, backoff_max=0.0),
+        )
+
+@pytest.fixture
+def openai_stub():
+    return StubOpenAI()
+
+@pytest.fixture
+def tavily_stub():
+    return StubTavily()
+
+@pytest.fixture
+def make_components():
+    """스텁 클라이언트를 쓰는 ResearchComponents (기본은 캐시/코퍼스 없음)"""
+    def make(openai_client=None, tavily_client=None, *, llm_cache=None, search_cache=None, search_corpus=None):
+        openai_client = openai_client or StubOpenAI()
+        tavily_client = tavily_client or StubTavily()
+        return researcher.ResearchComponents(
+            keyword_intelligence=researcher.KeywordIntelligence(
+                openai_client=openai_client,
+                async_openai_client=openai_client if isinstance(openai_client, AsyncStubOpenAI) else None,
+                llm_cache=llm_cache,
+                search_corpus=search_corpus,
+                idf_model=None,
+            ),
+            tavily_client=tavily_client,
+            async_tavily_client=tavily_client if isinstance(tavily_client, AsyncStubTavily) else None,
+            search_cache=search_cache,
+            search_corpus=search_corpus,
+        )
+    return make
+
+def memory_cache(ttl: float = 60.0, stale_ttl: float = 0.0) -> "researcher.TTLCache":
+    return researcher.TTLCache(researcher._MemoryCacheBackend(), ttl=ttl, stale_ttl=stale_ttl)
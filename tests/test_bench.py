@@ -0,0 +1,35 @@
+import researcher_bench
+from researcher_bench import compare_to_baseline, run_benchmarks
+
+
+def report(**cases):
+    return {"cases": {name: {"throughput_per_second": throughput, "peak_memory_kb": memory} for name, (throughput, memory) in cases.items()}}
+
+
+def test_compare_to_baseline_flags_throughput_and_memory_regressions():
+    baseline = report(fast=(100.0, 50.0), lean=(100.0, 50.0), stable=(100.0, 50.0), gone=(100.0, 50.0))
+    current = report(fast=(79.0, 50.0), lean=(100.0, 61.0), stable=(81.0, 59.0), new=(1.0, 1000.0))
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("fast: throughput")
+    assert regressions[1].startswith("lean: peak memory")
+
+
+def test_synthetic_documents_are_deterministic():
+    assert researcher_bench.synthetic_documents(5) == researcher_bench.synthetic_documents(5)
+    assert len({document["url"] for document in researcher_bench.synthetic_documents(50)}) == 50
+
+
+def test_run_benchmarks_replays_fixtures_without_network(tmp_path):
+    result = run_benchmarks(
+        sizes=(10,), repeat=1, cases=["enhanced_app", "calculate_content_quality", "state_reducers"],
+        fixtures_path=tmp_path / "missing.json",
+    )
+    cases = result["cases"]
+
+    assert set(cases) == {"enhanced_app", "calculate_content_quality@10", "state_reducers@10"}
+    assert cases["calculate_content_quality@10"]["operations"] == 10
+    assert all(case["throughput_per_second"] and case["peak_memory_kb"] > 0 for case in cases.values())
+    assert compare_to_baseline(result, result) == []
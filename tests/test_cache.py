@@ -0,0 +1,177 @@
+import time
+import asyncio
+import threading
+
+import researcher
+from researcher import TTLCache, _MemoryCacheBackend, _SqliteCacheBackend
+
+from conftest import memory_cache
+
+
+def test_hit_after_miss_returns_fresh_copy():
+    cache = memory_cache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"results": [1, 2]}
+
+    first = cache.get_or_compute("k", compute)
+    first["results"].append(3)
+    second = cache.get_or_compute("k", compute)
+
+    assert second == {"results": [1, 2]}
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_stale_hit_returns_cached_value_and_refreshes_in_background():
+    cache = memory_cache(ttl=0.0, stale_ttl=60.0)
+    cache.backend.set("k", time.time() - 1, '"old"')
+    refreshed = threading.Event()
+
+    def compute():
+        refreshed.set()
+        return "new"
+
+    assert cache.get_or_compute("k", compute) == "old"
+    assert refreshed.wait(5)
+    deadline = time.time() + 5
+    while cache.stats()["refreshes"] == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.backend.get("k")[1] == '"new"'
+
+
+def test_expired_entry_is_recomputed():
+    cache = memory_cache(ttl=10.0)
+    cache.backend.set("k", time.time() - 60, '"old"')
+
+    assert cache.get_or_compute("k", lambda: "new") == "new"
+    assert cache.get("k") == "new"
+
+
+def test_concurrent_misses_compute_once():
+    cache = memory_cache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute)))
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == ["value", "value"]
+    assert len(calls) == 1
+    assert cache.stats()["deduplicated"] == 1
+
+
+def test_failed_compute_is_not_cached():
+    cache = memory_cache()
+
+    def fail():
+        raise ValueError("bad response")
+
+    try:
+        cache.get_or_compute("k", fail)
+    except ValueError:
+        pass
+    assert cache.backend.get("k") is None
+    assert cache.get_or_compute("k", lambda: 1) == 1
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = _MemoryCacheBackend(max_entries=2)
+    backend.set("a", 0, "1")
+    backend.set("b", 0, "2")
+    backend.get("a")
+    backend.set("c", 0, "3")
+
+    assert backend.get("b") is None
+    assert list(backend.iter_payloads()) == ["1", "3"]
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    writer = TTLCache(_SqliteCacheBackend(path, "search_cache"), ttl=60)
+    writer.get_or_compute("k", lambda: {"results": ["a"]})
+    reader = TTLCache(_SqliteCacheBackend(path, "search_cache"), ttl=60)
+
+    assert reader.get_or_compute("k", lambda: {"results": []}) == {"results": ["a"]}
+    assert list(reader.values()) == [{"results": ["a"]}]
+
+
+def test_async_concurrent_misses_compute_once(tmp_path):
+    cache = TTLCache(_SqliteCacheBackend(tmp_path / "cache.sqlite3", "llm_cache"), ttl=60)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return [1]
+
+    async def main():
+        return await asyncio.gather(*(cache.aget_or_compute("k", compute) for _ in range(5)))
+
+    assert asyncio.run(main()) == [[1]] * 5
+    assert len(calls) == 1
+    assert cache.get("k") == [1]
+
+
+def test_async_sqlite_access_runs_off_the_event_loop(tmp_path, monkeypatch):
+    cache = TTLCache(_SqliteCacheBackend(tmp_path / "cache.sqlite3", "llm_cache"), ttl=60)
+    loop_threads = []
+    backend_get = cache.backend.get
+
+    def get(key):
+        loop_threads.append(threading.current_thread())
+        return backend_get(key)
+
+    monkeypatch.setattr(cache.backend, "get", get)
+
+    async def main():
+        async def compute():
+            return 1
+        return await cache.aget_or_compute("k", compute), threading.current_thread()
+
+    value, loop_thread = asyncio.run(main())
+    assert value == 1
+    assert loop_threads and loop_thread not in loop_threads
+
+
+def test_search_cache_key_ignores_domain_order():
+    assert researcher._search_cache_key("q", ["x.com", "twitter.com"], 10, "advanced") == researcher._search_cache_key(
+        "q", ["twitter.com", "x.com"], 10, "advanced"
+    )
+    assert researcher._search_cache_key("q", None, 10, "advanced") != researcher._search_cache_key("q", None, 5, "advanced")
+
+
+def test_run_tavily_query_uses_cache(tavily_stub):
+    cache = memory_cache()
+    first = researcher._run_tavily_query("q", client=tavily_stub, cache=cache)
+    second = researcher._run_tavily_query("q", client=tavily_stub, cache=cache)
+
+    assert first == second
+    assert tavily_stub.calls == 1
+
+
+def test_repeated_runs_reuse_cached_searches(make_components, tavily_stub):
+    components = make_components(tavily_client=tavily_stub, search_cache=memory_cache())
+    config = {"configurable": {"components": components}}
+    researcher.enhanced_app.invoke({"topic": "AI 마케팅"}, config)
+    calls = tavily_stub.calls
+    researcher.enhanced_app.invoke({"topic": "AI 마케팅"}, config)
+
+    assert tavily_stub.calls == calls
@@ -0,0 +1,38 @@
+import researcher
+from researcher import app, enhanced_app, export_value
+
+from conftest import StubOpenAI, StubTavily, breakdown_payload
+
+TOPIC = "AI 마케팅"
+
+
+def config_for(components, **configurable):
+    return {"configurable": {"components": components, **configurable}}
+
+
+def test_enhanced_app_runs_with_injected_clients(make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    result = export_value(enhanced_app.invoke({"topic": TOPIC}, config_for(make_components(openai_client, tavily_client))))
+
+    assert result["main_keyword"]["keyword"] == f"{TOPIC} 키워드"
+    assert result["keyword_breakdown"] == breakdown_payload(f"{TOPIC} 키워드")
+    assert not result.get("errors")
+    assert all(len(result["filtered_results"][platform]) == 5 for platform in ("threads", "x"))
+    assert openai_client.calls == 2
+    assert tavily_client.calls == result["keyword_strategy"]["fanout_query_count"] == 8
+    assert set(result["node_timings"]) == {name for name, _, _ in researcher._ENHANCED_NODES}
+
+
+def test_basic_app_uses_injected_tavily_client(make_components):
+    tavily_client = StubTavily()
+    result = app.invoke({"topic": TOPIC}, config_for(make_components(tavily_client=tavily_client)))
+
+    assert tavily_client.calls == 2
+    assert all(result["search_results"][platform] for platform in ("threads", "x"))
+
+
+def test_components_are_shared_across_runs(make_components):
+    components = make_components()
+
+    assert researcher.get_components(config_for(components)) is components
+    assert researcher.get_components(None) is researcher.get_components({}) is researcher.get_default_components()
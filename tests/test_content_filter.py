@@ -0,0 +1,177 @@
+import re
+import random
+
+import pytest
+
+import researcher
+from researcher import CompiledRuleSet, ContentFilter, select_top_k
+
+from conftest import stub_post
+
+
+@pytest.fixture
+def content_filter():
+    return ContentFilter()
+
+
+def content(url="https://threads.net/t/1", text=None):
+    return {"url": url, "content": stub_post(url) if text is None else text}
+
+
+def test_rule_set_reports_overlapping_and_prefix_literals():
+    rules = CompiledRuleSet([("a", "link", False), ("b", "link in bio", False), ("c", "in bio", False), ("d", "bio", False)])
+
+    assert rules.scan("see link in bio") == {"a", "b", "c", "d"}
+    assert rules.scan("") == set()
+
+
+def test_rule_set_reports_literals_and_regexes_matching_at_same_position():
+    rules = CompiledRuleSet([("literal", "/status/", False), ("regex", r"/status/\d+/reply", True)])
+
+    assert rules.scan("https://x.com/a/status/12/reply") == {"literal", "regex"}
+    assert rules.scan("https://x.com/a/status/12") == {"literal"}
+
+
+def test_rule_engine_matches_naive_per_rule_scan():
+    engine = researcher.ContentRuleEngine(researcher.DEFAULT_CONTENT_RULES)
+    flattened = {
+        rule_classes: engine._flatten(researcher.DEFAULT_CONTENT_RULES, rule_classes)
+        for rule_classes in (researcher._URL_RULE_CLASSES, researcher._TEXT_RULE_CLASSES)
+    }
+
+    def naive(text, rule_classes):
+        return {
+            rule_id for rule_id, pattern, is_regex in flattened[rule_classes]
+            if (re.search(pattern, text, re.IGNORECASE) if is_regex else pattern.lower() in text)
+        }
+
+    rng = random.Random(3)
+    fragments = ["/profile/", "/u/", "/@", "/thread/", "/status/1/reply", "/replies", "follow me", "dm me", "link in bio", "hello"]
+    for _ in range(300):
+        text = "".join(rng.choice(fragments) for _ in range(4))
+        assert engine.scan_url(text) == naive(text, researcher._URL_RULE_CLASSES)
+        assert engine.scan_text(text) == naive(text, researcher._TEXT_RULE_CLASSES)
+
+
+def test_is_valid_content(content_filter):
+    assert content_filter.is_valid_content(content())
+    assert not content_filter.is_valid_content(content("https://threads.net/profile/a"))
+    assert not content_filter.is_valid_content(content("https://x.com/a/status/1/reply"))
+    assert not content_filter.is_valid_content(content(text="@someone " + stub_post("r")))
+    assert not content_filter.is_valid_content(content(text="too short"))
+    assert not content_filter.is_valid_content(content(text=stub_post("s") + " follow me and dm me"))
+    assert content_filter.is_valid_content(content(text=stub_post("s") + " follow me"))
+
+
+def test_custom_rules_file_replaces_a_rule_class(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text('{"spam": ["buy now", {"id": "promo", "pattern": "promo\\\\d+", "regex": true}]}', encoding="utf-8")
+    rules = researcher.load_content_rules(str(path))
+    content_filter = ContentFilter(rules)
+
+    assert content_filter.match_rules({"url": "", "content": "BUY NOW with PROMO20"}) == {"spam:buy now", "spam:promo"}
+    assert content_filter.match_rules({"url": "", "content": "follow me"}) == set()
+    assert content_filter.profile_patterns == researcher.DEFAULT_CONTENT_RULES["profile"]
+
+
+def test_text_analysis_is_shared_between_filter_and_scoring(content_filter):
+    researcher.analyze_text.cache_clear()
+    item = content()
+    content_filter.is_valid_content(item)
+    content_filter.calculate_content_quality(item)
+    content_filter.quality_upper_bound(item)
+
+    info = researcher.analyze_text.cache_info()
+    assert info.misses == 1 and info.hits >= 2
+
+
+def test_text_analysis_fields():
+    analysis = researcher.TextAnalysis("Hello hello World? #tag @me !")
+
+    assert analysis.token_count == 6
+    assert analysis.unique_word_count == 5
+    assert analysis.indicator_count == 4
+    analysis.prime((7, 2))
+    assert analysis.blob_counts == (7, 2) and analysis.sentence_count == 2
+    analysis.prime((1, 1))
+    assert analysis.blob_counts == (7, 2)
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 10, 50])
+def test_select_top_k_matches_stable_sort(k):
+    rng = random.Random(k)
+    items = [rng.choice([0.1, 0.2, 0.3, 0.5, 0.8]) for _ in range(40)]
+    expected = sorted(enumerate(items), key=lambda pair: pair[1], reverse=True)[:k]
+
+    top = select_top_k(list(enumerate(items)), k, lambda pair: pair[1])
+
+    assert [(score, item) for score, item in top] == [(pair[1], pair) for pair in expected]
+
+
+def test_select_top_k_skips_items_whose_bound_cannot_enter_the_heap():
+    scored = []
+
+    def score(value):
+        scored.append(value)
+        return value
+
+    top = select_top_k([0.9, 0.8, 0.1, 0.2, 0.95], 2, score, upper_bound=lambda value: value)
+
+    assert [value for value, _ in top] == [0.95, 0.9]
+    assert scored == [0.9, 0.8, 0.95]
+
+
+def test_quality_upper_bound_is_never_below_the_full_score(content_filter):
+    for i in range(50):
+        item = content(f"https://threads.net/t/{i}", stub_post(str(i), words=5 + i * 3) + " ?!" * (i % 7))
+        assert content_filter.quality_upper_bound(item) >= content_filter.calculate_content_quality(item)
+        assert content_filter.quality_upper_bound(item) >= content_filter.calculate_content_quality(item, include_readability=False)
+
+
+def test_rank_contents_matches_exhaustive_scoring(content_filter):
+    items = [content(f"https://threads.net/t/{i}", stub_post(str(i), words=10 + i)) for i in range(30)]
+    items.append(content("https://threads.net/profile/a"))
+    expected = sorted(
+        (item for item in items if content_filter.is_valid_content(item)),
+        key=content_filter.calculate_content_quality,
+        reverse=True,
+    )[:5]
+
+    top, metrics = content_filter.rank_contents(items, 5)
+
+    assert [item for _, item in top] == expected
+    assert metrics["candidates"] == 31 and metrics["rejected_by_filter"] == 1
+    assert metrics["full_scored"] + metrics["pruned_by_bound"] + metrics["degraded_scored"] == 30
+
+
+def test_rank_contents_degrades_after_cpu_budget(content_filter):
+    items = [content(f"https://threads.net/t/{i}") for i in range(20)]
+
+    _, metrics = content_filter.rank_contents(items, 20, cpu_budget=0.0)
+
+    assert metrics["full_scored"] == 0 and metrics["degraded_scored"] == 20
+
+
+def test_prime_text_analyses_passes_items_through_without_a_pool():
+    items = [content(f"https://threads.net/t/{i}") for i in range(5)]
+
+    assert list(researcher.prime_text_analyses(items, researcher._content_text, readability=True)) == items
+
+
+def test_prime_text_analyses_fills_analyses_from_the_pool(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    researcher.analyze_text.cache_clear()
+    items = [{"content": f"document number {i}"} for i in range(6)]
+    monkeypatch.setattr(researcher, "PARALLEL_ANALYSIS_MIN_DOCUMENTS", 1)
+    monkeypatch.setattr(researcher, "_scoring_process_count", lambda: 2)
+    monkeypatch.setattr(researcher, "_analyze_text_batch", lambda texts: [(len(text.split()), 1) for text in texts])
+    with ThreadPoolExecutor(2) as pool:
+        monkeypatch.setattr(researcher, "_get_scoring_pool", lambda: pool)
+        primed = list(researcher.prime_text_analyses(
+            items, researcher._content_text, readability=True, want=lambda item: item["content"] != "document number 0"
+        ))
+
+    assert primed == items
+    assert researcher.analyze_text("document number 0")._blob_counts is researcher._UNSET
+    assert researcher.analyze_text("document number 3").blob_counts == (3, 1)
@@ -0,0 +1,74 @@
+import pytest
+
+import researcher
+from researcher import SearchResult, canonicalize_url, deduplicate_results
+
+from conftest import stub_post
+
+
+@pytest.mark.parametrize("variant", [
+    "https://twitter.com/founder/status/123",
+    "https://mobile.twitter.com/founder/status/123?s=20&t=abc",
+    "https://www.x.com/founder/status/123/",
+    "https://X.com/founder/status/123#reply",
+])
+def test_x_url_variants_share_a_canonical_form(variant):
+    assert canonicalize_url(variant) == "x.com/founder/status/123"
+
+
+def test_threads_domains_are_aliased():
+    assert canonicalize_url("https://www.threads.com/@a/post/1?igshid=x") == canonicalize_url("https://threads.net/@a/post/1")
+    assert canonicalize_url("") == ""
+
+
+def test_url_duplicates_keep_the_best_representative_in_input_order():
+    results = [
+        {"url": "https://x.com/a/status/1", "content": stub_post("a"), "score": 0.2},
+        {"url": "https://threads.net/t/2", "content": stub_post("b"), "score": 0.5},
+        {"url": "https://twitter.com/a/status/1?s=20", "content": stub_post("c"), "score": 0.9},
+    ]
+
+    kept = deduplicate_results(results, lambda result: result["score"])
+
+    assert kept == [results[1], results[2]]
+
+
+def test_near_duplicate_bodies_collapse_across_platforms():
+    body = stub_post("cross-post", words=30)
+    results = [
+        {"url": "https://threads.net/t/1", "content": body, "score": 0.4},
+        {"url": "https://x.com/a/status/9", "content": body.replace("#startup?", "#startup"), "score": 0.6},
+        {"url": "https://x.com/b/status/7", "content": stub_post("different", words=30), "score": 0.1},
+    ]
+
+    kept = deduplicate_results(results, lambda result: result["score"])
+
+    assert kept == results[1:]
+
+
+def test_short_texts_are_only_deduplicated_by_url():
+    results = [{"url": f"https://x.com/a/status/{i}", "content": "same short text"} for i in range(3)]
+
+    assert deduplicate_results(results, lambda result: 0) == results
+
+
+def test_merge_prefers_copies_that_pass_the_content_filter():
+    content_filter = researcher.ContentFilter()
+    body = stub_post("shared", words=30)
+    invalid_copy = {"url": "https://x.com/a/status/1/reply", "content": body, "score": 0.9}
+    valid_copy = {"url": "https://x.com/a/status/1", "content": body, "score": 0.1}
+
+    merged = researcher._merge_unique_by_url([[invalid_copy], [valid_copy]], content_filter)
+
+    assert merged == [valid_copy]
+    assert researcher._merge_unique_by_url([[invalid_copy], [valid_copy]]) == [invalid_copy]
+
+
+def test_platform_deduplicator_keeps_highest_quality_copy():
+    body = stub_post("cross-post", words=30)
+    threads = SearchResult.from_tavily({"url": "https://threads.net/t/1", "content": body, "quality_score": 0.7}, "threads")
+    x = SearchResult.from_tavily({"url": "https://x.com/a/status/1", "content": body, "quality_score": 0.5}, "x")
+
+    update = researcher.deduplicate_platform_results({"search_results": {"threads": [threads], "x": [x]}})
+
+    assert update == {"filtered_results": {"threads": [threads], "x": []}}
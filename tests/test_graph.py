@@ -0,0 +1,201 @@
+import time
+import asyncio
+import threading
+
+import pytest
+
+import researcher
+from researcher import InMemorySink, enhanced_app, export_value
+
+from conftest import AsyncStubOpenAI, AsyncStubTavily, StubOpenAI, StubTavily, memory_cache
+
+TOPIC = "AI 마케팅"
+
+
+def config_for(components, **configurable):
+    return {"configurable": {"components": components, **configurable}}
+
+
+def test_ainvoke_uses_async_clients(make_components):
+    openai_client, tavily_client = AsyncStubOpenAI(), AsyncStubTavily()
+    sink = InMemorySink()
+    config = config_for(make_components(openai_client, tavily_client), instrumentation_sink=sink)
+
+    result = export_value(asyncio.run(enhanced_app.ainvoke({"topic": TOPIC}, config)))
+    sync_result = export_value(enhanced_app.invoke({"topic": TOPIC}, config_for(make_components())))
+
+    assert openai_client.calls == 2 and tavily_client.calls == 8
+    assert result["filtered_results"] == sync_result["filtered_results"]
+    # 비동기 구현이 없는 동기 노드도 계측된 채 실행
+    assert {record["node"] for record in sink.records} == {name for name, _, _ in researcher._ENHANCED_NODES}
+
+
+def test_fanout_runs_every_planned_query(make_components):
+    tavily_client = StubTavily()
+    result = enhanced_app.invoke({"topic": TOPIC}, config_for(make_components(tavily_client=tavily_client)))
+
+    assert tavily_client.calls == result["keyword_strategy"]["fanout_query_count"] == 8
+    assert sorted(tavily_client.queries) == sorted(query for queries in result["search_query_plan"].values() for query in queries)
+
+
+def test_fanout_queries_respect_the_concurrency_limit(make_components):
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    class SlowTavily(StubTavily):
+        def search(self, query, max_results=5, include_domains=None, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return super().search(query, max_results, include_domains)
+
+    tavily_client = SlowTavily()
+    enhanced_app.invoke({"topic": TOPIC}, config_for(make_components(tavily_client=tavily_client), max_search_concurrency=2))
+
+    assert tavily_client.calls == 8
+    assert 1 < peak[0] <= 4  # 플랫폼 노드 2개 x 노드당 최대 2개
+
+
+def test_ainvoke_runs_injected_sync_clients_in_threads(make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    result = export_value(asyncio.run(enhanced_app.ainvoke({"topic": TOPIC}, config_for(make_components(openai_client, tavily_client)))))
+
+    assert not result.get("errors")
+    assert openai_client.calls == 2 and tavily_client.calls == 8
+
+
+def test_sink_records_per_node_external_calls(make_components):
+    sink = InMemorySink()
+    enhanced_app.invoke({"topic": TOPIC}, config_for(make_components(), instrumentation_sink=sink))
+    records = {record["node"]: record for record in sink.records}
+
+    assert records["Main Keyword Extractor"]["openai_calls"] == 1
+    assert records["Main Keyword Extractor"]["openai_prompt_tokens"] == 10
+    assert records["Enhanced Threads Search"]["tavily_calls"] == 4
+    assert records["Enhanced X Search"]["tavily_results"] == 40
+    assert records["Sub Keyword Evaluator"]["openai_calls"] == 0
+    assert all(record["graph"] == "enhanced" and record["error"] is None for record in sink.records)
+
+
+def test_failing_node_is_recorded_and_reraised():
+    sink = InMemorySink()
+
+    def broken(state):
+        raise RuntimeError("boom")
+
+    node = researcher._instrumented("test", "Broken", broken)
+    with pytest.raises(RuntimeError):
+        node.invoke({}, {"configurable": {"instrumentation_sink": sink}})
+
+    assert sink.records[0]["node"] == "Broken" and "boom" in sink.records[0]["error"]
+
+
+def test_stream_emits_events_as_stages_finish(make_components):
+    events = list(researcher.stream_enhanced_research(TOPIC, config_for(make_components())))
+    types = [event["type"] for event in events]
+
+    assert types.index("main_keyword") < types.index("keyword_breakdown") < types.index("platform_results")
+    assert types.index("filtered_results") < types.index("strategy") < types.index("summary") == len(types) - 1
+    assert "error" not in types
+    assert {event["data"]["platform"] for event in events if event["type"] == "platform_results"} == {"threads", "x"}
+
+
+def test_astream_matches_stream_event_types(make_components):
+    async def collect():
+        config = config_for(make_components(AsyncStubOpenAI(), AsyncStubTavily()))
+        return [event async for event in researcher.astream_enhanced_research(TOPIC, config)]
+
+    sync_types = sorted(event["type"] for event in researcher.stream_enhanced_research(TOPIC, config_for(make_components())))
+
+    assert sorted(event["type"] for event in asyncio.run(collect())) == sync_types
+
+
+def test_tiny_deadline_skips_llm_and_search_stages(make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    result = export_value(enhanced_app.invoke(
+        {"topic": TOPIC}, config_for(make_components(openai_client, tavily_client), deadline_seconds=0.01)
+    ))
+
+    assert {"main_keyword_llm", "keyword_breakdown_llm", "secondary_searches"} <= set(result["skipped_stages"])
+    assert "platform_search:threads" in result["skipped_stages"]
+    assert openai_client.calls == tavily_client.calls == 0
+    assert result["deadline_at"] is not None
+
+
+def test_deadline_helpers():
+    assert researcher._request_deadline({}, None) is None
+    assert researcher._request_deadline({"deadline_at": 5.0}, {"configurable": {"deadline_at": None}}) is None
+    assert researcher._request_deadline({"deadline_at": 5.0}, {"configurable": None}) == 5.0
+    assert 0 < researcher._request_deadline({}, {"configurable": {"deadline_seconds": 10}}) - time.time() <= 10
+    assert researcher._with_deadline({}, None) == {}
+    assert researcher._with_deadline({}, 7.0) == {"deadline_at": 7.0}
+
+
+def test_scoring_budget_is_split_between_platforms():
+    skipped = []
+
+    assert researcher._platform_scoring_budget({"configurable": {"scoring_cpu_budget_ms": 100}}, None, "x", skipped) == pytest.approx(0.05)
+    assert researcher._platform_scoring_budget(None, None, "x", skipped) is None
+    assert researcher._platform_scoring_budget(None, time.time() + 0.1, "x", skipped) == 0.0
+    assert skipped == ["readability:x"]
+
+
+@pytest.fixture
+def checkpointed(tmp_path, monkeypatch):
+    path = str(tmp_path / "checkpoints.sqlite")
+    checkpointed_app = researcher.get_checkpointed_enhanced_app.__wrapped__(path)
+    monkeypatch.setattr(researcher, "get_checkpointed_enhanced_app", lambda: checkpointed_app)
+    return checkpointed_app
+
+
+def test_completed_thread_returns_the_stored_result(checkpointed, make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    config = config_for(make_components(openai_client, tavily_client))
+
+    first = researcher.run_checkpointed_research(TOPIC, thread_id="t1", config=config)
+    calls = (openai_client.calls, tavily_client.calls)
+
+    assert researcher.run_checkpointed_research(thread_id="t1", config=config) == first
+    assert (openai_client.calls, tavily_client.calls) == calls
+
+
+def test_checkpointed_run_resumes_interrupted_thread(checkpointed, make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    config = config_for(make_components(openai_client, tavily_client))
+    run_config = {"configurable": {**config["configurable"], "thread_id": "t2"}}
+    checkpointed.invoke({"topic": TOPIC}, run_config, interrupt_before=["Enhanced Threads Search", "Enhanced X Search"])
+    assert openai_client.calls == 2 and tavily_client.calls == 0
+
+    result = researcher.run_checkpointed_research(thread_id="t2", config=config)
+
+    assert openai_client.calls == 2 and tavily_client.calls == 8
+    assert all(len(result["filtered_results"][platform]) == 5 for platform in ("threads", "x"))
+
+
+def test_new_thread_reuses_recent_keyword_stage(checkpointed, make_components):
+    openai_client = StubOpenAI()
+    config = config_for(make_components(openai_client))
+
+    first = researcher.run_checkpointed_research(TOPIC, thread_id="a", config=config)
+    second = researcher.run_checkpointed_research(f" {TOPIC.lower()} ", thread_id="b", config=config)
+    fresh = researcher.run_checkpointed_research(TOPIC, thread_id="c", config=config, reuse_keywords_within=0)
+
+    assert openai_client.calls == 4
+    assert second["keyword_strategy"]["reused_from_thread"] == "a"
+    assert second["selected_sub_keywords"] == first["selected_sub_keywords"]
+    assert "reused_from_thread" not in fresh["keyword_strategy"]
+
+
+def test_research_topics_prefetches_keywords_in_batches(make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    components = make_components(openai_client, tavily_client, llm_cache=memory_cache())
+    topics = ["AI 마케팅", "노코드 툴", "AI 마케팅"]
+
+    results = researcher.research_topics(topics, config=config_for(components), max_workers=3)
+
+    assert [entry["topic"] for entry in results] == topics
+    assert all(entry["error"] is None for entry in results)
+    assert results[1]["result"]["main_keyword"]["keyword"] == "노코드 툴 키워드"
+    assert openai_client.calls == 2  # 메인 키워드 묶음 1회 + 브레이크다운 묶음 1회
@@ -0,0 +1,113 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+import researcher
+from researcher import IdfModel, build_idf_model, iter_corpus_documents
+
+from conftest import memory_cache
+
+DOCUMENTS = [
+    "AI marketing for startup founders",
+    "startup growth marketing playbook",
+    "AI tools for founders",
+    "마케팅을 배우는 스타트업에서",
+    "스타트업 마케팅 전략",
+]
+
+
+def test_korean_particles_are_stripped_only_from_long_stems():
+    assert researcher._idf_tokens("마케팅을 배우는 스타트업에서 the AI") == ["마케팅", "배우", "스타트업", "ai"]
+    assert researcher._idf_tokens("나는") == ["나는"]
+
+
+def test_build_and_load_matches_smooth_idf(tmp_path):
+    meta = build_idf_model(DOCUMENTS, str(tmp_path), min_df=1)
+    model = IdfModel.load(str(tmp_path))
+    weights = model.weights(["marketing", "스타트업", "unseen"])
+
+    assert meta["document_count"] == model.document_count == 5
+    assert weights["marketing"] == pytest.approx(math.log(6 / 3) + 1, rel=1e-6)
+    assert weights["스타트업"] == pytest.approx(math.log(6 / 3) + 1, rel=1e-6)
+    assert model.weights(["ai"])["ai"] == pytest.approx(math.log(6 / 3) + 1, rel=1e-6)
+    assert model.weights(["전략"])["전략"] == pytest.approx(math.log(6 / 2) + 1, rel=1e-6)
+    assert weights["unseen"] == pytest.approx(model.unknown_idf)
+    assert isinstance(model.hashes, np.memmap)
+
+
+def test_min_df_drops_rare_tokens(tmp_path):
+    build_idf_model(DOCUMENTS, str(tmp_path), min_df=2)
+    model = IdfModel.load(str(tmp_path))
+
+    assert model.weights(["playbook"])["playbook"] == pytest.approx(model.unknown_idf)
+    assert model.weights(["founders"])["founders"] < model.unknown_idf
+
+
+def test_empty_corpus_is_rejected_without_replacing_the_model(tmp_path):
+    build_idf_model(DOCUMENTS, str(tmp_path), min_df=1)
+    current = (tmp_path / "CURRENT").read_text()
+
+    with pytest.raises(ValueError):
+        build_idf_model(["", "the and"], str(tmp_path))
+    assert (tmp_path / "CURRENT").read_text() == current
+
+
+def test_rebuilds_publish_new_versions_and_keep_recent_ones(tmp_path):
+    versions = [build_idf_model(DOCUMENTS[:index], str(tmp_path), min_df=1)["version"] for index in range(1, 6)]
+
+    assert (tmp_path / "CURRENT").read_text() == versions[-1]
+    assert sorted(path.name for path in (tmp_path / "versions").iterdir()) == sorted(versions[-researcher._IDF_KEEP_VERSIONS:])
+    assert IdfModel.load(str(tmp_path)).document_count == 5
+
+
+def test_model_opened_before_a_rebuild_keeps_working(tmp_path):
+    build_idf_model(DOCUMENTS, str(tmp_path), min_df=1)
+    model = IdfModel.load(str(tmp_path))
+    before = model.weights(["marketing"])
+    build_idf_model(DOCUMENTS * 2, str(tmp_path), min_df=1)
+
+    assert model.weights(["marketing"]) == before
+
+
+def test_legacy_flat_layout_and_missing_model(tmp_path):
+    build_idf_model(DOCUMENTS, str(tmp_path / "built"), min_df=1)
+    version = (tmp_path / "built" / "CURRENT").read_text()
+    legacy = tmp_path / "legacy"
+    (tmp_path / "built" / "versions" / version).rename(legacy)
+
+    assert IdfModel.load(str(legacy)).document_count == 5
+    assert researcher._idf_model_directory(str(tmp_path / "missing")) is None
+    with pytest.raises(FileNotFoundError):
+        IdfModel.load(str(tmp_path / "missing"))
+
+
+def test_tokenizer_version_mismatch_is_rejected(tmp_path):
+    build_idf_model(DOCUMENTS, str(tmp_path), min_df=1)
+    meta_path = researcher._idf_model_directory(str(tmp_path)) / "meta.json"
+    meta_path.write_text(json.dumps({**json.loads(meta_path.read_text()), "tokenizer": "old"}))
+
+    with pytest.raises(ValueError):
+        IdfModel.load(str(tmp_path))
+
+
+def test_corpus_documents_are_deduplicated_across_cache_and_files(tmp_path):
+    cache = memory_cache()
+    cache.set("a", [{"url": "https://x.com/a/status/1", "content": "first"}, {"url": "", "snippet": "second"}])
+    path = tmp_path / "extra.jsonl"
+    path.write_text(
+        json.dumps({"url": "https://twitter.com/a/status/1", "content": "first copy"}) + "\n" + json.dumps("third") + "\n",
+        encoding="utf-8",
+    )
+
+    assert list(iter_corpus_documents(cache, [str(path)])) == ["first", "second", "third"]
+
+
+def test_keyword_coherence_uses_the_corpus_weights(tmp_path):
+    build_idf_model(DOCUMENTS * 3 + ["AI news"] * 20, str(tmp_path), min_df=1)
+    ki = researcher.KeywordIntelligence(openai_client=object(), llm_cache=None, search_corpus=None, idf_model=IdfModel.load(str(tmp_path)))
+
+    rare, common, unrelated = ki._batch_topic_coherence(["startup marketing", "AI news", "weather report"], "AI startup marketing")
+
+    assert rare > common > unrelated == 0.0
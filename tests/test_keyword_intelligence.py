@@ -0,0 +1,244 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from researcher import KeywordIntelligence, SearchCorpus, _llm_cache_key
+
+from conftest import AsyncStubOpenAI, StubOpenAI, breakdown_payload, default_completion, main_keyword_payload, memory_cache
+
+
+def reference_coherence(keyword, topic):
+    """기존 구현: 후보마다 [keyword, topic] 두 문서로 TF-IDF 를 새로 fit"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    try:
+        matrix = TfidfVectorizer(max_features=1000, stop_words="english").fit_transform([keyword, topic])
+        return min(cosine_similarity(matrix[0:1], matrix[1:2])[0][0] * 1.2, 1.0)
+    except ValueError:
+        keyword_words, topic_words = set(keyword.lower().split()), set(topic.lower().split())
+        return min(len(keyword_words & topic_words) / max(len(keyword_words), len(topic_words)), 1.0)
+
+
+def intelligence(openai_client=None, **kwargs):
+    kwargs.setdefault("llm_cache", None)
+    kwargs.setdefault("search_corpus", None)
+    kwargs.setdefault("idf_model", None)
+    return KeywordIntelligence(openai_client=openai_client or StubOpenAI(), **kwargs)
+
+
+@pytest.mark.parametrize("topic", ["AI startup marketing strategy", "AI 스타트업 마케팅", "the and of"])
+def test_batched_topic_coherence_matches_per_keyword_tfidf(topic):
+    keywords = [
+        "AI marketing tips for startup founders", "marketing marketing growth", "스타트업 마케팅 방법",
+        "AI 2024 트렌드 best tools", "completely unrelated words", "the of and",
+    ]
+    scores = intelligence()._batch_topic_coherence(keywords, topic)
+
+    assert scores.tolist() == pytest.approx([reference_coherence(keyword, topic) for keyword in keywords], abs=1e-9)
+
+
+def test_score_sub_keywords_matches_single_keyword_scorers():
+    ki = intelligence()
+    keywords = [{"keyword": name} for name in ("AI 마케팅 방법 가이드", "어떻게 AI 마케팅 시작", "2024 최신 AI 트렌드 추천 순위 비교")]
+    evaluations = ki.score_sub_keywords(keywords, "AI 마케팅")
+
+    for evaluation in evaluations:
+        keyword = evaluation["keyword"]
+        assert evaluation["engagement_potential"] == ki._predict_engagement_potential(keyword)
+        assert evaluation["trend_momentum"] == ki._analyze_trend_momentum(keyword)
+        assert evaluation["competition_advantage"] == ki._assess_competition_advantage(keyword)
+        assert evaluation["commercial_value"] == ki._evaluate_commercial_value(keyword)
+    assert ki.score_sub_keywords([], "AI") == []
+
+
+def test_evaluate_sub_keywords_returns_top_two():
+    ki = intelligence()
+    keywords = [{"keyword": keyword["keyword"]} for keyword in breakdown_payload("AI 마케팅")]
+    selected = ki.evaluate_sub_keywords(keywords, "AI 마케팅", "AI 마케팅")
+    ranked = sorted(ki.score_sub_keywords(keywords, "AI 마케팅"), key=lambda item: item["final_score"], reverse=True)
+
+    assert [item["keyword"] for item in selected] == [item["keyword"] for item in ranked[:2]]
+
+
+def test_llm_responses_are_cached_and_shared_with_async_path():
+    cache = memory_cache()
+    sync_client, async_client = StubOpenAI(), AsyncStubOpenAI()
+    ki = intelligence(sync_client, llm_cache=cache, async_openai_client=async_client)
+
+    first = ki.extract_main_keyword("AI 마케팅")
+    second = ki.extract_main_keyword("AI 마케팅")
+    third = asyncio.run(ki.aextract_main_keyword("AI 마케팅"))
+
+    assert first == second == third
+    assert first["keyword"] == "AI 마케팅 키워드"
+    assert sync_client.calls == 1 and async_client.calls == 0
+
+
+def test_malformed_llm_response_falls_back_without_caching():
+    cache = memory_cache()
+    client = StubOpenAI(lambda prompt: {"keyword": "missing fields"})
+    ki = intelligence(client, llm_cache=cache)
+
+    assert ki.extract_main_keyword("AI startup marketing")["keyword"] == "marketing"
+    assert ki.extract_main_keyword("AI startup marketing")["keyword"] == "marketing"
+    assert client.calls == 2
+    assert list(cache.values()) == []
+
+
+@pytest.mark.parametrize("response", [[], {"keyword": "x"}, [{"type": "related"}], [{"keyword": " "}], "not json"])
+def test_invalid_breakdown_is_rejected(response):
+    cache = memory_cache()
+    client = StubOpenAI(lambda prompt: response)
+    ki = intelligence(client, llm_cache=cache)
+
+    assert ki.generate_keyword_breakdown("AI", "AI 마케팅") == ki._fallback_breakdown("AI")
+    assert list(cache.values()) == []
+
+
+def test_deadline_disables_llm_calls():
+    client = StubOpenAI()
+    ki = intelligence(client)
+
+    assert ki.extract_main_keyword("AI 마케팅", allow_llm=False) == ki._fallback_main_keyword("AI 마케팅")
+    assert ki.generate_keyword_breakdown("AI", "AI 마케팅", allow_llm=False) == ki._fallback_breakdown("AI")
+    assert client.calls == 0
+
+
+def test_prefetch_fills_per_topic_cache_entries_in_one_call():
+    cache = memory_cache()
+    client = StubOpenAI()
+    ki = intelligence(client, llm_cache=cache)
+    topics = ["AI 마케팅", "노코드 툴", "AI 마케팅"]
+
+    assert ki.prefetch_main_keywords(topics) == 2
+    main_keywords = [ki.extract_main_keyword(topic) for topic in topics]
+    assert ki.prefetch_keyword_breakdowns([(keyword["keyword"], topic) for keyword, topic in zip(main_keywords, topics)]) == 2
+    breakdown = ki.generate_keyword_breakdown(main_keywords[1]["keyword"], topics[1])
+
+    assert [keyword["keyword"] for keyword in main_keywords] == ["AI 마케팅 키워드", "노코드 툴 키워드", "AI 마케팅 키워드"]
+    assert breakdown == breakdown_payload("노코드 툴 키워드")
+    assert client.calls == 2
+    assert ki.prefetch_main_keywords(topics) == 0
+    assert client.calls == 2
+
+
+def test_prefetch_skips_invalid_batch_items():
+    cache = memory_cache()
+    client = StubOpenAI(lambda prompt: [{"index": 0, **main_keyword_payload("ok")}, {"index": 1, "keyword": "partial"}])
+    ki = intelligence(client, llm_cache=cache)
+
+    assert ki.prefetch_main_keywords(["a", "b"]) == 1
+    assert cache.get(_llm_cache_key("gpt-4", ki._main_keyword_prompt("b"), 0.3)) is None
+
+def test_prefetch_caches_only_per_topic_entries():
+    cache = memory_cache()
+    ki = intelligence(StubOpenAI(), llm_cache=cache)
+
+    assert ki.prefetch_main_keywords(["AI 마케팅", "노코드 툴"]) == 2
+    assert sorted(value["keyword"] for value in cache.values()) == ["AI 마케팅 키워드", "노코드 툴 키워드"]
+
+
+def test_prefetch_requests_chunks_concurrently():
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    def respond(prompt):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return default_completion(prompt)
+
+    client = StubOpenAI(respond)
+    ki = intelligence(client, llm_cache=memory_cache())
+    with ThreadPoolExecutor(3) as executor:
+        filled = ki.prefetch_main_keywords(["a", "b", "c"], chunk_size=1, executor=executor)
+
+    assert filled == 3 and client.calls == 3
+    assert peak[0] > 1
+
+
+def marketing_corpus(documents=12):
+    corpus = SearchCorpus()
+    corpus.add_results(
+        {"url": f"https://threads.net/@a/post/{i}", "content": f"marketing playbook for founders: growth loops, pricing page tests and retention emails {i}"}
+        for i in range(documents)
+    )
+    return corpus
+
+
+def test_search_corpus_expansion_is_confident_with_enough_support():
+    candidates, confidence = marketing_corpus().expand("marketing")
+
+    assert confidence == 1.0
+    assert len(candidates) >= 10
+    assert all(candidate["keyword"].startswith("marketing ") and candidate["source"] == "local" for candidate in candidates)
+    assert candidates[0]["relevance"] == 1.0
+    assert marketing_corpus(3).expand("marketing")[1] < 1.0
+    assert SearchCorpus().expand("the")[0] == []
+
+
+def test_search_corpus_deduplicates_and_evicts_oldest():
+    corpus = SearchCorpus(max_documents=2)
+    assert corpus.add_results([{"url": "https://x.com/a/status/1", "content": "alpha beta"}] * 2) == 1
+    corpus.add_results([{"url": "https://twitter.com/a/status/1", "content": "alpha beta"}])
+    corpus.add_results([{"url": "https://x.com/a/status/2", "content": "gamma"}, {"url": "https://x.com/a/status/3", "content": "delta"}])
+
+    assert len(corpus) == 2
+    assert "alpha" not in corpus._postings
+
+
+def test_local_breakdown_skips_the_llm_when_confident():
+    client = StubOpenAI()
+    ki = intelligence(client, search_corpus=marketing_corpus())
+    breakdown = ki.generate_keyword_breakdown("marketing", "startup marketing")
+
+    assert len(breakdown) == 10
+    assert all(keyword["source"] == "local" for keyword in breakdown)
+    assert client.calls == 0
+
+
+def test_weak_local_evidence_falls_back_to_llm():
+    client = StubOpenAI()
+    ki = intelligence(client, search_corpus=marketing_corpus(3))
+
+    assert ki.generate_keyword_breakdown("marketing", "startup marketing") == breakdown_payload("marketing")
+    assert client.calls == 1
+
+
+def test_concurrent_local_breakdowns_schedule_one_refinement():
+    def respond(prompt):
+        time.sleep(0.1)
+        return default_completion(prompt)
+
+    client = StubOpenAI(respond)
+    ki = intelligence(client, llm_cache=memory_cache(), search_corpus=marketing_corpus())
+    barrier = threading.Barrier(8)
+
+    def breakdown(_):
+        barrier.wait()
+        return ki.generate_keyword_breakdown("marketing", "startup marketing")
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(breakdown, range(8)))
+    deadline = time.monotonic() + 5
+    while ki._refinements and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert all(result[0]["source"] == "local" for result in results)
+    assert client.calls == 1
+
+
+def test_async_local_breakdown_matches_sync():
+    corpus = marketing_corpus()
+    client = AsyncStubOpenAI()
+    ki = intelligence(StubOpenAI(), search_corpus=corpus, async_openai_client=client)
+
+    assert asyncio.run(ki.agenerate_keyword_breakdown("marketing", "startup marketing")) == ki.generate_keyword_breakdown(
+        "marketing", "startup marketing"
+    )
+    assert client.calls == 0
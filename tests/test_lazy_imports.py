@@ -0,0 +1,5 @@
+import researcher_bench
+
+
+def test_import_does_not_load_heavy_dependencies():
+    assert researcher_bench.measure_import_time()["loaded_heavy_modules"] == []
@@ -0,0 +1,177 @@
+import time
+import asyncio
+
+import pytest
+
+import researcher
+from researcher import CircuitBreaker, ResiliencePolicy, UpstreamUnavailable, acall_with_resilience, call_with_resilience
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def flaky(failures, value="ok", error=ConnectionError):
+    calls = []
+
+    def fn(timeout):
+        calls.append(timeout)
+        if len(calls) <= failures:
+            raise error("upstream down")
+        return value
+    return fn, calls
+
+
+def test_retries_then_succeeds_and_passes_attempt_timeout():
+    fn, calls = flaky(2)
+
+    assert call_with_resilience("tavily", fn) == "ok"
+    assert len(calls) == 3
+    assert all(0 < timeout <= 5.0 for timeout in calls)
+    assert researcher.CIRCUIT_BREAKERS["tavily"].state == "closed"
+
+
+def test_deadline_caps_attempt_timeout():
+    fn, calls = flaky(0)
+    call_with_resilience("tavily", fn, deadline_at=time.time() + 1.0)
+
+    assert calls[0] <= 1.0
+
+
+def test_expired_deadline_does_not_call_upstream():
+    fn, calls = flaky(0)
+
+    with pytest.raises(UpstreamUnavailable):
+        call_with_resilience("tavily", fn, deadline_at=time.time() - 1)
+    assert calls == []
+
+
+def test_client_errors_are_not_retried_or_counted():
+    breaker = CircuitBreaker("openai", failure_threshold=1)
+    researcher.CIRCUIT_BREAKERS["openai"] = breaker
+    fn, calls = flaky(5, error=lambda message: StatusError(400))
+
+    with pytest.raises(UpstreamUnavailable):
+        call_with_resilience("openai", fn)
+    assert len(calls) == 1
+    assert breaker.state == "closed"
+
+
+def test_rate_limits_are_retried():
+    fn, calls = flaky(1, error=lambda message: StatusError(429))
+
+    assert call_with_resilience("openai", fn) == "ok"
+    assert len(calls) == 2
+
+
+def test_attempt_timeout_is_enforced():
+    researcher.RESILIENCE_POLICIES["tavily"] = ResiliencePolicy(timeout=0.05, retries=0)
+
+    def slow(timeout):
+        time.sleep(0.5)
+        return "late"
+
+    started = time.monotonic()
+    with pytest.raises(UpstreamUnavailable):
+        call_with_resilience("tavily", slow)
+    assert time.monotonic() - started < 0.4
+
+
+def test_hedged_request_wins_over_slow_first_attempt():
+    researcher.RESILIENCE_POLICIES["tavily"] = ResiliencePolicy(timeout=2.0, retries=0, hedge_after=0.05)
+    calls = []
+
+    def fn(timeout):
+        calls.append(timeout)
+        if len(calls) == 1:
+            time.sleep(1.0)
+            return "slow"
+        return "hedged"
+
+    assert call_with_resilience("tavily", fn) == "hedged"
+    assert len(calls) == 2
+
+
+def test_breaker_opens_and_fails_fast():
+    breaker = CircuitBreaker("tavily", failure_threshold=3, reset_timeout=60)
+    researcher.CIRCUIT_BREAKERS["tavily"] = breaker
+    fn, calls = flaky(10)
+
+    with pytest.raises(UpstreamUnavailable):
+        call_with_resilience("tavily", fn)
+    assert breaker.state == "open"
+    with pytest.raises(UpstreamUnavailable):
+        call_with_resilience("tavily", fn)
+    assert len(calls) == 3
+
+
+def test_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker("tavily", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+
+    assert breaker.state == "half_open"
+    assert breaker.allow() is True
+    with pytest.raises(UpstreamUnavailable):
+        breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow() is False
+
+
+def test_failed_probe_reopens_circuit():
+    breaker = CircuitBreaker("tavily", failure_threshold=5, reset_timeout=0.0)
+    for _ in range(5):
+        breaker.record_failure()
+    breaker.allow()
+    breaker.reset_timeout = 60
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+
+
+def test_unrecorded_probe_is_released():
+    breaker = CircuitBreaker("tavily", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    researcher.CIRCUIT_BREAKERS["tavily"] = breaker
+
+    # 마감 초과로 시도 전에 끝나도 다음 호출이 다시 시험할 수 있어야 함
+    with pytest.raises(UpstreamUnavailable):
+        call_with_resilience("tavily", lambda timeout: "ok", deadline_at=time.time() - 1)
+    assert call_with_resilience("tavily", lambda timeout: "ok") == "ok"
+    assert breaker.state == "closed"
+
+
+def test_async_retries_and_cancels_losing_hedge():
+    researcher.RESILIENCE_POLICIES["tavily"] = ResiliencePolicy(timeout=2.0, retries=1, hedge_after=0.05)
+    cancelled = []
+    calls = []
+
+    async def afn(timeout):
+        calls.append(timeout)
+        if len(calls) == 1:
+            raise ConnectionError("reset")
+        if len(calls) == 2:
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        return "hedged"
+
+    assert asyncio.run(acall_with_resilience("tavily", afn)) == "hedged"
+    assert len(calls) == 3
+    assert cancelled == [True]
+
+
+def test_async_unrecorded_probe_is_released():
+    breaker = CircuitBreaker("openai", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    researcher.CIRCUIT_BREAKERS["openai"] = breaker
+
+    async def afn(timeout):
+        return "ok"
+
+    with pytest.raises(UpstreamUnavailable):
+        asyncio.run(acall_with_resilience("openai", afn, deadline_at=time.time() - 1))
+    assert asyncio.run(acall_with_resilience("openai", afn)) == "ok"
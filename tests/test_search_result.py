@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+import researcher
+from researcher import SearchResult, export_value, to_search_results
+
+
+def test_from_tavily_keeps_extra_fields_and_interns_platform():
+    raw = {"url": "https://x.com/a/status/1", "title": "t", "content": "body", "score": 0.5, "published_date": "2024-01-01"}
+    first = SearchResult.from_tavily(raw, "".join(["thre", "ads"]))
+    second = SearchResult.from_tavily(dict(raw), "".join(["th", "reads"]))
+
+    assert first.extra == {"published_date": "2024-01-01"}
+    assert first.platform is second.platform
+    assert first.to_dict() == {**raw, "platform": "threads"}
+
+
+def test_dict_style_access():
+    result = SearchResult.from_tavily({"url": "u", "content": "", "snippet": "short"})
+
+    assert result.text == "short"
+    assert result.get("score", 0) == 0
+    assert result["snippet"] == "short"
+    assert "snippet" in result and "missing" not in result
+    with pytest.raises(KeyError):
+        result["missing"]
+
+    result["quality_score"] = 0.7
+    result["rank"] = 1
+    assert result.quality_score == 0.7
+    assert result.extra["rank"] == 1
+
+
+def test_with_platform_copies_only_when_unlabelled():
+    labelled = SearchResult.from_tavily({"url": "u"}, "threads")
+    unlabelled = SearchResult.from_tavily({"url": "u"})
+
+    assert labelled.with_platform("x") is labelled
+    copy = unlabelled.with_platform("x")
+    assert copy is not unlabelled and copy.platform == "x" and unlabelled.platform is None
+
+
+def test_to_search_results_passes_records_through():
+    record = SearchResult.from_tavily({"url": "u"}, "x")
+    converted = to_search_results([record, {"url": "v"}], "threads")
+
+    assert converted[0] is record
+    assert converted[1].platform == "threads"
+
+
+def test_export_value_is_json_serializable():
+    record = SearchResult.from_tavily({"url": "u", "content": "c"}, "x")
+    exported = export_value({"search_results": {"x": [record]}, "pair": (record, 1)})
+
+    assert exported == {"search_results": {"x": [record.to_dict()]}, "pair": [record.to_dict(), 1]}
+    json.dumps(exported)
+
+
+def test_merge_search_results_does_not_mutate_previous_state():
+    existing = {"x": [1], "threads": [2]}
+    merged = researcher._merge_search_results(existing, {"x": [3], "threads": []})
+
+    assert merged == {"x": [1, 3], "threads": [2]}
+    assert existing == {"x": [1], "threads": [2]}
+    assert merged["threads"] is existing["threads"]
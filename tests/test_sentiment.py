@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+import researcher
+from researcher import SentimentLexicon, sentiment_distribution
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    return SentimentLexicon()
+
+
+@pytest.mark.parametrize("text, sign", [
+    ("This is a great product, I love it!", 1),
+    ("Worst update ever. Totally useless.", -1),
+    ("The meeting is on Tuesday at noon.", 0),
+    ("이 앱 정말 좋아요 강추합니다", 1),
+    ("배송이 너무 느리고 최악이에요", -1),
+    ("This is not good", -1),
+    ("This isn't bad at all", 1),
+    ("이 제품은 좋지 않아요", -1),
+    ("별로 안 좋아요", -1),
+])
+def test_polarity_sign(lexicon, text, sign):
+    polarity = lexicon.polarity(text)
+
+    assert (polarity > 0) - (polarity < 0) == sign
+
+
+ENGLISH_SAMPLES = [
+    "The new dashboard is okay.",
+    "Setup was fine and support replied quickly.",
+    "Pretty decent results for a free plan.",
+    "Such a nice community of founders.",
+    "Honestly a pleasant surprise.",
+    "This tool is super handy for creators.",
+    "What a gorgeous landing page.",
+    "The onboarding flow is smooth and elegant.",
+    "I'm pleased with the launch numbers.",
+    "Great product, I love it!",
+    "This is not bad at all.",
+    "The pricing page is weak and bland.",
+    "Support was lousy and the docs are complicated.",
+    "I'm tired of these pathetic spam bots.",
+    "The update is buggy and slow.",
+    "This is not good.",
+    "A miserable, dreadful experience.",
+    "I feel sick of the weird algorithm changes.",
+    "Our webinar is on Tuesday at noon.",
+    "Posted the slides from the meetup.",
+]
+
+
+def test_english_polarity_sign_matches_textblob(lexicon):
+    # 기존 구현: TextBlob(pattern) 문서별 감정 극성
+    from textblob import TextBlob
+
+    def sign(value):
+        return (value > 0) - (value < 0)
+
+    mismatches = [
+        text for text in ENGLISH_SAMPLES
+        if sign(lexicon.polarity(text)) != sign(TextBlob(text).sentiment.polarity)
+    ]
+
+    assert mismatches == []
+
+
+def test_polarity_is_the_mean_of_sentiment_words(lexicon):
+    assert lexicon.polarity("good bad") == pytest.approx((0.7 - 0.7) / 2)
+    assert lexicon.polarity("Great!!! awesome.") == pytest.approx((0.8 + 1.0) / 2)
+    assert lexicon.polarity("not great") == pytest.approx(0.8 * -0.5)
+
+
+def test_batch_scores_match_single_document_scores(lexicon):
+    texts = ["great product", "", "terrible\x00support", "좋아요 최고", "neutral words only", "not bad"] * 3
+
+    batch = lexicon.score_batch(texts)
+
+    assert batch.tolist() == pytest.approx([lexicon.polarity(text) for text in texts])
+    assert len(batch) == len(texts)
+
+
+def test_batches_larger_than_the_chunk_size(lexicon, monkeypatch):
+    monkeypatch.setattr(SentimentLexicon, "_BATCH_SIZE", 4)
+    texts = [f"great {i}" if i % 2 else f"awful {i}" for i in range(10)]
+
+    assert lexicon.score_batch(texts).tolist() == pytest.approx([0.8 if i % 2 else -1.0 for i in range(10)])
+
+
+def test_custom_lexicon_file_extends_defaults(tmp_path):
+    path = tmp_path / "lexicon.json"
+    path.write_text(json.dumps({"en": {"mid": -0.9}, "ko": {"꿀잼": 0.9}}), encoding="utf-8")
+    lexicon = SentimentLexicon(researcher.load_sentiment_lexicon(str(path)))
+
+    assert lexicon.polarity("this is mid") == pytest.approx(-0.9)
+    assert lexicon.polarity("완전 꿀잼이네") == pytest.approx(0.9)
+    assert lexicon.polarity("great") == pytest.approx(0.8)
+
+
+def test_sentiment_distribution_counts_documents():
+    assert sentiment_distribution(["I love this", "I hate this", "It is Tuesday", "좋아요"]) == {
+        "positive": 2, "neutral": 1, "negative": 1,
+    }
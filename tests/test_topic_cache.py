@@ -0,0 +1,169 @@
+import pytest
+
+import researcher
+from researcher import TopicIndex, _topic_cache_scope, _topic_reuse_mode, run_cached_research
+
+from conftest import StubOpenAI, StubTavily
+
+
+def tokens(topic):
+    return frozenset(researcher._topic_tokens(researcher._topic_key(topic)))
+
+
+def test_reuse_mode_depends_on_the_token_difference():
+    assert _topic_reuse_mode(tokens("AI 마케팅"), tokens("ai marketing")) == "result"
+    assert _topic_reuse_mode(tokens("AI marketing tips"), tokens("AI marketing")) == "seed"
+    assert _topic_reuse_mode(tokens("AI marketing 2025"), tokens("AI marketing 2024")) is None
+    assert _topic_reuse_mode(tokens("AI advertising"), tokens("AI marketing")) is None
+
+
+def test_match_modes_and_thresholds():
+    index = TopicIndex()
+    index.add("AI marketing", {"value": 1})
+
+    exact = index.match("ai  Marketing")
+    assert exact["mode"] == "result" and exact["similarity"] == 1.0 and exact["topic"] == "AI marketing"
+    assert index.match("AI marketing tips")["mode"] == "seed"
+    assert index.match("AI 마케팅")["mode"] == "seed"
+    assert index.match("AI 마케팅", return_threshold=0.7)["mode"] == "result"
+    assert index.match("AI marketing tips", seed_threshold=0.95) is None
+    assert index.match("AI advertising") is None
+
+
+def test_topics_differing_by_a_number_are_not_reused():
+    index = TopicIndex()
+    index.add("AI marketing 2024", {"year": 2024})
+
+    assert index.match("AI marketing 2025") is None
+    assert index.match("AI marketing 2024 tips")["result"] == {"year": 2024}
+
+
+def test_results_are_returned_as_fresh_copies():
+    index = TopicIndex()
+    index.add("AI marketing", {"items": [1]})
+    index.match("AI marketing")["result"]["items"].append(2)
+
+    assert index.match("AI marketing")["result"] == {"items": [1]}
+
+
+def test_entries_are_isolated_by_scope():
+    index = TopicIndex()
+    index.add("AI marketing", {"scope": 1}, scope=1)
+    index.add("AI marketing", {"scope": 2}, scope=2)
+
+    assert index.match("AI marketing", scope=1)["result"] == {"scope": 1}
+    assert index.match("AI marketing", scope=2)["result"] == {"scope": 2}
+    assert index.match("AI marketing") is None
+    assert len(index) == 2
+
+
+def test_expired_entries_are_not_matched():
+    index = TopicIndex(ttl=60)
+    index.add("AI marketing", {})
+    index._stored_at[0] -= 120
+
+    assert index.match("AI marketing") is None
+
+
+def test_oldest_entry_is_evicted_at_max_entries():
+    index = TopicIndex(max_entries=2)
+    for topic in ("AI marketing", "no-code tools", "creator economy"):
+        index.add(topic, {"topic": topic})
+
+    assert len(index) == 2
+    assert index.match("AI marketing") is None
+    assert index.match("creator economy")["result"] == {"topic": "creator economy"}
+
+
+def test_byte_budget_evicts_and_rejects_oversized_results():
+    probe = TopicIndex()
+    probe.add("probe", {"body": "x" * 50})
+    index = TopicIndex(max_bytes=probe.stored_bytes * 2)
+    index.add("AI marketing", {"body": "x" * 50})
+    index.add("no-code tools", {"body": "y" * 50})
+    index.add("creator economy", {"body": "z" * 50})
+
+    assert len(index) == 2 and index.stored_bytes <= index.max_bytes
+    assert index.match("AI marketing") is None
+    index.add("huge", {"body": "".join(chr(0x4E00 + (i * 7919) % 20000) for i in range(5000))})
+    assert index.match("huge") is None and len(index) == 2
+
+
+def test_readding_a_topic_replaces_its_entry():
+    index = TopicIndex()
+    index.add("AI marketing", {"run": 1})
+    index.add("ai marketing", {"run": 2})
+
+    assert len(index) == 1
+    assert index.match("AI marketing")["result"] == {"run": 2}
+
+
+def test_scope_ignores_per_run_configurable_values():
+    components = object()
+    base = {"configurable": {"components": components, "search_depth": "basic"}}
+    per_run = {"configurable": {
+        **base["configurable"], "thread_id": "t1", "deadline_seconds": 3, "deadline_at": 1.0, "__pregel_task": "x",
+    }}
+
+    assert _topic_cache_scope(base) == _topic_cache_scope(per_run)
+    assert _topic_cache_scope(base) != _topic_cache_scope({"configurable": {"components": object(), "search_depth": "basic"}})
+    assert _topic_cache_scope(base) != _topic_cache_scope({"configurable": {"components": components, "search_depth": "advanced"}})
+    assert _topic_cache_scope(None) == _topic_cache_scope({})
+
+
+@pytest.fixture
+def cached_run(make_components):
+    openai_client, tavily_client = StubOpenAI(), StubTavily()
+    config = {"configurable": {"components": make_components(openai_client, tavily_client)}}
+    index = TopicIndex()
+
+    def run(topic):
+        return run_cached_research(topic, config=config, topic_index=index)
+    return run, openai_client, tavily_client, index
+
+
+def test_cached_research_returns_the_stored_result(cached_run):
+    run, openai_client, tavily_client, index = cached_run
+    first = run("AI marketing")
+    calls = (openai_client.calls, tavily_client.calls)
+    second = run("ai  marketing")
+
+    assert len(index) == 1
+    assert (openai_client.calls, tavily_client.calls) == calls
+    assert second["topic"] == "ai  marketing"
+    assert second["keyword_strategy"]["topic_cache"] == {"matched_topic": "AI marketing", "similarity": 1.0, "mode": "result"}
+    assert second["filtered_results"] == first["filtered_results"]
+
+
+def test_similar_topic_is_seeded_with_previous_keywords(cached_run):
+    run, openai_client, _, index = cached_run
+    first = run("AI marketing")
+    calls = openai_client.calls
+    seeded = run("AI marketing tips")
+
+    assert openai_client.calls == calls
+    assert seeded["keyword_strategy"]["topic_cache"]["mode"] == "seed"
+    assert seeded["main_keyword"] == first["main_keyword"]
+    assert seeded["topic"] == "AI marketing tips"
+    assert len(index) == 2
+
+
+def test_seeded_run_ranks_only_fresh_search_results(cached_run):
+    run, _, tavily_client, _ = cached_run
+    first = run("AI marketing")
+    calls = tavily_client.calls
+    seeded = run("AI marketing tips")
+
+    assert tavily_client.calls == 2 * calls
+    assert all(len(seeded["search_results"][platform]) == len(first["search_results"][platform]) == 5 for platform in ("threads", "x"))
+    assert all(len(seeded["filtered_results"][platform]) == 5 for platform in ("threads", "x"))
+
+
+def test_unrelated_topic_runs_the_graph(cached_run):
+    run, openai_client, _, _ = cached_run
+    run("AI marketing")
+    calls = openai_client.calls
+    result = run("AI marketing 2025")
+
+    assert openai_client.calls > calls
+    assert "topic_cache" not in result["keyword_strategy"]